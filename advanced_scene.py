@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.mobjects import polyline
+
 class AdvancedAffineCurves(Scene):
     def construct(self):
         # Set up the coordinate system
@@ -32,11 +34,7 @@ class AdvancedAffineCurves(Scene):
         t = np.linspace(0, 2*np.pi, 100)
         x_ellipse = 2 * np.cos(t)
         y_ellipse = np.sin(t)
-        ellipse_points = [axes.c2p(x, y) for x, y in zip(x_ellipse, y_ellipse)]
-        ellipse = VMobject()
-        ellipse.set_points_as_corners(ellipse_points)
-        ellipse.set_color(GREEN)
-        ellipse.set_stroke(width=3)
+        ellipse = polyline(axes, np.column_stack([x_ellipse, y_ellipse]), color=GREEN, stroke_width=3)
         ellipse_label = MathTex(r"\frac{x^2}{4} + y^2 = 1", color=GREEN).to_corner(UR)
         
         # 3. Hyperbola: x² - y² = 1
@@ -50,18 +48,8 @@ class AdvancedAffineCurves(Scene):
         y_pos = y_hyperbola_pos[valid_indices]
         y_neg = y_hyperbola_neg[valid_indices]
         
-        hyperbola_pos_points = [axes.c2p(x, y) for x, y in zip(x_valid, y_pos)]
-        hyperbola_neg_points = [axes.c2p(x, y) for x, y in zip(x_valid, y_neg)]
-        
-        hyperbola_pos = VMobject()
-        hyperbola_pos.set_points_as_corners(hyperbola_pos_points)
-        hyperbola_pos.set_color(PURPLE)
-        hyperbola_pos.set_stroke(width=3)
-        
-        hyperbola_neg = VMobject()
-        hyperbola_neg.set_points_as_corners(hyperbola_neg_points)
-        hyperbola_neg.set_color(PURPLE)
-        hyperbola_neg.set_stroke(width=3)
+        hyperbola_pos = polyline(axes, np.column_stack([x_valid, y_pos]), color=PURPLE, stroke_width=3)
+        hyperbola_neg = polyline(axes, np.column_stack([x_valid, y_neg]), color=PURPLE, stroke_width=3)
         
         hyperbola_label = MathTex(r"x^2 - y^2 = 1", color=PURPLE).to_corner(DL)
         
@@ -69,11 +57,7 @@ class AdvancedAffineCurves(Scene):
         t_circle = np.linspace(0, 2*np.pi, 100)
         x_circle = np.sqrt(2) * np.cos(t_circle)
         y_circle = np.sqrt(2) * np.sin(t_circle)
-        circle_points = [axes.c2p(x, y) for x, y in zip(x_circle, y_circle)]
-        circle = VMobject()
-        circle.set_points_as_corners(circle_points)
-        circle.set_color(ORANGE)
-        circle.set_stroke(width=3)
+        circle = polyline(axes, np.column_stack([x_circle, y_circle]), color=ORANGE, stroke_width=3)
         circle_label = MathTex(r"x^2 + y^2 = 2", color=ORANGE).to_corner(DR)
         
         # Add title
@@ -113,20 +97,17 @@ class AdvancedAffineCurves(Scene):
         
         # Animate points moving along curves
         parabola_path = axes.plot(lambda x: x**2, x_range=[-2, 2], color=YELLOW, stroke_width=2)
-        ellipse_path = VMobject()
-        ellipse_path.set_points_as_corners([axes.c2p(2*np.cos(t), np.sin(t)) for t in np.linspace(0, 2*np.pi, 50)])
-        ellipse_path.set_color(YELLOW)
-        ellipse_path.set_stroke(width=2)
-        
-        hyperbola_path = VMobject()
-        hyperbola_path.set_points_as_corners([axes.c2p(np.cosh(t), np.sinh(t)) for t in np.linspace(-1.5, 1.5, 50)])
-        hyperbola_path.set_color(YELLOW)
-        hyperbola_path.set_stroke(width=2)
-        
-        circle_path = VMobject()
-        circle_path.set_points_as_corners([axes.c2p(np.sqrt(2)*np.cos(t), np.sqrt(2)*np.sin(t)) for t in np.linspace(0, 2*np.pi, 50)])
-        circle_path.set_color(YELLOW)
-        circle_path.set_stroke(width=2)
+        t_path = np.linspace(0, 2*np.pi, 50)
+        ellipse_path = polyline(axes, np.column_stack([2*np.cos(t_path), np.sin(t_path)]), color=YELLOW, stroke_width=2)
+        
+        t_hyperbola = np.linspace(-1.5, 1.5, 50)
+        hyperbola_path = polyline(
+            axes, np.column_stack([np.cosh(t_hyperbola), np.sinh(t_hyperbola)]), color=YELLOW, stroke_width=2
+        )
+        
+        circle_path = polyline(
+            axes, np.sqrt(2) * np.column_stack([np.cos(t_path), np.sin(t_path)]), color=YELLOW, stroke_width=2
+        )
         
         # Move all points simultaneously
         self.play(
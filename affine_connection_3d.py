@@ -1,7 +1,12 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.surfaces import saddle_christoffel_symbols, saddle_surface
+
 class AffineConnection3D(ThreeDScene):
+    # Saddle with modulation: z = a(u² - v²) + b sin(ku u) cos(kv v)
+    surface_params = dict(a=0.15, b=0.08, ku=3*np.pi, kv=2*np.pi)
+
     def construct(self):
         # Set up the 3D scene
         self.set_camera_orientation(phi=75 * DEGREES, theta=45 * DEGREES)
@@ -12,12 +17,10 @@ class AffineConnection3D(ThreeDScene):
         self.play(Write(title))
         
         # Create a 3D curved manifold surface
+        surface_params = self.surface_params
+        
         def manifold_surface(u, v):
-            # Create a curved surface: saddle surface with modulation
-            x = u
-            y = v
-            z = 0.15 * (u**2 - v**2) + 0.08 * np.sin(3*np.pi*u) * np.cos(2*np.pi*v)
-            return np.array([x, y, z])
+            return saddle_surface(u, v, **surface_params)
         
         # Create the surface
         surface = Surface(
@@ -55,74 +58,20 @@ class AffineConnection3D(ThreeDScene):
         self.play(*[Create(line) for line in u_lines + v_lines])
         self.wait(1)
         
-        # Create connection coefficients function for 3D surface
-        def connection_coefficients_3d(u, v):
-            # Calculate Christoffel symbols for the 3D surface
-            # These depend on the metric and its derivatives
-            
-            # First derivatives of the surface
-            du = np.array([1, 0, 0.3*u + 0.24*np.pi*np.cos(3*np.pi*u)*np.cos(2*np.pi*v)])
-            dv = np.array([0, 1, -0.3*v - 0.16*np.pi*np.sin(3*np.pi*u)*np.sin(2*np.pi*v)])
-            
-            # Second derivatives
-            duu = np.array([0, 0, 0.3 - 0.72*np.pi**2*np.sin(3*np.pi*u)*np.cos(2*np.pi*v)])
-            duv = np.array([0, 0, -0.48*np.pi**2*np.cos(3*np.pi*u)*np.sin(2*np.pi*v)])
-            dvv = np.array([0, 0, -0.3 - 0.32*np.pi**2*np.sin(3*np.pi*u)*np.cos(2*np.pi*v)])
-            
-            # Calculate metric components
-            g_11 = np.dot(du, du)
-            g_12 = np.dot(du, dv)
-            g_22 = np.dot(dv, dv)
-            
-            # Calculate inverse metric
-            det_g = g_11 * g_22 - g_12**2
-            g_inv_11 = g_22 / det_g
-            g_inv_12 = -g_12 / det_g
-            g_inv_22 = g_11 / det_g
-            
-            # Calculate Christoffel symbols
-            # Γ^λ_μν = (1/2) g^λσ (∂_μ g_νσ + ∂_ν g_μσ - ∂_σ g_μν)
-            
-            # ∂_u g_11 = 2 du · duu
-            # ∂_v g_11 = 2 du · duv
-            # ∂_u g_12 = du · duv + dv · duu
-            # ∂_v g_12 = du · dvv + dv · duv
-            # ∂_u g_22 = 2 dv · duv
-            # ∂_v g_22 = 2 dv · dvv
-            
-            dg_11_u = 2 * np.dot(du, duu)
-            dg_11_v = 2 * np.dot(du, duv)
-            dg_12_u = np.dot(du, duv) + np.dot(dv, duu)
-            dg_12_v = np.dot(du, dvv) + np.dot(dv, duv)
-            dg_22_u = 2 * np.dot(dv, duv)
-            dg_22_v = 2 * np.dot(dv, dvv)
-            
-            # Calculate Γ^1_11, Γ^1_12, Γ^1_22, Γ^2_11, Γ^2_12, Γ^2_22
-            gamma_111 = 0.5 * (g_inv_11 * dg_11_u + g_inv_12 * (2*dg_12_u - dg_11_v))
-            gamma_112 = 0.5 * (g_inv_11 * dg_12_v + g_inv_12 * dg_22_u)
-            gamma_122 = 0.5 * (g_inv_11 * dg_22_v + g_inv_12 * (2*dg_12_v - dg_22_u))
-            gamma_211 = 0.5 * (g_inv_12 * dg_11_u + g_inv_22 * (2*dg_12_u - dg_11_v))
-            gamma_212 = 0.5 * (g_inv_12 * dg_12_v + g_inv_22 * dg_22_u)
-            gamma_222 = 0.5 * (g_inv_12 * dg_22_v + g_inv_22 * (2*dg_12_v - dg_22_u))
-            
-            return {
-                '111': gamma_111, '112': gamma_112, '122': gamma_122,
-                '211': gamma_211, '212': gamma_212, '222': gamma_222
-            }
-        
         # Show connection coefficients at different points
         connection_points = [(-2, -2), (0, 0), (2, 2)]
         connection_displays = VGroup()
         
         for point in connection_points:
             u, v = point
-            gamma = connection_coefficients_3d(u, v)
+            # Christoffel symbols Γ^λ_μν of the induced metric, indexed [λ, μ, ν]
+            gamma = saddle_christoffel_symbols(u, v, **surface_params)
             
             # Create connection display
             connection_text = MathTex(
-                f"\\Gamma^1_{{11}} = {gamma['111']:.2f}",
-                f"\\Gamma^1_{{12}} = {gamma['112']:.2f}",
-                f"\\Gamma^2_{{22}} = {gamma['222']:.2f}",
+                f"\\Gamma^1_{{11}} = {gamma[0, 0, 0]:.2f}",
+                f"\\Gamma^1_{{12}} = {gamma[0, 0, 1]:.2f}",
+                f"\\Gamma^2_{{22}} = {gamma[1, 1, 1]:.2f}",
                 font_size=10,
                 color=YELLOW
             ).arrange(DOWN, buff=0.1)
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.connections import example_connection_coefficients
+from mathvisualizations.mobjects import coordinate_grid
+
 class AffineConnectionVisualization(Scene):
     def construct(self):
         # Set up the scene
@@ -37,49 +40,16 @@ class AffineConnectionVisualization(Scene):
         self.wait(1)
         
         # Create coordinate grid
-        coord_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            coord_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            coord_grid.add(line)
+        coord_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Show coordinate grid
         self.play(Create(coord_grid))
         self.wait(1)
         
         # Create connection coefficients function
-        def connection_coefficients(x, y):
-            # Example connection coefficients (Christoffel symbols)
-            # These determine how vectors change under parallel transport
-            gamma_111 = 0.1 * x  # Γ¹₁₁
-            gamma_112 = 0.05 * y # Γ¹₁₂
-            gamma_121 = 0.05 * y # Γ¹₂₁
-            gamma_122 = -0.1 * x # Γ¹₂₂
-            gamma_211 = -0.05 * y # Γ²₁₁
-            gamma_212 = 0.1 * x  # Γ²₁₂
-            gamma_221 = 0.1 * x  # Γ²₂₁
-            gamma_222 = 0.1 * y  # Γ²₂₂
-            
-            return {
-                '111': gamma_111, '112': gamma_112, '121': gamma_121, '122': gamma_122,
-                '211': gamma_211, '212': gamma_212, '221': gamma_221, '222': gamma_222
-            }
+        # Example connection coefficients (Christoffel symbols)
+        # These determine how vectors change under parallel transport
+        connection_coefficients = example_connection_coefficients
         
         # Show connection coefficients at different points
         connection_points = [(-1.5, -1.5), (0, 0), (1.5, 1.5)]
@@ -91,9 +61,9 @@ class AffineConnectionVisualization(Scene):
             
             # Create connection display
             connection_text = MathTex(
-                f"\\Gamma^1_{{11}} = {gamma['111']:.2f}",
-                f"\\Gamma^1_{{12}} = {gamma['112']:.2f}",
-                f"\\Gamma^2_{{21}} = {gamma['221']:.2f}",
+                f"\\Gamma^1_{{11}} = {gamma[0, 0, 0]:.2f}",
+                f"\\Gamma^1_{{12}} = {gamma[0, 0, 1]:.2f}",
+                f"\\Gamma^2_{{21}} = {gamma[1, 1, 0]:.2f}",
                 font_size=10,
                 color=YELLOW
             ).arrange(DOWN, buff=0.1)
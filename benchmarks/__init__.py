@@ -0,0 +1,8 @@
+"""Benchmarks for the numeric kernels, scene construction and full renders.
+
+Run from the repository root::
+
+    python -m benchmarks                      # every group
+    python -m benchmarks -g kernels           # NumPy only, no Manim needed
+    python -m benchmarks --save --check       # nightly: record and fail on regressions
+"""
@@ -0,0 +1,40 @@
+import argparse
+import importlib
+import sys
+
+from .harness import BENCHMARKS, HISTORY_FILE, find_regressions, load_history, run_benchmarks, save_run
+
+GROUPS = ("kernels", "scenes", "renders")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the benchmark suite.")
+    parser.add_argument("-g", "--group", choices=GROUPS, action="append", help="groups to run (default: all)")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON lines file of previous runs")
+    parser.add_argument("--save", action="store_true", help="append this run to the history")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 on a regression")
+    args = parser.parse_args(argv)
+
+    for group in args.group or GROUPS:
+        try:
+            importlib.import_module(f"{__package__}.{group}")
+        except ImportError as error:
+            # Scene and render benchmarks need Manim; the kernels do not
+            print(f"Skipping {group}: {error}", file=sys.stderr)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    history = load_history(args.history)
+    results = run_benchmarks(names)
+
+    regressions = find_regressions(results, history)
+    for name, seconds, baseline, ratio in regressions:
+        print(f"REGRESSION {name}: {seconds:.4g}s vs baseline {baseline:.4g}s ({ratio:.2f}x)")
+    if args.save:
+        save_run(results, args.history)
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Timing, JSON history and regression checks shared by the benchmark groups."""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HISTORY_FILE = Path(__file__).resolve().parent / "history.jsonl"
+
+# A benchmark regresses when its fastest repeat is this much slower than the
+# median of its fastest repeats over the last BASELINE_RUNS saved runs.  The
+# fastest repeat is the least disturbed by other load on the machine.
+DEFAULT_THRESHOLDS = {"kernels": 1.25, "scenes": 1.3, "renders": 1.3}
+BASELINE_RUNS = 5
+
+BENCHMARKS = {}
+
+
+def benchmark(group, repeat=5, min_time=0.05, threshold=None, name=None):
+    """Register a benchmark, named after the decorated function by default.
+
+    The decorated function does the setup and returns the zero-argument
+    callable that is timed.  Fast callables are looped until one repeat
+    takes at least ``min_time`` seconds; times are reported per call.
+    """
+    def register(setup):
+        BENCHMARKS[f"{group}.{name or setup.__name__}"] = {
+            "group": group,
+            "setup": setup,
+            "repeat": repeat,
+            "min_time": min_time,
+            "threshold": threshold or DEFAULT_THRESHOLDS[group],
+        }
+        return setup
+    return register
+
+
+def _calibrate(function, min_time):
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            return number
+        number *= 10 if elapsed < min_time / 10 else 2
+
+
+def time_function(function, repeat=5, min_time=0.05):
+    number = _calibrate(function, min_time) if min_time else 1
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run_benchmarks(names):
+    results = {}
+    for name in names:
+        spec = BENCHMARKS[name]
+        function = spec["setup"]()
+        results[name] = time_function(function, spec["repeat"], spec["min_time"])
+        print(f"{name:<55} {_format_seconds(results[name]['median'])}", flush=True)
+    return results
+
+
+def load_history(path=HISTORY_FILE):
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_run(results, path=HISTORY_FILE):
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "results": results,
+    }
+    with open(path, "a") as f:
+        f.write(json.dumps(run) + "\n")
+    return run
+
+
+def find_regressions(results, history, baseline_runs=BASELINE_RUNS):
+    """Benchmarks slower than their baseline by more than their threshold.
+
+    Returns ``(name, seconds, baseline, ratio)`` tuples; benchmarks without
+    history are skipped.
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = [run["results"][name]["min"] for run in history if name in run["results"]]
+        if not previous:
+            continue
+        baseline = statistics.median(previous[-baseline_runs:])
+        ratio = result["min"] / baseline
+        if ratio > BENCHMARKS[name]["threshold"]:
+            regressions.append((name, result["min"], baseline, ratio))
+    return regressions
+
+
+def _format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def _git_commit():
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
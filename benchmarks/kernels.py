@@ -0,0 +1,163 @@
+"""Micro-benchmarks of the NumPy kernels behind the scenes."""
+
+import subprocess
+import sys
+
+import numpy as np
+
+from mathvisualizations.atlas import random_sphere_points, sphere_cap_atlas
+from mathvisualizations.convergence import convergence_profile
+from mathvisualizations.divergences import divergence_matrix
+from mathvisualizations.exponential_families import normal_family, normal_natural
+from mathvisualizations.fisher import fisher_metric_normal, path_length
+from mathvisualizations.fisher_statistics import fisher_exp, geodesic_kmeans
+from mathvisualizations.hyperbolic import tessellation, tile_boundaries
+from mathvisualizations.metrics import polynomial_metric, straight_path
+from mathvisualizations.mixtures import fit_mixtures, sample_mixtures
+from mathvisualizations.optimization import gradient_descent, loss_contour_points, natural_gradient_descent
+from mathvisualizations.sequences import wobbling_circle_sets
+from mathvisualizations.set_distances import point_sets, set_distances
+from mathvisualizations.spd import frechet_mean, random_spd
+from mathvisualizations.surfaces import saddle_christoffel_symbols, saddle_metric
+
+from .harness import REPO_ROOT, benchmark
+
+# Grid sizes of the kind the 3D scenes sample their surfaces at
+GRID = np.meshgrid(np.linspace(-2, 2, 200), np.linspace(-2, 2, 200), indexing="ij")
+SIGMA_GRID = np.meshgrid(np.linspace(-2, 2, 200), np.linspace(0.1, 2, 200), indexing="ij")
+
+
+@benchmark("kernels")
+def fisher_metric_grid():
+    mu, sigma = SIGMA_GRID
+    return lambda: fisher_metric_normal(mu, sigma)
+
+
+@benchmark("kernels")
+def polynomial_metric_grid():
+    x, y = GRID
+    return lambda: polynomial_metric(x, y)
+
+
+@benchmark("kernels")
+def saddle_metric_grid():
+    u, v = GRID
+    return lambda: saddle_metric(u, v)
+
+
+@benchmark("kernels")
+def saddle_christoffel_grid():
+    u, v = GRID
+    return lambda: saddle_christoffel_symbols(u, v)
+
+
+@benchmark("kernels")
+def fisher_path_length():
+    # The distance computed in the Fisher metric scenes, at 1000 steps
+    points = straight_path(np.array([-1.0, 0.4]), np.array([1.0, 0.8]), np.linspace(0, 1, 1000))
+    return lambda: path_length(points)
+
+
+@benchmark("kernels")
+def loss_contours():
+    # Every contour level drawn by MLInformationGeometry
+    levels = np.linspace(0.5, 3.5, 6)
+    return lambda: [loss_contour_points(level) for level in levels]
+
+
+@benchmark("kernels")
+def gradient_descent_paths():
+    return lambda: (
+        gradient_descent([-1.5, -1.5], learning_rate=0.1, steps=20),
+        natural_gradient_descent([-1.5, -1.5], learning_rate=0.1, steps=20),
+    )
+
+
+@benchmark("kernels", repeat=3)
+def atlas_metric_consistency():
+    # Metric check of the 24-cap sphere atlas on 100000 points
+    atlas, points = sphere_cap_atlas(), random_sphere_points(100_000)
+    return lambda: atlas.metric_consistency(points)
+
+
+@benchmark("kernels", repeat=3)
+def cauchy_moduli():
+    # N(ε) for 50 tolerances of a million random-walk iterates with shrinking steps
+    rng = np.random.default_rng(0)
+    steps = rng.standard_normal((1_000_000, 2)) / np.arange(1, 1_000_001)[:, None]**1.5
+    iterates = np.cumsum(steps, axis=0)
+    return lambda: convergence_profile(iterates, len(iterates), np.logspace(-1, -6, 50))
+
+
+@benchmark("kernels", repeat=3)
+def set_hausdorff():
+    # Hausdorff distances of ten 100000-point curves to the limit circle, trees built once
+    sets = point_sets(wobbling_circle_sets(np.arange(0, 40, 4), 100_000))
+    limit = point_sets(wobbling_circle_sets(np.zeros(1), 100_000, amplitude=0))[0]
+    return lambda: set_distances(sets, limit)
+
+
+@benchmark("kernels", repeat=3)
+def divergence_matrices():
+    # Pairwise Fisher-Rao distances and beta KL divergences of 4000 distributions
+    rng = np.random.default_rng(0)
+    params = np.column_stack([rng.uniform(0.5, 3, 4000), rng.uniform(0.5, 3, 4000)])
+    return lambda: (divergence_matrix("fisher_rao", "normal", params), divergence_matrix("kl", "beta", params))
+
+
+@benchmark("kernels", repeat=3)
+def expectation_to_natural():
+    # Newton inverse of μ = ∇ψ(η) for 100000 normal distributions from a cold start
+    rng = np.random.default_rng(0)
+    mu = normal_family.expectation(normal_natural(rng.uniform(-3, 3, 100_000), rng.uniform(0.05, 4, 100_000)))
+    return lambda: normal_family.natural(mu)
+
+
+@benchmark("kernels", repeat=3)
+def mixture_em():
+    # EM fits of two-component mixtures to 5000 datasets of 200 samples
+    rng = np.random.default_rng(0)
+    weights = np.column_stack([np.full(5000, 0.3), np.full(5000, 0.7)])
+    means = np.column_stack([rng.uniform(-3, -1, 5000), rng.uniform(1, 3, 5000)])
+    data = sample_mixtures(weights, means, rng.uniform(0.3, 1, (5000, 2)), 200)
+    return lambda: fit_mixtures(data)
+
+
+@benchmark("kernels", repeat=3)
+def fisher_kmeans():
+    # Geodesic k-means of 100000 normal distributions into 8 clusters
+    rng = np.random.default_rng(0)
+    centers = np.column_stack([rng.uniform(-2, 2, 8), rng.uniform(0.3, 1.5, 8)])
+    members = rng.integers(8, size=100_000)
+    params = fisher_exp(centers[members], 0.2 * centers[members, 1:] * rng.standard_normal((100_000, 2)))
+    return lambda: geodesic_kmeans(params, 8)
+
+
+@benchmark("kernels", repeat=3)
+def spd_frechet_means():
+    # Fréchet means of 1000 groups of 100 random 3×3 covariance matrices
+    matrices = random_spd(100_000, d=3).reshape(1000, 100, 3, 3)
+    return lambda: frechet_mean(matrices)
+
+
+@benchmark("kernels", repeat=3)
+def hyperbolic_tiling():
+    # The {7, 3} tiling of NonEuclidean2D down to tiles 0.03% of the disk across, about 24000 tiles
+    def run():
+        tiles = tessellation(7, 3, min_size=3e-4)
+        return tile_boundaries(tiles, 7, 3, num=8)
+    return run
+
+
+@benchmark("kernels", repeat=3, min_time=0)
+def import_math_modules():
+    # Scenes, workers and notebooks pay this on startup; it must stay free of Manim
+    code = (
+        "import mathvisualizations.fisher, mathvisualizations.surfaces, mathvisualizations.metrics, "
+        "mathvisualizations.charts, mathvisualizations.connections, mathvisualizations.optimization, "
+        "mathvisualizations.sequences, mathvisualizations.hyperbolic, mathvisualizations.atlas, "
+        "mathvisualizations.exponential_families, mathvisualizations.divergences, mathvisualizations.mixtures, "
+        "mathvisualizations.spd, mathvisualizations.fisher_statistics, mathvisualizations.convergence, "
+        "mathvisualizations.set_distances, sys; assert 'manim' not in sys.modules"
+    )
+    return lambda: subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
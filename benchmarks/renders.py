@@ -0,0 +1,73 @@
+"""End-to-end ``manim -ql`` renders of a representative subset of scenes."""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .harness import REPO_ROOT, benchmark
+
+# A 2D scene, a 3D surface and the scene with the most play() calls
+RENDERS = [
+    ("simple_scene.py", "SimpleAffineCurves"),
+    ("torus_manifold.py", "TorusManifold"),
+    ("fisher_information_manifold.py", "FisherInformationManifold"),
+]
+
+
+# Every output directory under the temporary media_dir, overriding the
+# literal ./media paths of the repository's manim.cfg, and no preview window
+BENCHMARK_CONFIG = """[CLI]
+media_dir = {media_dir}
+video_dir = {{media_dir}}/videos/{{module_name}}/{{quality}}
+images_dir = {{media_dir}}/images/{{module_name}}
+tex_dir = {{media_dir}}/Tex
+text_dir = {{media_dir}}/texts
+partial_movie_dir = {{video_dir}}/partial_movie_files/{{scene_name}}
+preview = False
+disable_caching = True
+"""
+
+
+def _media_snapshot():
+    # Modification times of everything under the repository's media directory
+    media = REPO_ROOT / "media"
+    return {path: path.stat().st_mtime_ns for path in media.rglob("*") if path.is_file()} if media.is_dir() else {}
+
+
+def render(file_name, scene_name):
+    # A fresh media directory, LaTeX cache included, and no partial movie
+    # cache, so every run renders and compiles everything
+    media_dir = Path(tempfile.mkdtemp(prefix="bench-media-"))
+    config_file = media_dir / "benchmark.cfg"
+    config_file.write_text(BENCHMARK_CONFIG.format(media_dir=media_dir.as_posix()))
+    before = _media_snapshot()
+    try:
+        subprocess.run(
+            [
+                sys.executable, "-m", "manim", "render", "-ql", "--disable_caching",
+                "--config_file", str(config_file), file_name, scene_name,
+            ],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+        )
+    finally:
+        # Only cleaned up once the render is known to have stayed in media_dir
+        leaked = _media_snapshot() != before
+        if not leaked:
+            shutil.rmtree(media_dir, ignore_errors=True)
+    if leaked:
+        raise RuntimeError(f"rendering {scene_name} wrote to {REPO_ROOT / 'media'}; its media_dir {media_dir} is kept")
+
+
+def _register(file_name, scene_name):
+    def setup():
+        return lambda: render(file_name, scene_name)
+
+    benchmark("renders", repeat=1, min_time=0, name=scene_name)(setup)
+
+
+for file_name, scene_name in RENDERS:
+    _register(file_name, scene_name)
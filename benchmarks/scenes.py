@@ -0,0 +1,64 @@
+"""Building each scene's mobject graph, without rasterizing or encoding."""
+
+from manim import tempconfig
+
+from mathvisualizations.render.loader import load_scene
+
+from .harness import REPO_ROOT, benchmark
+
+SCENES = [
+    ("simple_scene.py", "SimpleAffineCurves"),
+    ("scene.py", "AffineCurves"),
+    ("advanced_scene.py", "AdvancedAffineCurves"),
+    ("coordinate_system_2d.py", "CoordinateSystem2D"),
+    ("affine_connection_visualization.py", "AffineConnectionVisualization"),
+    ("affine_connection_3d.py", "AffineConnection3D"),
+    ("cauchy_sequences_topology.py", "CauchySequencesTopology"),
+    ("fisher_clustering.py", "FisherKMeansClustering"),
+    ("fisher_information_manifold.py", "FisherInformationManifold"),
+    ("fisher_matrix_values.py", "FisherMatrixValues"),
+    ("fisher_metric_detailed.py", "FisherMetricDetailed"),
+    ("fisher_metric_visualization.py", "FisherMetricVisualization"),
+    ("information_geometry.py", "InformationGeometry"),
+    ("manifold_charts_atlas.py", "ManifoldChartsAtlas"),
+    ("manifold_projection.py", "ManifoldProjection"),
+    ("manifold_scene.py", "NonEuclideanManifold"),
+    ("metric_projection.py", "MetricProjection"),
+    ("metric_tensor_3d.py", "MetricTensor3D"),
+    ("metric_tensor_visualization.py", "MetricTensorVisualization"),
+    ("ml_information_geometry.py", "MLInformationGeometry"),
+    ("non_euclidean_2d.py", "NonEuclidean2D"),
+    ("normal_distribution_manifold.py", "NormalDistributionManifold"),
+    ("parametric_space_visualization.py", "ParametricSpaceVisualization"),
+    ("statistical_manifold_charts_atlas.py", "StatisticalManifoldChartsAtlas"),
+    ("spd_cone_manifold.py", "SPDConeManifold"),
+    ("statistical_manifolds.py", "StatisticalManifolds"),
+    ("torus_manifold.py", "TorusManifold"),
+]
+
+# Every animation jumps to its end state and no frame is drawn or written
+BUILD_OPTIONS = {
+    "quality": "low_quality",
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "disable_caching": True,
+}
+
+
+def build_scene(scene_class):
+    with tempconfig(BUILD_OPTIONS):
+        scene = scene_class(skip_animations=True)
+        scene.render()
+    return scene
+
+
+def _register(file_name, scene_name):
+    def setup():
+        scene_class = load_scene(REPO_ROOT / file_name, scene_name)
+        return lambda: build_scene(scene_class)
+
+    benchmark("scenes", repeat=3, min_time=0, name=scene_name)(setup)
+
+
+for file_name, scene_name in SCENES:
+    _register(file_name, scene_name)
@@ -1,7 +1,18 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.convergence import convergence_profile
+from mathvisualizations.mobjects import coordinate_grid, polyline
+from mathvisualizations.sequences import cauchy_sequence_point, spiral_sequence, wobbling_circle_sets
+from mathvisualizations.set_distances import point_sets, set_distances
+
 class CauchySequencesTopology(Scene):
+    # Terms whose tail diameters give the Cauchy moduli N(ε)
+    num_terms = 10**6
+    num_sets = 40
+    # Sample points of each set when measuring its distance to the limit circle
+    set_samples = 10**4
+
     def construct(self):
         # Set up the scene
         title = Text("Cauchy Sequences in Non-Point Based Topology", font_size=32, color=WHITE).to_edge(UP)
@@ -37,37 +48,13 @@ class CauchySequencesTopology(Scene):
         self.wait(1)
         
         # Create coordinate grid
-        coord_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            coord_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            coord_grid.add(line)
+        coord_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Show coordinate grid
         self.play(Create(coord_grid))
         self.wait(1)
         
-        # Create Cauchy sequence in point-based space
-        def cauchy_sequence_point(n):
-            # Cauchy sequence: x_n = 1/n
-            return 1 / (n + 1)
-        
+        # Create Cauchy sequence in point-based space: x_n = 1/(n+1)
         # Show first few terms of the sequence
         sequence_points = []
         sequence_labels = []
@@ -96,11 +83,17 @@ class CauchySequencesTopology(Scene):
         self.play(FadeIn(limit_point), Write(limit_label))
         self.wait(1)
         
-        # Show Cauchy condition
+        # Show Cauchy condition, with the moduli N(ε) of the first terms
+        point_moduli = convergence_profile(cauchy_sequence_point, self.num_terms, [1e-1, 1e-2, 1e-3])["modulus"][:, 1]
         cauchy_text = VGroup(
             Text("Cauchy Condition:", font_size=16, color=WHITE),
             Text("∀ε > 0, ∃N: |x_n - x_m| < ε", font_size=14, color=YELLOW),
-            Text("for all n, m > N", font_size=14, color=YELLOW)
+            Text("for all n, m > N", font_size=14, color=YELLOW),
+            Text(
+                f"N(0.1) = {point_moduli[0]}, N(0.01) = {point_moduli[1]}, N(0.001) = {point_moduli[2]}"
+                f"  ({self.num_terms:,} terms)",
+                font_size=14, color=GREEN
+            )
         ).arrange(DOWN, buff=0.2).to_edge(DOWN)
         
         self.play(Write(cauchy_text))
@@ -144,13 +137,8 @@ class CauchySequencesTopology(Scene):
         
         # Create sequence elements as moving points
         sequence_elements = []
-        for n in range(6):
-            # Create a point that moves through the space
-            angle = n * np.pi / 3
-            radius = 1.5 * (1 - 0.1 * n)  # Decreasing radius
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            
+        # Points moving through the space on a spiral of decreasing radius
+        for n, (x, y) in enumerate(spiral_sequence(np.arange(6))):
             point = Dot(point=right_axes.c2p(x, y, 0), color=YELLOW, radius=0.06)
             sequence_elements.append(point)
             
@@ -176,17 +164,52 @@ class CauchySequencesTopology(Scene):
         self.play(Create(limit_set), Write(limit_set_label))
         self.wait(1)
         
-        # Show Cauchy condition in non-point based topology
+        # A sequence of sets A_n closing in on the boundary of the limit set
+        set_terms = wobbling_circle_sets(np.arange(self.num_sets))
+        set_curves = VGroup(*[
+            polyline(right_axes, np.concatenate([curve, curve[:1]]), color=YELLOW, stroke_width=1.5)
+            for curve in set_terms[:6]
+        ])
+        self.play(LaggedStart(*[Create(curve) for curve in set_curves], lag_ratio=0.3), run_time=2)
+        
+        # Show Cauchy condition in non-point based topology; with the
+        # Hausdorff distance the moduli are bracketed from the tail diameters
+        set_moduli = convergence_profile(set_terms, self.num_sets, [1e-1, 1e-2], "hausdorff")["modulus"]
         cauchy_nonpoint_text = VGroup(
             Text("Cauchy Condition in Non-Point Based Topology:", font_size=16, color=WHITE),
             Text("∀ε > 0, ∃N: d(x_n, x_m) < ε", font_size=14, color=YELLOW),
             Text("for all n, m > N", font_size=14, color=YELLOW),
-            Text("where d is a generalized distance", font_size=14, color=BLUE)
+            Text("where d is a generalized distance", font_size=14, color=BLUE),
+            Text(
+                f"Hausdorff distance of the sets A_n: N(0.1) in [{set_moduli[0, 0]}, {set_moduli[0, 1]}], "
+                f"N(0.01) in [{set_moduli[1, 0]}, {set_moduli[1, 1]}]",
+                font_size=14, color=GREEN
+            )
         ).arrange(DOWN, buff=0.2).to_edge(DOWN)
         
         self.play(Write(cauchy_nonpoint_text))
         self.wait(2)
         
+        # Follow A_n towards the circle; the distances come from densely
+        # sampled sets, each indexed once for both kinds of distance
+        dense_sets = point_sets(wobbling_circle_sets(np.arange(self.num_sets), self.set_samples))
+        limit_points = wobbling_circle_sets(np.zeros(1), self.set_samples, amplitude=0)[0]
+        hausdorff = set_distances(dense_sets, limit_points)
+        chamfer = set_distances(dense_sets, limit_points, "chamfer")
+        
+        def distance_readout(n):
+            return Text(
+                f"A_{n}:  d_H = {hausdorff[n]:.4f},  Chamfer = {chamfer[n]:.4f}", font_size=14, color=GREEN
+            ).to_corner(UR).shift(DOWN * 1.2)
+        
+        moving_set = set_curves[0].copy().set_stroke(GREEN, width=3)
+        readout = distance_readout(0)
+        self.play(FadeIn(moving_set), Write(readout))
+        for n in range(1, self.num_sets):
+            curve = polyline(right_axes, np.concatenate([set_terms[n], set_terms[n][:1]]), color=GREEN, stroke_width=3)
+            self.play(Transform(moving_set, curve), Transform(readout, distance_readout(n)), run_time=0.15)
+        self.wait(1)
+        
         # Show different types of convergence
         convergence_types = VGroup(
             Text("Types of Convergence in Non-Point Based Topology:", font_size=18, color=WHITE),
@@ -196,7 +219,7 @@ class CauchySequencesTopology(Scene):
             Text("• Ultra-filter convergence: x_n → U (ultra-filter)", font_size=14, color=ORANGE)
         ).arrange(DOWN, buff=0.3).to_edge(DOWN)
         
-        self.play(FadeOut(cauchy_nonpoint_text))
+        self.play(FadeOut(cauchy_nonpoint_text), FadeOut(set_curves), FadeOut(moving_set), FadeOut(readout))
         self.play(Write(convergence_types))
         self.wait(3)
         
@@ -214,13 +237,7 @@ class CauchySequencesTopology(Scene):
         moving_point.move_to(sequence_elements[0].get_center())
         
         # Create path for the moving point
-        path_points = []
-        for n in range(6):
-            angle = n * np.pi / 3
-            radius = 1.5 * (1 - 0.1 * n)
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            path_points.append(right_axes.c2p(x, y, 0))
+        path_points = [right_axes.c2p(x, y, 0) for x, y in spiral_sequence(np.arange(6))]
         
         path = VMobject()
         path.set_points_as_corners(path_points)
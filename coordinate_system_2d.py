@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.mobjects import coordinate_grid
+
 class CoordinateSystem2D(Scene):
     def construct(self):
         # Set up the scene
@@ -26,29 +28,10 @@ class CoordinateSystem2D(Scene):
         self.wait(1)
         
         # Create coordinate grid
-        grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-4, 4, 9):
-            line = Line(
-                start=axes.c2p(x, -3, 0),
-                end=axes.c2p(x, 3, 0),
-                color=BLUE,
-                stroke_width=0.5,
-                stroke_opacity=0.3
-            )
-            grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-3, 3, 7):
-            line = Line(
-                start=axes.c2p(-4, y, 0),
-                end=axes.c2p(4, y, 0),
-                color=BLUE,
-                stroke_width=0.5,
-                stroke_opacity=0.3
-            )
-            grid.add(line)
+        grid = coordinate_grid(
+            axes, np.linspace(-4, 4, 9), np.linspace(-3, 3, 7),
+            x_color=BLUE, y_color=BLUE, stroke_width=0.5, stroke_opacity=0.3,
+        )
         
         # Show coordinate grid
         self.play(Create(grid))
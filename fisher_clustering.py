@@ -0,0 +1,93 @@
+from manim import *
+import numpy as np
+
+from mathvisualizations.fisher_statistics import fisher_distance_matrix, fisher_exp, geodesic_kmeans, tangent_pca
+from mathvisualizations.mobjects import DotCloud, coords_to_points, dot_clouds, polyline
+
+class FisherKMeansClustering(Scene):
+    # Normal distributions drawn around three centers, and where k-means starts
+    num_distributions = 1500
+    true_centers = ((-1.5, 0.4), (0.2, 1.2), (1.6, 0.5))
+    start_centers = ((-0.4, 1.8), (0.0, 1.9), (0.4, 1.8))
+    cluster_colors = (RED, GREEN, BLUE)
+
+    def construct(self):
+        # Title
+        title = Text("Geodesic k-Means on the Fisher Manifold", font_size=32, color=WHITE).to_edge(UP)
+        subtitle = Text("Clustering normal distributions N(μ, σ²) by Fisher-Rao distance", font_size=20, color=BLUE)
+        subtitle.next_to(title, DOWN)
+        self.play(Write(title), Write(subtitle))
+        
+        axes = Axes(
+            x_range=[-3, 3, 1],
+            y_range=[0, 2.2, 0.5],
+            x_length=9,
+            y_length=5,
+            axis_config={"color": GRAY}
+        ).shift(DOWN * 0.5)
+        axes_labels = axes.get_axis_labels(MathTex(r"\mu"), MathTex(r"\sigma"))
+        self.play(Create(axes), Write(axes_labels))
+        
+        # Distributions scattered around each center along random geodesics
+        rng = np.random.default_rng(0)
+        centers = np.array(self.true_centers)
+        members = rng.integers(len(centers), size=self.num_distributions)
+        spread = 0.3 * centers[members, 1:] * np.array([1.0, 0.6])
+        params = fisher_exp(centers[members], spread * rng.standard_normal((self.num_distributions, 2)))
+        points = coords_to_points(axes, params)
+        cloud = DotCloud(points, color=GRAY, radius=0.025)
+        self.play(FadeIn(cloud))
+        self.wait(1)
+        
+        # Run k-means once; the history holds the centroids after every iteration
+        centroids, labels, history, inertia = geodesic_kmeans(params, len(centers), centers=np.array(self.start_centers))
+        centroid_dots = VGroup(*[
+            Dot(coords_to_points(axes, center), color=color, radius=0.12).set_stroke(WHITE, width=2)
+            for center, color in zip(history[0], self.cluster_colors)
+        ])
+        iteration_text = Text("Iteration 0", font_size=20, color=YELLOW).to_corner(UR).shift(DOWN * 1.2)
+        self.play(FadeIn(centroid_dots), Write(iteration_text))
+        
+        colors = np.array(self.cluster_colors)
+        cluster_dots = cloud
+        for step in range(1, len(history)):
+            # Assignment to the nearest centroid, then the Karcher means of the clusters.
+            # The dots stay where they are and only change color: a cross-fade, since
+            # transforming into clouds of other sizes would move dots between clusters
+            assigned = np.argmin(fisher_distance_matrix(params, history[step - 1]), axis=-1)
+            recolored = dot_clouds(points, colors[assigned], radius=0.025)
+            self.play(FadeOut(cluster_dots), FadeIn(recolored), run_time=0.8)
+            cluster_dots = recolored
+            
+            trails = VGroup(*[
+                polyline(axes, history[step - 1:step + 1, k], color=color, stroke_width=3)
+                for k, color in enumerate(self.cluster_colors)
+            ])
+            new_iteration_text = Text(f"Iteration {step}", font_size=20, color=YELLOW).move_to(iteration_text)
+            self.play(
+                *[dot.animate.move_to(coords_to_points(axes, center)) for dot, center in zip(centroid_dots, history[step])],
+                Create(trails),
+                Transform(iteration_text, new_iteration_text),
+                run_time=1.5
+            )
+        
+        result_text = VGroup(
+            MathTex(r"\min \sum_i d_F(\theta_i, c_{k(i)})^2 = " + f"{inertia:.1f}", font_size=24),
+            Text("Centroids are Karcher means: exp_c(mean of log_c θᵢ) = c", font_size=16, color=YELLOW)
+        ).arrange(DOWN, buff=0.2).to_edge(DOWN)
+        self.play(Write(result_text))
+        self.wait(2)
+        
+        # Tangent PCA of each cluster: principal geodesics through its mean,
+        # two standard deviations either way
+        t = np.linspace(-2, 2, 32)[:, None]
+        principal_geodesics = VGroup()
+        for k in range(len(centroids)):
+            mean, variances, directions, _ = tangent_pca(params[labels == k], centroids[k])
+            for variance, direction, color in zip(variances, directions, (WHITE, YELLOW)):
+                curve = fisher_exp(mean, t * np.sqrt(variance) * direction)
+                principal_geodesics.add(polyline(axes, curve, color=color, stroke_width=3))
+        pca_text = Text("Principal geodesics from tangent-space PCA", font_size=18, color=WHITE).to_edge(DOWN)
+        self.play(FadeOut(result_text))
+        self.play(Create(principal_geodesics), Write(pca_text), run_time=2)
+        self.wait(3)
@@ -1,8 +1,16 @@
 from manim import *
 import numpy as np
+
+from mathvisualizations.fisher import peak_density_surface
+from mathvisualizations.mixtures import empirical_fisher, fit_mixtures, project_to_normal, sample_mixtures
+from mathvisualizations.mobjects import DotCloud, coords_to_points
 from scipy.stats import norm, gamma, beta
 
 class FisherInformationManifold(ThreeDScene):
+    # Synthetic two-component mixture datasets fitted by EM
+    mixture_datasets = 400
+    mixture_samples = 150
+
     def construct(self):
         # Set up the scene with better initial camera angle
         self.set_camera_orientation(phi=60 * DEGREES, theta=30 * DEGREES)
@@ -36,8 +44,7 @@ class FisherInformationManifold(ThreeDScene):
         def statistical_manifold_surface(mu, sigma):
             # For visualization, we'll show the maximum probability density
             # P(x) = 1/(σ√(2π)) at x = μ (the mean)
-            max_prob = 1 / (sigma * np.sqrt(2 * np.pi))
-            return np.array([mu, sigma, max_prob])
+            return peak_density_surface(mu, sigma)
         
         # Create the surface
         surface = Surface(
@@ -118,6 +125,48 @@ class FisherInformationManifold(ThreeDScene):
         # Now show the Fisher Information Matrix
         self.play(FadeOut(pdf_explanation), FadeOut(*sample_dots), FadeOut(*sample_labels))
         
+        # Fit two-component Gaussian mixtures to many small datasets in one
+        # batch; each component is a point of the manifold, and each mixture
+        # projects onto the normal with its mean and variance
+        rng = np.random.default_rng(0)
+        count = self.mixture_datasets
+        first_weight = rng.uniform(0.3, 0.7, count)
+        data = sample_mixtures(
+            np.column_stack([first_weight, 1 - first_weight]),
+            np.column_stack([rng.uniform(-2, -0.5, count), rng.uniform(0.5, 2, count)]),
+            rng.uniform(0.3, 0.8, (count, 2)),
+            self.mixture_samples,
+        )
+        (weights, means, sigmas), _, converged = fit_mixtures(data, components=2)
+        projected = project_to_normal(weights, means, sigmas)
+        component_dots = DotCloud(
+            coords_to_points(axes, peak_density_surface(means.ravel(), sigmas.ravel())), color=ORANGE, radius=0.03
+        )
+        # One projection dot per component, so both components of a mixture
+        # move onto its own projection
+        projection_dots = DotCloud(
+            coords_to_points(axes, peak_density_surface(*np.repeat(projected, 2, axis=0).T)), color=PURPLE, radius=0.04
+        )
+        
+        # Cramér-Rao standard errors of the component means from the empirical Fisher information
+        covariance = np.linalg.inv(empirical_fisher(data, weights, means, sigmas)) / self.mixture_samples
+        mean_errors = np.median(np.sqrt(covariance[:, [1, 2], [1, 2]]), axis=0)
+        mixture_explanation = VGroup(
+            Text(f"EM fits of {converged.sum()} two-component mixtures (orange: components)", font_size=14, color=ORANGE),
+            Text("Purple: projection onto N(μ, σ²), matching mean and variance", font_size=14, color=PURPLE),
+            MathTex(
+                rf"\hat I(\theta) = \tfrac{{1}}{{n}}\sum_i s_i s_i^\top,\quad"
+                rf"\mathrm{{se}}(\mu_1) \approx {mean_errors[0]:.3f},\ \mathrm{{se}}(\mu_2) \approx {mean_errors[1]:.3f}",
+                font_size=18,
+            ),
+        ).arrange(DOWN, buff=0.2).to_edge(DOWN)
+        self.add_fixed_in_frame_mobjects(mixture_explanation)
+        
+        self.play(FadeIn(component_dots), Write(mixture_explanation))
+        self.play(ReplacementTransform(component_dots.copy(), projection_dots), run_time=2)
+        self.wait(2)
+        self.play(FadeOut(component_dots), FadeOut(projection_dots), FadeOut(mixture_explanation))
+        
         fisher_title = Text("Fisher Information Matrix", font_size=20, color=YELLOW).to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(fisher_title)
         self.play(Write(fisher_title))
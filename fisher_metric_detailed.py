@@ -1,7 +1,19 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.divergences import divergence
+from mathvisualizations.densities import pdf_matrix
+from mathvisualizations.fisher import fisher_metric_normal, normal_geodesic, path_length
+from mathvisualizations.metrics import straight_path
+from mathvisualizations.mobjects import GraphMorph, coordinate_grid, coords_to_points, graphs, polyline
+
 class FisherMetricDetailed(Scene):
+    # (μ, σ) of the two normal distributions being compared
+    dist1_params = (-1.0, 0.4)
+    dist2_params = (1.0, 0.8)
+    # Precomputed densities for the morph along the geodesic
+    morph_frames = 240
+
     def construct(self):
         # Set up the scene
         title = Text("Detailed Fisher Metric Analysis", font_size=32, color=WHITE).to_edge(UP)
@@ -32,27 +44,8 @@ class FisherMetricDetailed(Scene):
         right_label = Text("Probability Density\np(x|μ,σ)", font_size=20, color=GREEN).next_to(right_axes, DOWN)
         
         # Create coordinate grid
-        param_grid = VGroup()
-        
-        # Vertical lines (μ)
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, 0.1, 0),
-                end=left_axes.c2p(x, 1.5, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            param_grid.add(line)
-        
-        # Horizontal lines (σ)
-        for y in np.linspace(0.1, 1.5, 8):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            param_grid.add(line)
+        # Vertical lines (μ) and horizontal lines (σ)
+        param_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(0.1, 1.5, 8))
         
         # Show coordinate systems
         self.play(Create(left_axes), Create(right_axes))
@@ -65,11 +58,11 @@ class FisherMetricDetailed(Scene):
         
         # Create two specific probability distributions
         # Distribution 1: Normal with parameters (μ₁, σ₁)
-        dist1_params = np.array([-1.0, 0.4])  # (μ₁, σ₁)
+        dist1_params = np.array(self.dist1_params, dtype=float)  # (μ₁, σ₁)
         dist1_point = left_axes.c2p(dist1_params[0], dist1_params[1], 0)
         
         # Distribution 2: Normal with parameters (μ₂, σ₂)
-        dist2_params = np.array([1.0, 0.8])   # (μ₂, σ₂)
+        dist2_params = np.array(self.dist2_params, dtype=float)  # (μ₂, σ₂)
         dist2_point = left_axes.c2p(dist2_params[0], dist2_params[1], 0)
         
         # Create points for the distributions
@@ -77,10 +70,10 @@ class FisherMetricDetailed(Scene):
         dist2_dot = Dot(point=dist2_point, color=BLUE, radius=0.1)
         
         # Add labels for the distributions
-        dist1_label = Text("P₁(μ₁=-1, σ₁=0.4)", font_size=16, color=RED)
+        dist1_label = Text(f"P₁(μ₁={dist1_params[0]:g}, σ₁={dist1_params[1]:g})", font_size=16, color=RED)
         dist1_label.move_to(dist1_point + UP * 0.4)
         
-        dist2_label = Text("P₂(μ₂=1, σ₂=0.8)", font_size=16, color=BLUE)
+        dist2_label = Text(f"P₂(μ₂={dist2_params[0]:g}, σ₂={dist2_params[1]:g})", font_size=16, color=BLUE)
         dist2_label.move_to(dist2_point + UP * 0.4)
         
         # Show the two distributions
@@ -88,17 +81,6 @@ class FisherMetricDetailed(Scene):
         self.play(Write(dist1_label), Write(dist2_label))
         self.wait(1)
         
-        # Create Fisher metric function
-        def fisher_metric_normal(mu, sigma):
-            # For normal distribution N(μ, σ²):
-            # g_11 = 1/σ² (variance of μ)
-            # g_22 = 2/σ² (variance of σ)
-            # g_12 = g_21 = 0 (no correlation)
-            g_11 = 1 / (sigma**2)
-            g_22 = 2 / (sigma**2)
-            g_12 = 0
-            return np.array([[g_11, g_12], [g_12, g_22]])
-        
         # Compute Fisher metrics
         G1 = fisher_metric_normal(dist1_params[0], dist1_params[1])
         G2 = fisher_metric_normal(dist2_params[0], dist2_params[1])
@@ -121,28 +103,11 @@ class FisherMetricDetailed(Scene):
         self.play(Write(metric1_text), Write(metric2_text))
         self.wait(2)
         
-        # Create probability density functions
-        def normal_pdf(x, mu, sigma):
-            return (1 / (sigma * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mu) / sigma)**2)
-        
-        # Plot distribution 1
+        # Plot distributions 1 and 2, one row of densities each
         x_vals = np.linspace(-4, 4, 200)
-        y1_vals = [normal_pdf(x, dist1_params[0], dist1_params[1]) for x in x_vals]
-        points1 = [right_axes.c2p(x, y, 0) for x, y in zip(x_vals, y1_vals)]
-        
-        pdf1 = VMobject()
-        pdf1.set_points_as_corners(points1)
-        pdf1.set_color(RED)
-        pdf1.set_stroke(width=3)
-        
-        # Plot distribution 2
-        y2_vals = [normal_pdf(x, dist2_params[0], dist2_params[1]) for x in x_vals]
-        points2 = [right_axes.c2p(x, y, 0) for x, y in zip(x_vals, y2_vals)]
-        
-        pdf2 = VMobject()
-        pdf2.set_points_as_corners(points2)
-        pdf2.set_color(BLUE)
-        pdf2.set_stroke(width=3)
+        pdf1, pdf2 = graphs(
+            right_axes, x_vals, pdf_matrix("normal", [dist1_params, dist2_params], x_vals), [RED, BLUE], stroke_width=3
+        )
         
         # Show probability density functions
         self.play(Create(pdf1))
@@ -153,67 +118,50 @@ class FisherMetricDetailed(Scene):
         # Create a path between the two distributions
         def geodesic_path(t):
             # Linear interpolation in parameter space
-            mu = dist1_params[0] + t * (dist2_params[0] - dist1_params[0])
-            sigma = dist1_params[1] + t * (dist2_params[1] - dist1_params[1])
-            return np.array([mu, sigma])
+            return straight_path(dist1_params, dist2_params, t)
         
         # Create the path
-        path_points = [geodesic_path(t) for t in np.linspace(0, 1, 50)]
-        path_coords = [left_axes.c2p(p[0], p[1], 0) for p in path_points]
-        
-        geodesic_path_obj = VMobject()
-        geodesic_path_obj.set_points_as_corners(path_coords)
-        geodesic_path_obj.set_color(YELLOW)
-        geodesic_path_obj.set_stroke(width=3)
+        path_points = geodesic_path(np.linspace(0, 1, 50))
+        geodesic_path_obj = polyline(left_axes, path_points, color=YELLOW, stroke_width=3)
         
         # Show the geodesic path
         self.play(Create(geodesic_path_obj))
         self.wait(1)
         
-        # Show how the probability density evolves along the path
-        # Create intermediate distributions
-        intermediate_pdfs = []
-        sample_times = [0.25, 0.5, 0.75]
-        
-        for t in sample_times:
-            params = geodesic_path(t)
-            y_vals = [normal_pdf(x, params[0], params[1]) for x in x_vals]
-            points = [right_axes.c2p(x, y, 0) for x, y in zip(x_vals, y_vals)]
-            
-            pdf = VMobject()
-            pdf.set_points_as_corners(points)
-            pdf.set_color(interpolate_color(RED, BLUE, t))
-            pdf.set_stroke(width=2)
-            intermediate_pdfs.append(pdf)
-        
-        # Show intermediate PDFs
-        for pdf in intermediate_pdfs:
-            self.play(Create(pdf), run_time=0.5)
-        
+        # Show how the probability density evolves along the Fisher-Rao geodesic:
+        # the (frames, samples) densities are computed once, and one curve is
+        # morphed through them
+        fisher_geodesic = normal_geodesic(dist1_params, dist2_params, num=self.morph_frames)
+        fisher_geodesic_obj = polyline(left_axes, fisher_geodesic, color=GREEN, stroke_width=3)
+        geodesic_points = coords_to_points(left_axes, fisher_geodesic)
+        morphing_pdf = pdf1.copy().set_stroke(YELLOW, width=3)
+        morph_dot = Dot(point=geodesic_points[0], color=GREEN, radius=0.08)
+        
+        self.play(Create(fisher_geodesic_obj), FadeIn(morph_dot))
+        self.add(morphing_pdf)
+        self.play(
+            GraphMorph(morphing_pdf, right_axes, x_vals, pdf_matrix("normal", fisher_geodesic, x_vals)),
+            UpdateFromAlphaFunc(
+                morph_dot, lambda dot, alpha: dot.move_to(geodesic_points[round(alpha * (len(geodesic_points) - 1))])
+            ),
+            run_time=4,
+        )
+        self.play(FadeOut(morphing_pdf), FadeOut(morph_dot))
         self.wait(1)
         
-        # Create Fisher distance calculation
-        def fisher_distance(G, delta_theta):
-            # Fisher distance: ds² = δθ^T G δθ
-            ds_squared = delta_theta.T @ G @ delta_theta
-            return np.sqrt(ds_squared)
-        
-        # Calculate distances at different points along the path
-        distances = []
-        for i in range(len(path_points) - 1):
-            delta_theta = path_points[i+1] - path_points[i]
-            # Use metric at current point
-            G_current = fisher_metric_normal(path_points[i][0], path_points[i][1])
-            ds = fisher_distance(G_current, delta_theta)
-            distances.append(ds)
-        
-        total_distance = sum(distances)
+        # Sum the Fisher line elements along the path, using the metric at each step's start
+        total_distance = path_length(path_points)
+        # The geodesic is shorter than the straight path; KL is not symmetric
+        fisher_rao = divergence("fisher_rao", "normal", dist1_params, dist2_params)
+        kl_12 = divergence("kl", "normal", dist1_params, dist2_params)
+        kl_21 = divergence("kl", "normal", dist2_params, dist1_params)
         
         # Show distance calculation
         distance_text = VGroup(
             Text("Fisher Distance Calculation:", font_size=24, color=WHITE),
             Text(f"ds² = δθ^T G(θ) δθ", font_size=20, color=YELLOW),
-            Text(f"Total distance: {total_distance:.3f}", font_size=20, color=ORANGE),
+            Text(f"Total distance: {total_distance:.3f} (geodesic: {fisher_rao:.3f})", font_size=20, color=ORANGE),
+            Text(f"KL(P₁‖P₂) = {kl_12:.3f}, KL(P₂‖P₁) = {kl_21:.3f}", font_size=20, color=ORANGE),
             Text("This measures information difference between distributions", font_size=18, color=BLUE)
         ).arrange(DOWN, buff=0.3).to_edge(DOWN)
         
@@ -244,7 +192,7 @@ class FisherMetricDetailed(Scene):
         
         # Show moving point along the geodesic
         moving_point = Dot(color=YELLOW, radius=0.08)
-        moving_point.move_to(path_coords[0])
+        moving_point.move_to(geodesic_path_obj.get_start())
         
         self.play(FadeIn(moving_point))
         
@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.fisher import fisher_metric_normal, path_length
+from mathvisualizations.metrics import straight_path
+from mathvisualizations.mobjects import coordinate_grid
+
 class FisherMetricVisualization(Scene):
     def construct(self):
         # Set up the scene
@@ -32,27 +36,7 @@ class FisherMetricVisualization(Scene):
         right_label = Text("Probability Space\nwith Fisher Distance", font_size=20, color=GREEN).next_to(right_axes, DOWN)
         
         # Create coordinate grid
-        param_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            param_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            param_grid.add(line)
+        param_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Show coordinate systems
         self.play(Create(left_axes), Create(right_axes))
@@ -88,17 +72,6 @@ class FisherMetricVisualization(Scene):
         self.play(Write(dist1_label), Write(dist2_label))
         self.wait(1)
         
-        # Create Fisher metric at both points
-        def fisher_metric_normal(mu, sigma):
-            # For normal distribution N(μ, σ²):
-            # g_11 = 1/σ² (variance of μ)
-            # g_22 = 2/σ² (variance of σ)
-            # g_12 = g_21 = 0 (no correlation)
-            g_11 = 1 / (sigma**2)
-            g_22 = 2 / (sigma**2)
-            g_12 = 0
-            return np.array([[g_11, g_12], [g_12, g_22]])
-        
         # Compute Fisher metrics
         G1 = fisher_metric_normal(dist1_params[0], dist1_params[1])
         G2 = fisher_metric_normal(dist2_params[0], dist2_params[1])
@@ -124,12 +97,10 @@ class FisherMetricVisualization(Scene):
         # Create a path between the two distributions
         def geodesic_path(t):
             # Linear interpolation in parameter space
-            mu = dist1_params[0] + t * (dist2_params[0] - dist1_params[0])
-            sigma = dist1_params[1] + t * (dist2_params[1] - dist1_params[1])
-            return np.array([mu, sigma])
+            return straight_path(dist1_params, dist2_params, t)
         
         # Create the path
-        path_points = [geodesic_path(t) for t in np.linspace(0, 1, 50)]
+        path_points = geodesic_path(np.linspace(0, 1, 50))
         path_coords = [left_axes.c2p(p[0], p[1], 0) for p in path_points]
         
         geodesic_path_obj = VMobject()
@@ -141,23 +112,8 @@ class FisherMetricVisualization(Scene):
         self.play(Create(geodesic_path_obj))
         self.wait(1)
         
-        # Create Fisher distance calculation
-        def fisher_distance(G1, G2, delta_theta):
-            # Fisher distance: ds² = δθ^T G δθ
-            # For infinitesimal displacement
-            ds_squared = delta_theta.T @ G1 @ delta_theta
-            return np.sqrt(ds_squared)
-        
-        # Calculate distances at different points along the path
-        distances = []
-        for i in range(len(path_points) - 1):
-            delta_theta = path_points[i+1] - path_points[i]
-            # Use metric at current point
-            G_current = fisher_metric_normal(path_points[i][0], path_points[i][1])
-            ds = fisher_distance(G_current, G_current, delta_theta)
-            distances.append(ds)
-        
-        total_distance = sum(distances)
+        # Sum the Fisher line elements along the path, using the metric at each step's start
+        total_distance = path_length(path_points)
         
         # Show distance calculation
         distance_text = VGroup(
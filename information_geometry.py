@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.charts import probability_coordinates
+from mathvisualizations.fisher import fisher_metric_normal
+from mathvisualizations.mobjects import coordinate_grid
+
 class InformationGeometry(Scene):
     def construct(self):
         # Set up the scene
@@ -41,9 +45,7 @@ class InformationGeometry(Scene):
             # Fisher metric components (example for normal distribution)
             # g_11 = 1/σ², g_22 = 2/σ², g_12 = 0
             sigma = 1 + 0.3 * np.sqrt(x**2 + y**2)  # σ varies with position
-            g_11 = 1 / (sigma**2)
-            g_22 = 2 / (sigma**2)
-            g_12 = 0
+            (g_11, g_12), (_, g_22) = fisher_metric_normal(x, sigma)
             
             metric_text = MathTex(
                 f"g = \\begin{{pmatrix}} {g_11:.2f} & {g_12:.2f} \\\\ {g_12:.2f} & {g_22:.2f} \\end{{pmatrix}}",
@@ -54,27 +56,7 @@ class InformationGeometry(Scene):
             fisher_metrics.add(metric_text)
         
         # Create coordinate grid for parameter space
-        param_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            param_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            param_grid.add(line)
+        param_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Create probability simplex (2D case)
         simplex = Polygon(
@@ -128,11 +110,8 @@ class InformationGeometry(Scene):
         # Create corresponding curve in probability space
         def probability_curve(t):
             # Transform parameters to probabilities (example transformation)
-            theta1, theta2 = geodesic_curve(t)
             # Simple transformation: p1 = sigmoid(theta1), p2 = sigmoid(theta2)
-            p1 = 1 / (1 + np.exp(-theta1))
-            p2 = 1 / (1 + np.exp(-theta2))
-            return np.array([p1, p2])
+            return probability_coordinates(geodesic_curve(t))
         
         prob_path = ParametricFunction(
             lambda t: right_axes.c2p(*probability_curve(t), 0),
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.atlas import plane_disk_atlas
+from mathvisualizations.charts import chart_grid
+from mathvisualizations.mobjects import DotCloud, coords_to_points
+from mathvisualizations.surfaces import saddle_surface
+
 class ManifoldChartsAtlas(Scene):
     def construct(self):
         # Set up the scene
@@ -39,19 +44,13 @@ class ManifoldChartsAtlas(Scene):
         # Create manifold surface (curved 2D surface)
         def manifold_surface(u, v):
             # Create a curved surface: z = 0.1 * (u² - v²) + 0.05 * sin(2πu) * cos(2πv)
-            x = u
-            y = v
-            z = 0.1 * (u**2 - v**2) + 0.05 * np.sin(2*np.pi*u) * np.cos(2*np.pi*v)
-            return np.array([x, y, z])
+            return saddle_surface(u, v, a=0.1, b=0.05, ku=2*np.pi, kv=2*np.pi)
         
         # Create surface grid
-        surface_grid = VGroup()
-        for u in np.linspace(-2, 2, 15):
-            for v in np.linspace(-2, 2, 15):
-                point = manifold_surface(u, v)
-                # Project to 2D for visualization
-                dot = Dot(point=left_axes.c2p(point[0], point[1], 0), color=BLUE, radius=0.02)
-                surface_grid.add(dot)
+        u, v = np.meshgrid(np.linspace(-2, 2, 15), np.linspace(-2, 2, 15), indexing="ij")
+        points = manifold_surface(u, v).reshape(-1, 3)
+        # Project to 2D for visualization
+        surface_grid = DotCloud(coords_to_points(left_axes, points), color=BLUE, radius=0.02)
         
         # Show manifold surface
         self.play(Create(surface_grid))
@@ -108,39 +107,26 @@ class ManifoldChartsAtlas(Scene):
         
         # Create chart transformation visualization
         # Show how coordinates transform between charts
-        def chart_transformation_12(x1, y1):
-            # Transform from chart 1 to chart 2 coordinates
-            # This is a simple example transformation
-            x2 = x1 + 1.2
-            y2 = y1 + 1.2
-            return x2, y2
-        
         # Create coordinate grid in chart 1
-        chart1_grid = VGroup()
-        for x in np.linspace(-0.8, 0.8, 5):
-            for y in np.linspace(-0.8, 0.8, 5):
-                point = left_axes.c2p(x, y, 0)
-                dot = Dot(point=point, color=RED, radius=0.03)
-                chart1_grid.add(dot)
-        
-        # Create transformed grid in chart 2
-        chart2_grid = VGroup()
-        for x in np.linspace(-0.8, 0.8, 5):
-            for y in np.linspace(-0.8, 0.8, 5):
-                x2, y2 = chart_transformation_12(x, y)
-                point = right_axes.c2p(x2, y2, 0)
-                dot = Dot(point=point, color=GREEN, radius=0.03)
-                chart2_grid.add(dot)
+        atlas = plane_disk_atlas()
+        grid = chart_grid(1.2, 25)
+        chart1_coords = grid[atlas["U1"].contains_coords(grid)]
+        chart1_grid = DotCloud(coords_to_points(left_axes, chart1_coords), color=RED, radius=0.02)
+        
+        # The points of the overlap U₁ ∩ U₂ and their coordinates in chart 2
+        overlap_coords = chart1_coords[atlas.overlap("U1", "U2", chart1_coords)]
+        overlap_grid = DotCloud(coords_to_points(left_axes, overlap_coords), color=YELLOW, radius=0.03)
+        transformed = atlas.transition("U1", "U2", overlap_coords)
+        chart2_grid = DotCloud(coords_to_points(right_axes, transformed), color=GREEN, radius=0.03)
         
         # Show coordinate grids
         self.play(Create(chart1_grid))
+        self.play(Create(overlap_grid))
         self.wait(1)
         
         # Show transformation arrows
         transformation_arrows = VGroup()
-        for i in range(len(chart1_grid)):
-            start_point = chart1_grid[i].get_center()
-            end_point = chart2_grid[i].get_center()
+        for start_point, end_point in zip(overlap_grid.get_dot_centers(), chart2_grid.get_dot_centers()):
             arrow = Arrow(start=start_point, end=end_point, color=YELLOW, stroke_width=2)
             transformation_arrows.add(arrow)
         
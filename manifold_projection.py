@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.surfaces import saddle_surface
+
 class ManifoldProjection(Scene):
     def construct(self):
         # Set up the scene
@@ -36,10 +38,7 @@ class ManifoldProjection(Scene):
         
         # Create the curved surface (hyperbolic paraboloid)
         def manifold_surface(u, v):
-            x = u
-            y = v
-            z = 0.1 * (u**2 - v**2)
-            return np.array([x, y, z])
+            return saddle_surface(u, v, a=0.1, b=0)
         
         # Create surface for 3D view
         surface_3d = Surface(
@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.surfaces import saddle_surface, saddle_tangents
+
 class NonEuclideanManifold(ThreeDScene):
     def construct(self):
         # Set up 3D camera
@@ -8,10 +10,7 @@ class NonEuclideanManifold(ThreeDScene):
         
         # Create a curved 2D manifold (hyperbolic paraboloid)
         def manifold_surface(u, v):
-            x = u
-            y = v
-            z = 0.1 * (u**2 - v**2)  # Hyperbolic paraboloid
-            return np.array([x, y, z])
+            return saddle_surface(u, v, a=0.1, b=0)  # Hyperbolic paraboloid
         
         # Create the surface using surface
         surface = Surface(
@@ -77,14 +76,8 @@ class NonEuclideanManifold(ThreeDScene):
         
         # Create tangent vectors at a point
         def tangent_vectors(u, v):
-            # Partial derivatives
-            du = np.array([1, 0, 0.2 * u])
-            dv = np.array([0, 1, -0.2 * v])
-            
-            # Normalize
-            du = du / np.linalg.norm(du)
-            dv = dv / np.linalg.norm(dv)
-            
+            # Normalized partial derivatives
+            du, dv = saddle_tangents(u, v, a=0.1, b=0)
             return du, dv
         
         # Create tangent vectors at point (1, 1)
@@ -0,0 +1,14 @@
+"""Shared code for the Math Visualizations scenes.
+
+The mathematical modules (:mod:`~mathvisualizations.fisher`,
+:mod:`~mathvisualizations.surfaces`, ...) depend only on NumPy and can be
+imported without Manim, e.g. by batch analysis jobs.  Nothing is imported
+here, so ``from mathvisualizations import fisher`` pays for exactly one
+module.
+
+The scene files at the top level of the repository stay runnable with the
+``manim`` command line.  Tooling that drives Manim's renderer lives in the
+:mod:`mathvisualizations.render` subpackage and the array-backed mobjects
+in :mod:`mathvisualizations.mobjects`; both import Manim and are therefore
+never loaded by this package itself.
+"""
@@ -0,0 +1,404 @@
+"""Atlases: charts given by domains and maps, with transitions on whole arrays.
+
+A :class:`Chart` of a manifold embedded in R^n has a domain predicate on
+manifold points (shape ``(..., n)``), the coordinate map ``φ`` to chart
+coordinates (shape ``(..., d)``) and its inverse.  An :class:`Atlas`
+evaluates the transitions ``φ_j ∘ φ_i⁻¹`` between any two charts on arrays
+of coordinates, marks points outside the overlap with NaN, and supplies the
+Jacobians of the transitions for moving tangent vectors and metrics from one
+chart to another.  Charts may carry the metric in their coordinates, and
+:meth:`Atlas.metric_consistency` checks that these agree on every overlap::
+
+    python -m mathvisualizations.atlas sphere caps --points 1000000
+"""
+
+import argparse
+
+import numpy as np
+
+from .charts import ATLAS_CHARTS
+
+
+class Chart:
+    """A chart ``(U, φ)``.
+
+    ``domain(points)`` is True where a manifold point lies in U;
+    ``to_coords`` is φ and ``from_coords`` is φ⁻¹.  The optional
+    ``coords_jacobian(points)`` (shape ``(..., d, n)``, the derivative of φ
+    extended to a neighborhood in R^n) and ``embedding_jacobian(coords)``
+    (shape ``(..., n, d)``, the derivative of φ⁻¹) give transition Jacobians
+    by the chain rule; without them they are found by central differences.
+    ``metric(coords)`` (shape ``(..., d, d)``) is the Riemannian metric in
+    this chart's coordinates, if the manifold has one.
+    """
+
+    def __init__(self, name, domain, to_coords, from_coords, coords_jacobian=None, embedding_jacobian=None,
+                 metric=None):
+        self.name = name
+        self.domain = domain
+        self.to_coords = to_coords
+        self.from_coords = from_coords
+        self.coords_jacobian = coords_jacobian
+        self.embedding_jacobian = embedding_jacobian
+        self.metric = metric
+
+    def contains_coords(self, coords):
+        """True where chart coordinates belong to a point of the domain."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.domain(self.from_coords(np.asarray(coords, dtype=float)))
+
+    def __repr__(self):
+        return f"Chart({self.name!r})"
+
+
+class Atlas:
+    """A collection of charts, addressed by name or position."""
+
+    def __init__(self, charts):
+        self.charts = list(charts)
+        self.names = [chart.name for chart in self.charts]
+
+    def __getitem__(self, key):
+        return self.charts[key] if isinstance(key, (int, np.integer)) else self.charts[self.names.index(key)]
+
+    def __iter__(self):
+        return iter(self.charts)
+
+    def __len__(self):
+        return len(self.charts)
+
+    def domain_masks(self, points):
+        """``(..., K)`` booleans: which of the K charts contain each point."""
+        points = np.asarray(points, dtype=float)
+        return np.stack([chart.domain(points) for chart in self.charts], axis=-1)
+
+    def overlap_counts(self, points):
+        """``(K, K)`` counts of sample points in each pairwise overlap (diagonal: in each chart)."""
+        masks = self.domain_masks(points).reshape(-1, len(self)).astype(np.int64)
+        return masks.T @ masks
+
+    def covers(self, points):
+        return self.domain_masks(points).any(axis=-1)
+
+    def overlap(self, source, target, coords):
+        """True where ``source`` coordinates belong to a point in both charts."""
+        source, target = self[source], self[target]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            points = source.from_coords(np.asarray(coords, dtype=float))
+            return source.domain(points) & target.domain(points)
+
+    def transition(self, source, target, coords):
+        """``φ_target ∘ φ_source⁻¹`` on an array of source coordinates; NaN outside the overlap."""
+        source, target = self[source], self[target]
+        coords = np.asarray(coords, dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            points = source.from_coords(coords)
+            inside = source.domain(points) & target.domain(points)
+            result = target.to_coords(points)
+        return np.where(inside[..., None], result, np.nan)
+
+    def transition_path(self, names, coords):
+        """Compose the transitions along the charts ``names``; NaN where any step leaves an overlap."""
+        for source, target in zip(names[:-1], names[1:]):
+            coords = self.transition(source, target, coords)
+        return coords
+
+    def transition_jacobian(self, source, target, coords, step=1e-6):
+        """Jacobians ``∂(φ_target ∘ φ_source⁻¹)^a / ∂u^b``, shape ``(..., d, d)``; NaN outside the overlap."""
+        coords = np.asarray(coords, dtype=float)
+        source_chart, target_chart = self[source], self[target]
+        if source_chart.embedding_jacobian is not None and target_chart.coords_jacobian is not None:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                points = source_chart.from_coords(coords)
+                jacobian = target_chart.coords_jacobian(points) @ source_chart.embedding_jacobian(coords)
+            inside = self.overlap(source, target, coords)
+            return np.where(inside[..., None, None], jacobian, np.nan)
+        # Central differences, one pair of evaluations per coordinate
+        offsets = step * np.eye(coords.shape[-1])
+        columns = [
+            (self.transition(source, target, coords + offset) - self.transition(source, target, coords - offset))
+            / (2 * step)
+            for offset in offsets
+        ]
+        return np.stack(columns, axis=-1)
+
+    def push_vectors(self, source, target, coords, vectors):
+        """Components in ``target`` of tangent vectors given in ``source`` coordinates at ``coords``."""
+        jacobian = self.transition_jacobian(source, target, coords)
+        return np.einsum("...ab,...b->...a", jacobian, vectors)
+
+    def pullback_metric(self, source, target, coords, metric=None):
+        """The metric of ``target`` in ``source`` coordinates, ``Jᵀ g J``, at ``coords``.
+
+        ``metric`` is a function of target coordinates (the target chart's
+        own metric by default) or an array of matrices already evaluated at
+        the transformed points.
+        """
+        jacobian = self.transition_jacobian(source, target, coords)
+        if metric is None:
+            metric = self[target].metric
+        if callable(metric):
+            with np.errstate(invalid="ignore", divide="ignore"):
+                metric = metric(self.transition(source, target, coords))
+        return np.swapaxes(jacobian, -1, -2) @ metric @ jacobian
+
+    def pushforward_metric(self, source, target, coords, metric=None):
+        """The metric given in ``source`` coordinates expressed in ``target``, ``J⁻ᵀ g J⁻¹``.
+
+        Evaluated at the images of ``coords``; ``metric`` is a function of
+        source coordinates (the source chart's metric by default) or an array.
+        """
+        if metric is None:
+            metric = self[source].metric
+        if callable(metric):
+            metric = metric(np.asarray(coords, dtype=float))
+        inverse = np.linalg.inv(self.transition_jacobian(source, target, coords))
+        return np.swapaxes(inverse, -1, -2) @ metric @ inverse
+
+    def metric_consistency(self, points, block=2**18):
+        """Compare the charts' metrics on every overlap that contains some of ``points``.
+
+        For each ordered pair of charts the relative error
+        ``|g_source - Jᵀ g_target J| / |g_source|`` (Frobenius norms) is
+        measured at the sample points in both domains, ``block`` points at a
+        time.  Returns ``{(source, target): {"points", "max", "mean"}}``.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, np.shape(points)[-1])
+        totals = {}
+        for start in range(0, len(points), block):
+            chunk = points[start:start + block]
+            masks = self.domain_masks(chunk)
+            for i, source in enumerate(self.charts):
+                for j, target in enumerate(self.charts):
+                    inside = masks[:, i] & masks[:, j]
+                    if i == j or not inside.any():
+                        continue
+                    coords = source.to_coords(chunk[inside])
+                    expected = source.metric(coords)
+                    error = np.linalg.norm(expected - self.pullback_metric(i, j, coords), axis=(-2, -1))
+                    error /= np.linalg.norm(expected, axis=(-2, -1))
+                    entry = totals.setdefault((source.name, target.name), {"points": 0, "max": 0.0, "sum": 0.0})
+                    entry["points"] += len(error)
+                    entry["max"] = max(entry["max"], float(error.max()))
+                    entry["sum"] += float(error.sum())
+        return {
+            pair: {"points": entry["points"], "max": entry["max"], "mean": entry["sum"] / entry["points"]}
+            for pair, entry in totals.items()
+        }
+
+
+def induced_metric(chart, coords):
+    """Metric induced by the embedding, ``Eᵀ E`` with E the Jacobian of φ⁻¹."""
+    E = chart.embedding_jacobian(np.asarray(coords, dtype=float))
+    return np.swapaxes(E, -1, -2) @ E
+
+
+def plane_disk_atlas(disks=ATLAS_CHARTS, metric=None):
+    """Charts ``U1, U2, ...`` of the plane: open disks, each with coordinates measured from its center.
+
+    ``metric(x, y)`` is a metric on the plane (see :mod:`~mathvisualizations.metrics`),
+    given to every chart in its own coordinates.
+    """
+    charts = []
+    for k, (center, radius) in enumerate(disks, start=1):
+        center = np.asarray(center, dtype=float)
+        chart_metric = None
+        if metric is not None:
+            chart_metric = lambda coords, center=center: metric(*np.moveaxis(coords + center, -1, 0))
+        charts.append(Chart(
+            f"U{k}",
+            domain=lambda points, center=center, radius=radius: np.hypot(*np.moveaxis(points - center, -1, 0)) < radius,
+            to_coords=lambda points, center=center: points - center,
+            from_coords=lambda coords, center=center: coords + center,
+            coords_jacobian=lambda points: np.broadcast_to(np.eye(2), points.shape[:-1] + (2, 2)),
+            embedding_jacobian=lambda coords: np.broadcast_to(np.eye(2), coords.shape[:-1] + (2, 2)),
+            metric=chart_metric,
+        ))
+    return Atlas(charts)
+
+
+def _stereographic_chart(name, pole, eps=1e-9):
+    # Projection from the pole z = pole (±1) onto the plane z = 0
+    def to_coords(points):
+        x, y, z = np.moveaxis(points, -1, 0)
+        return np.stack([x, y], axis=-1) / (1 - pole * z)[..., None]
+
+    def from_coords(coords):
+        u, v = np.moveaxis(coords, -1, 0)
+        s = u**2 + v**2
+        return np.stack([2 * u, 2 * v, pole * (s - 1)], axis=-1) / (1 + s)[..., None]
+
+    def coords_jacobian(points):
+        x, y, z = np.moveaxis(points, -1, 0)
+        w = 1 / (1 - pole * z)
+        J = np.zeros(points.shape[:-1] + (2, 3))
+        J[..., 0, 0] = J[..., 1, 1] = w
+        J[..., 0, 2] = pole * x * w**2
+        J[..., 1, 2] = pole * y * w**2
+        return J
+
+    def embedding_jacobian(coords):
+        u, v = np.moveaxis(coords, -1, 0)
+        s = u**2 + v**2
+        d = (1 + s)**2
+        J = np.empty(coords.shape[:-1] + (3, 2))
+        J[..., 0, 0] = 2 * (1 - u**2 + v**2) / d
+        J[..., 1, 1] = 2 * (1 + u**2 - v**2) / d
+        J[..., 0, 1] = J[..., 1, 0] = -4 * u * v / d
+        J[..., 2, 0] = pole * 4 * u / d
+        J[..., 2, 1] = pole * 4 * v / d
+        return J
+
+    def metric(coords):
+        # Round metric: 4 (du² + dv²) / (1 + u² + v²)²
+        s = np.sum(coords**2, axis=-1)
+        return (4 / (1 + s)**2)[..., None, None] * np.eye(2)
+
+    return Chart(name, lambda points: pole * points[..., 2] < 1 - eps,
+                 to_coords, from_coords, coords_jacobian, embedding_jacobian, metric)
+
+
+def _spherical_chart(name="spherical", eps=1e-9):
+    # (θ, φ): polar angle in (0, π), azimuth in (-π, π), cut along the half great circle y = 0, x < 0
+    def domain(points):
+        x, y, z = np.moveaxis(points, -1, 0)
+        return (np.abs(z) < 1 - eps) & ~((np.abs(y) < eps) & (x < 0))
+
+    def to_coords(points):
+        x, y, z = np.moveaxis(points, -1, 0)
+        return np.stack([np.arccos(np.clip(z, -1, 1)), np.arctan2(y, x)], axis=-1)
+
+    def from_coords(coords):
+        theta, phi = np.moveaxis(coords, -1, 0)
+        return np.stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)], axis=-1)
+
+    def coords_jacobian(points):
+        x, y, z = np.moveaxis(points, -1, 0)
+        r2 = x**2 + y**2
+        J = np.zeros(points.shape[:-1] + (2, 3))
+        J[..., 0, 2] = -1 / np.sqrt(1 - z**2)
+        J[..., 1, 0] = -y / r2
+        J[..., 1, 1] = x / r2
+        return J
+
+    def embedding_jacobian(coords):
+        theta, phi = np.moveaxis(coords, -1, 0)
+        J = np.zeros(coords.shape[:-1] + (3, 2))
+        J[..., 0, 0] = np.cos(theta) * np.cos(phi)
+        J[..., 1, 0] = np.cos(theta) * np.sin(phi)
+        J[..., 2, 0] = -np.sin(theta)
+        J[..., 0, 1] = -np.sin(theta) * np.sin(phi)
+        J[..., 1, 1] = np.sin(theta) * np.cos(phi)
+        return J
+
+    def metric(coords):
+        # dθ² + sin²θ dφ²
+        theta = coords[..., 0]
+        G = np.zeros(theta.shape + (2, 2))
+        G[..., 0, 0] = 1
+        G[..., 1, 1] = np.sin(theta)**2
+        return G
+
+    return Chart(name, domain, to_coords, from_coords, coords_jacobian, embedding_jacobian, metric)
+
+
+def sphere_atlas():
+    """S² with the stereographic charts from both poles and spherical coordinates."""
+    return Atlas([_stereographic_chart("north", 1), _stereographic_chart("south", -1), _spherical_chart()])
+
+
+def _orthographic_chart(name, center, angle):
+    # Projection onto the tangent plane at center, on the cap of angular radius angle < π/2
+    center = np.asarray(center, dtype=float)
+    center = center / np.linalg.norm(center)
+    helper = np.array([1.0, 0, 0]) if abs(center[0]) < 0.9 else np.array([0, 1.0, 0])
+    e1 = np.cross(center, helper)
+    e1 /= np.linalg.norm(e1)
+    e2 = np.cross(center, e1)
+    frame = np.stack([e1, e2])
+
+    def from_coords(coords):
+        w = np.sqrt(1 - np.sum(coords**2, axis=-1))
+        return coords @ frame + w[..., None] * center
+
+    def embedding_jacobian(coords):
+        w = np.sqrt(1 - np.sum(coords**2, axis=-1))
+        return frame.T - center[:, None] * (coords / w[..., None])[..., None, :]
+
+    def metric(coords):
+        # δ_ab + u_a u_b / (1 - |u|²)
+        w2 = 1 - np.sum(coords**2, axis=-1)
+        return np.eye(2) + coords[..., :, None] * coords[..., None, :] / w2[..., None, None]
+
+    return Chart(
+        name,
+        domain=lambda points: points @ center > np.cos(angle),
+        to_coords=lambda points: points @ frame.T,
+        from_coords=from_coords,
+        coords_jacobian=lambda points: np.broadcast_to(frame, points.shape[:-1] + frame.shape),
+        embedding_jacobian=embedding_jacobian,
+        metric=metric,
+    )
+
+
+def fibonacci_sphere(num):
+    """``num`` nearly evenly spread unit vectors, shape ``(num, 3)``."""
+    k = np.arange(num) + 0.5
+    z = 1 - 2 * k / num
+    phi = np.pi * (1 + 5**0.5) * k
+    r = np.sqrt(1 - z**2)
+    return np.stack([r * np.cos(phi), r * np.sin(phi), z], axis=-1)
+
+
+def random_sphere_points(num, seed=0):
+    # Uniform on S²: normalized Gaussian vectors, shape (num, 3)
+    points = np.random.default_rng(seed).normal(size=(num, 3))
+    return points / np.linalg.norm(points, axis=-1, keepdims=True)
+
+
+def sphere_cap_atlas(num=24, angle=None):
+    """S² covered by ``num`` orthographic charts on caps around Fibonacci points.
+
+    The default cap radius is 1.5 times the typical spacing of the centers,
+    enough for the caps to cover the sphere with generous overlaps.
+    """
+    if angle is None:
+        angle = min(1.5 * np.arccos(1 - 2 / num), 1.4)
+    centers = fibonacci_sphere(num)
+    return Atlas([_orthographic_chart(f"cap{k}", center, angle) for k, center in enumerate(centers)])
+
+
+ATLASES = {"sphere": sphere_atlas, "caps": sphere_cap_atlas}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that the charts' metrics agree on all overlaps.")
+    parser.add_argument("atlases", nargs="*", metavar="atlas", help=f"atlases to check: {', '.join(ATLASES)} (default all)")
+    parser.add_argument("--points", type=int, default=100_000, help="random sample points on the manifold")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="largest relative error accepted")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    unknown = set(args.atlases) - set(ATLASES)
+    if unknown:
+        parser.error(f"unknown atlas: {', '.join(sorted(unknown))}")
+
+    points = random_sphere_points(args.points, args.seed)
+    failed = False
+    for name in args.atlases or ATLASES:
+        atlas = ATLASES[name]()
+        if not atlas.covers(points).all():
+            print(f"{name}: {np.count_nonzero(~atlas.covers(points))} points outside every chart")
+            failed = True
+        report = atlas.metric_consistency(points)
+        worst = max(report.items(), key=lambda item: item[1]["max"])
+        checked = sum(entry["points"] for entry in report.values())
+        print(f"{name}: {len(atlas)} charts, {len(report)} overlaps, {checked} comparisons, "
+              f"max error {worst[1]['max']:.2e} ({worst[0][0]} -> {worst[0][1]})")
+        failed |= worst[1]["max"] > args.tolerance
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
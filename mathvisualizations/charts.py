@@ -0,0 +1,28 @@
+"""Coordinate charts and the maps between them."""
+
+import numpy as np
+
+# (center, radius) of the three charts drawn over the manifold in the atlas scenes
+ATLAS_CHARTS = (
+    (np.array([0.0, 0.0]), 1.2),
+    (np.array([1.2, 1.2]), 0.8),
+    (np.array([-1.2, -1.2]), 0.8),
+)
+
+
+def chart_grid(half_width=0.8, num=5):
+    """Square grid of chart coordinates, shape ``(num * num, 2)``, x-major."""
+    values = np.linspace(-half_width, half_width, num)
+    x, y = np.meshgrid(values, values, indexing="ij")
+    return np.stack([x.ravel(), y.ravel()], axis=-1)
+
+
+def curved_coordinates(r, theta):
+    # Polar-like coordinates stretched radially by (1 + 0.2r²), shape (..., 2)
+    scale = r * (1 + 0.2 * r**2)
+    return np.stack(np.broadcast_arrays(scale * np.cos(theta), scale * np.sin(theta)), axis=-1)
+
+
+def probability_coordinates(theta):
+    # Map parameters to probabilities coordinate-wise with the logistic function
+    return 1 / (1 + np.exp(-np.asarray(theta, dtype=float)))
@@ -0,0 +1,57 @@
+"""Affine connections given directly by their coefficients.
+
+Coefficients have shape ``(..., 2, 2, 2)`` indexed as
+``gamma[..., λ, μ, ν] = Γ^λ_μν``.  Connections induced by a metric are in
+:mod:`mathvisualizations.surfaces`.
+"""
+
+import numpy as np
+
+
+def example_connection_coefficients(x, y):
+    # A non-symmetric example connection, linear in the coordinates
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    gamma = np.empty(x.shape + (2, 2, 2))
+    gamma[..., 0, 0, 0] = 0.1 * x
+    gamma[..., 0, 0, 1] = 0.05 * y
+    gamma[..., 0, 1, 0] = 0.05 * y
+    gamma[..., 0, 1, 1] = -0.1 * x
+    gamma[..., 1, 0, 0] = -0.05 * y
+    gamma[..., 1, 0, 1] = 0.1 * x
+    gamma[..., 1, 1, 0] = 0.1 * x
+    gamma[..., 1, 1, 1] = 0.1 * y
+    return gamma
+
+
+def geodesic_flow(christoffel, position, velocity, t_max=1.0, steps=100):
+    """Integrate the geodesic equation ẍ^λ = -Γ^λ_μν ẋ^μ ẋ^ν with RK4.
+
+    ``christoffel(x, y)`` returns coefficients of shape ``(..., 2, 2, 2)``.
+    ``position`` and ``velocity`` have shape ``(..., 2)`` and every geodesic
+    is advanced at once; the result has shape ``(steps + 1, ..., 2)``.
+    """
+    def acceleration(x, dx):
+        gamma = christoffel(x[..., 0], x[..., 1])
+        return -np.einsum("...lmn,...m,...n->...l", gamma, dx, dx)
+
+    x, dx = np.broadcast_arrays(np.asarray(position, dtype=float), np.asarray(velocity, dtype=float))
+    x, dx = x.copy(), dx.copy()
+    h = t_max / steps
+    path = np.empty((steps + 1,) + x.shape)
+    path[0] = x
+    for i in range(steps):
+        k1x, k1v = dx, acceleration(x, dx)
+        k2x, k2v = dx + h/2 * k1v, acceleration(x + h/2 * k1x, dx + h/2 * k1v)
+        k3x, k3v = dx + h/2 * k2v, acceleration(x + h/2 * k2x, dx + h/2 * k2v)
+        k4x, k4v = dx + h * k3v, acceleration(x + h * k3x, dx + h * k3v)
+        x = x + h/6 * (k1x + 2*k2x + 2*k3x + k4x)
+        dx = dx + h/6 * (k1v + 2*k2v + 2*k3v + k4v)
+        path[i + 1] = x
+    return path
+
+
+def geodesic_spray(christoffel, point, num=16, speed=1.0, t_max=1.0, steps=100):
+    # Geodesics leaving ``point`` in ``num`` evenly spaced directions, shape (steps + 1, num, 2)
+    angles = np.linspace(0, 2*np.pi, num, endpoint=False)
+    velocity = speed * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    return geodesic_flow(christoffel, np.broadcast_to(point, velocity.shape), velocity, t_max, steps)
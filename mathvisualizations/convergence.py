@@ -0,0 +1,135 @@
+"""Cauchy moduli of long sequences in metric spaces.
+
+A sequence is Cauchy when its tail diameters ``diam{x_m : m ≥ n}`` go to
+zero, and its Cauchy modulus ``N(ε)`` is the first ``n`` whose tail
+diameter is below ``ε``.  Computing the diameters directly takes all
+``O(n²)`` pairwise distances.  Here they are bracketed in ``O(n)`` instead:
+with ``ρ_n`` the largest distance from the tail to the last term,
+``ρ_n ≤ diam ≤ 2ρ_n`` by the triangle inequality, and ``ρ_n`` is a suffix
+maximum of one distance per term.  Euclidean sequences also get the suffix
+bounding boxes of their coordinates, which are exact for real numbers.
+The moduli of many ``ε`` are then one ``np.searchsorted`` on the
+nonincreasing bounds.
+
+Only the computed terms are seen, so the last term has tail diameter zero
+and every ``ε`` is reached eventually; moduli close to the number of terms
+mean that convergence is not established.
+
+Distances take two arrays of terms and broadcast over the leading axes:
+:func:`euclidean_distance` for points ``(..., d)`` or numbers,
+:func:`fisher_rao_distance` for normal distributions ``(..., 2)`` and
+:func:`hausdorff_distance` for point-sampled sets ``(P, d)``.
+"""
+
+import numpy as np
+
+from .divergences import normal_fisher_rao
+from .set_distances import set_distances
+
+
+def euclidean_distance(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    if a.ndim and a.shape[-1:] == b.shape[-1:] and max(a.ndim, b.ndim) > 1:
+        return np.linalg.norm(a - b, axis=-1)
+    return np.abs(a - b)
+
+
+def fisher_rao_distance(a, b):
+    # Terms are (μ, σ) of normal distributions
+    return normal_fisher_rao(a, b)
+
+
+def hausdorff_distance(a, b):
+    """Hausdorff distances ``(n,)`` between the point sets ``a`` (shape ``(n, P, d)``) and the set ``b``.
+
+    Nearest neighbours come from KD-trees, see :mod:`~mathvisualizations.set_distances`.
+    """
+    return set_distances(a, b)
+
+
+DISTANCES = {
+    "euclidean": euclidean_distance,
+    "fisher_rao": fisher_rao_distance,
+    "hausdorff": hausdorff_distance,
+}
+
+
+def sequence_terms(sequence, num):
+    """The first ``num`` terms of ``sequence`` as one array.
+
+    ``sequence`` is a function of the index array ``np.arange(num)``, like
+    those of :mod:`~mathvisualizations.sequences`, or any iterable, e.g. a
+    generator of optimizer iterates.
+    """
+    if callable(sequence):
+        return np.asarray(sequence(np.arange(num)), dtype=float)
+    terms = []
+    for term in sequence:
+        if len(terms) == num:
+            break
+        terms.append(term)
+    return np.asarray(terms, dtype=float)
+
+
+def _suffix_max(values, axis=0):
+    return np.flip(np.maximum.accumulate(np.flip(values, axis), axis=axis), axis)
+
+
+def _suffix_min(values, axis=0):
+    return np.flip(np.minimum.accumulate(np.flip(values, axis), axis=axis), axis)
+
+
+def tail_radii(terms, distance=euclidean_distance, block=2**18):
+    """``ρ_n = max_{m ≥ n} d(x_m, x_last)`` for the terms ``(n, ...)``, shape ``(n,)``.
+
+    The distances are computed ``block`` terms at a time.
+    """
+    terms = np.asarray(terms, dtype=float)
+    last = terms[-1]
+    radii = np.concatenate([distance(terms[start:start + block], last) for start in range(0, len(terms), block)])
+    return _suffix_max(radii)
+
+
+def tail_diameter_bounds(terms, distance=euclidean_distance, block=2**18):
+    """Lower and upper bounds ``(n,)`` on the tail diameters of the terms ``(n, ...)``, both nonincreasing.
+
+    They are ``ρ_n`` and ``2ρ_n``; for :func:`euclidean_distance` they are
+    tightened by the suffix bounding boxes (longest side and diagonal) and
+    are exact for real numbers.
+    """
+    terms = np.asarray(terms, dtype=float)
+    radii = tail_radii(terms, distance, block)
+    lower, upper = radii, 2 * radii
+    if distance is euclidean_distance:
+        points = terms.reshape(len(terms), -1)
+        extent = _suffix_max(points) - _suffix_min(points)
+        if points.shape[1] == 1:
+            return extent[:, 0], extent[:, 0]
+        lower = np.maximum(lower, extent.max(axis=-1))
+        upper = np.minimum(upper, np.linalg.norm(extent, axis=-1))
+    return lower, upper
+
+
+def cauchy_modulus(diameters, eps):
+    """``N(ε)``: the first index whose tail diameter is below ``eps``, for every ``eps``.
+
+    ``diameters`` are nonincreasing tail diameters (or bounds on them), so
+    ``N(ε)`` is the number of them at or above ``ε``.
+    """
+    diameters = np.asarray(diameters, dtype=float)
+    return np.searchsorted(-diameters, -np.asarray(eps, dtype=float), side="right")
+
+
+def convergence_profile(sequence, num, eps, distance="euclidean"):
+    """Cauchy moduli of the first ``num`` terms of ``sequence`` for the tolerances ``eps``.
+
+    ``distance`` is a name in :data:`DISTANCES` or a function.  Returns a
+    dict with the tail diameter bounds ``"lower"`` and ``"upper"``
+    ``(num,)``, and ``"modulus"``: the bracket ``(N_low, N_high)`` of each
+    ``N(ε)``, shape ``(len(eps), 2)``.
+    """
+    distance = DISTANCES.get(distance, distance)
+    terms = sequence_terms(sequence, num)
+    lower, upper = tail_diameter_bounds(terms, distance)
+    modulus = np.stack([cauchy_modulus(lower, eps), cauchy_modulus(upper, eps)], axis=-1)
+    return {"lower": lower, "upper": upper, "modulus": modulus}
@@ -0,0 +1,198 @@
+"""Versioned ``.npy`` datasets that open as read-only memory maps.
+
+A dataset is a directory ``<root>/<name>/v001/`` holding one ``.npy`` file
+per array and a ``manifest.json`` with their shapes, dtypes and the
+parameters that produced them.  Readers get ``np.load(mmap_mode='r')``
+views, so any number of processes share one copy in the page cache and
+nothing is recomputed::
+
+    python -m mathvisualizations.datasets torus_manifold affine_connection_3d
+    python -m mathvisualizations.datasets torus_manifold --set R=3 --set resolution=400
+    python -m mathvisualizations.datasets torus_manifold metric_tensor_3d --set torus_manifold.R=3
+
+    arrays, manifest = open_dataset("torus_manifold")
+    arrays["points"][::10, ::10]      # only these pages are read
+"""
+
+import argparse
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_ROOT = "./media/datasets"
+MANIFEST = "manifest.json"
+
+
+class DatasetWriter:
+    """Write the arrays of one dataset version.
+
+    Arrays go to a temporary directory that is renamed to the next free
+    ``vNNN`` on exit, so readers never see a partial version::
+
+        with DatasetWriter("torus_sweep", params={"R": [1, 2, 3]}) as writer:
+            points = writer.allocate("points", (3, 200, 200, 3))
+            for i, R in enumerate([1, 2, 3]):
+                points[i] = torus_surface(u, v, R=R)
+            writer.add("u", u)
+
+    :meth:`allocate` returns a writable memory map, for arrays larger than
+    memory that are filled piece by piece.
+    """
+
+    def __init__(self, name, params=None, root=DEFAULT_ROOT):
+        self.name = name
+        self.params = params or {}
+        self.directory = Path(root) / name
+        self.arrays = {}
+        self.path = None
+
+    def __enter__(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.tmp = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.directory))
+        return self
+
+    def allocate(self, key, shape, dtype=np.float64):
+        array = np.lib.format.open_memmap(self.tmp / f"{key}.npy", mode="w+", dtype=dtype, shape=shape)
+        self.arrays[key] = array
+        return array
+
+    def add(self, key, array):
+        array = np.asarray(array)
+        np.save(self.tmp / f"{key}.npy", array)
+        self.arrays[key] = array
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            shutil.rmtree(self.tmp, ignore_errors=True)
+            return False
+
+        manifest = {
+            "name": self.name,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "params": self.params,
+            "arrays": {
+                key: {"file": f"{key}.npy", "shape": list(array.shape), "dtype": array.dtype.str}
+                for key, array in self.arrays.items()
+            },
+        }
+        for array in self.arrays.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+        self.arrays.clear()
+
+        while True:
+            version = _next_version(self.directory)
+            manifest["version"] = version
+            (self.tmp / MANIFEST).write_text(json.dumps(manifest, indent=2, default=_json_default))
+            path = self.directory / f"v{version:03d}"
+            try:
+                # Fails if another writer took this version first
+                os.rename(self.tmp, path)
+            except OSError:
+                if not path.exists():
+                    raise
+                continue
+            self.path = path
+            return False
+
+
+def _next_version(directory):
+    # After every vNNN directory, also those left without a manifest by a
+    # crashed writer, so a taken name is never retried
+    taken = [int(path.name[1:]) for path in directory.iterdir() if path.name.startswith("v") and path.name[1:].isdigit()]
+    return max(taken, default=0) + 1
+
+
+def _json_default(value):
+    # NumPy scalars and arrays in the parameters
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def export_dataset(name, arrays, params=None, root=DEFAULT_ROOT):
+    """Write ``arrays`` (a dict) as the next version of ``name``; returns its directory."""
+    with DatasetWriter(name, params, root) as writer:
+        for key, array in arrays.items():
+            writer.add(key, array)
+    return writer.path
+
+
+def list_versions(name, root=DEFAULT_ROOT):
+    directory = Path(root) / name
+    if not directory.is_dir():
+        return []
+    return sorted(
+        int(path.name[1:]) for path in directory.iterdir()
+        if path.name.startswith("v") and path.name[1:].isdigit() and (path / MANIFEST).exists()
+    )
+
+
+def latest_version(name, root=DEFAULT_ROOT):
+    versions = list_versions(name, root)
+    return versions[-1] if versions else None
+
+
+def open_dataset(name, version=None, root=DEFAULT_ROOT):
+    """Memory-map every array of a dataset version (the latest by default).
+
+    Returns ``(arrays, manifest)`` where ``arrays`` maps keys to read-only
+    ``np.memmap`` views.
+    """
+    if version is None:
+        version = latest_version(name, root)
+        if version is None:
+            raise FileNotFoundError(f"no dataset named {name!r} in {root}")
+    path = Path(root) / name / f"v{version:03d}"
+    manifest = json.loads((path / MANIFEST).read_text())
+    arrays = {key: np.load(path / entry["file"], mmap_mode="r") for key, entry in manifest["arrays"].items()}
+    return arrays, manifest
+
+
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def main(argv=None):
+    from .scene_data import SCENE_DATASETS
+
+    parser = argparse.ArgumentParser(description="Export the arrays behind scenes as memory-mappable datasets.")
+    parser.add_argument("datasets", nargs="+", choices=sorted(SCENE_DATASETS))
+    parser.add_argument("--set", action="append", default=[], metavar="[NAME.]KEY=VALUE",
+                        help="override a parameter of every dataset, e.g. resolution=400, "
+                             "or of one, e.g. torus_manifold.R=3")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    args = parser.parse_args(argv)
+
+    # Check every override against the producers before anything is exported
+    params = {name: {} for name in args.datasets}
+    for item in args.set:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            parser.error(f"--set {item!r} is not KEY=VALUE or NAME.KEY=VALUE")
+        name, dot, key = key.rpartition(".")
+        names = [name] if dot else args.datasets
+        if dot and name not in params:
+            parser.error(f"--set {item!r}: {name!r} is not one of the datasets being exported")
+        for name in names:
+            if key not in inspect.signature(SCENE_DATASETS[name]).parameters:
+                parser.error(f"--set {item!r}: {name} has no parameter {key!r}")
+            params[name][key] = _parse_value(value)
+
+    for name in args.datasets:
+        arrays, produced = SCENE_DATASETS[name](**params[name])
+        print(export_dataset(name, arrays, produced, args.root))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Densities of many distributions of one family on a common grid.
+
+:func:`pdf_matrix` evaluates K distributions (parameters of shape ``(K, 2)``,
+as in :mod:`~mathvisualizations.divergences`) at N points in one
+broadcasted call and returns a ``(K, N)`` matrix, one row per distribution.
+Densities are computed in log space, which keeps the tails of narrow
+distributions finite.  :func:`graph_coords` turns such rows into the
+``(K, N, 2)`` coordinates that :func:`~mathvisualizations.mobjects.polylines`
+and :func:`~mathvisualizations.mobjects.graphs` draw.
+"""
+
+import numpy as np
+from scipy.special import betaln, gammaln, xlog1py, xlogy
+
+
+def normal_log_pdf(x, mu, sigma):
+    return -0.5 * ((x - mu) / sigma)**2 - np.log(sigma) - 0.5 * np.log(2 * np.pi)
+
+
+def gamma_log_pdf(x, shape, scale):
+    # Shape k and scale θ; zero density for x < 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pdf = xlogy(shape - 1, x) - x / scale - gammaln(shape) - shape * np.log(scale)
+    return np.where(x >= 0, log_pdf, -np.inf)
+
+
+def beta_log_pdf(x, a, b):
+    # Zero density outside [0, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pdf = xlogy(a - 1, x) + xlog1py(b - 1, -x) - betaln(a, b)
+    return np.where((x >= 0) & (x <= 1), log_pdf, -np.inf)
+
+
+LOG_PDFS = {
+    "normal": normal_log_pdf,
+    "gamma": gamma_log_pdf,
+    "beta": beta_log_pdf,
+}
+
+
+def pdf_matrix(family, params, x, log=False):
+    """Densities of the distributions ``params`` (shape ``(K, 2)``) at ``x`` (shape ``(N,)``).
+
+    Returns shape ``(K, N)``; a single parameter pair ``(2,)`` gives ``(N,)``.
+    With ``log=True`` the log densities are returned.
+    """
+    params = np.asarray(params, dtype=float)
+    x = np.asarray(x, dtype=float)
+    log_pdf = LOG_PDFS[family](x, params[..., 0, None], params[..., 1, None])
+    return log_pdf if log else np.exp(log_pdf)
+
+
+def graph_coords(x, y):
+    """Points ``(x, y)`` of the graphs of the rows of ``y`` (shape ``(K, N)``), shape ``(K, N, 2)``."""
+    return np.stack(np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float)), axis=-1)
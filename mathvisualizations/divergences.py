@@ -0,0 +1,209 @@
+"""Divergences and distances between the members of a distribution family.
+
+Parameters have the coordinate axis last: normal ``(μ, σ)``, gamma
+``(shape k, scale θ)`` and beta ``(a, b)``, as in ``scipy.stats``.  The
+closed forms broadcast over their arguments, and :func:`divergence_matrix`
+fills pairwise ``(N, M)`` matrices a block of rows at a time, so the
+temporaries stay bounded for N in the tens of thousands and the result can
+be a memory map.  Families without closed forms are given by a density
+``pdf(x, params)`` and a grid ``x``; their divergences are trapezoidal
+quadratures that reduce to matrix products of the tabulated densities.
+The M column densities stay tabulated, one ``(M, len(x))`` table per
+quantity the divergence needs (three for the symmetric KL, one
+otherwise), while the rows are tabulated per block.
+
+``kind`` is one of
+
+- ``"kl"``: ``KL(p || q) = ∫ p log(p / q)``
+- ``"symmetric_kl"``: ``KL(p || q) + KL(q || p)`` (Jeffreys divergence)
+- ``"hellinger"``: ``sqrt(1 - BC)`` with the Bhattacharyya coefficient ``BC = ∫ sqrt(p q)``
+- ``"bhattacharyya"``: ``-log BC``
+- ``"fisher_rao"``: geodesic distance of the Fisher metric (normal family only)
+"""
+
+import numpy as np
+from scipy.special import betaln, digamma, gammaln
+
+KINDS = ("kl", "symmetric_kl", "hellinger", "bhattacharyya", "fisher_rao")
+
+# Default number of float64 temporaries per block, 32 MB each
+BLOCK_ELEMENTS = 2**22
+
+
+def _split(params):
+    params = np.asarray(params, dtype=float)
+    return params[..., 0], params[..., 1]
+
+
+def normal_kl(p, q):
+    (m1, s1), (m2, s2) = _split(p), _split(q)
+    return np.log(s2 / s1) + (s1**2 + (m1 - m2)**2) / (2 * s2**2) - 0.5
+
+
+def normal_log_bc(p, q):
+    # log ∫ sqrt(p q) = -(m₁ - m₂)²/(4(σ₁² + σ₂²)) - log((σ₁² + σ₂²)/(2σ₁σ₂))/2
+    (m1, s1), (m2, s2) = _split(p), _split(q)
+    v = s1**2 + s2**2
+    return -(m1 - m2)**2 / (4 * v) - 0.5 * np.log(v / (2 * s1 * s2))
+
+
+def normal_fisher_rao(p, q):
+    """Fisher-Rao distance; ``(μ/√2, σ)`` is a hyperbolic half-plane scaled by √2."""
+    (m1, s1), (m2, s2) = _split(p), _split(q)
+    return np.sqrt(2) * np.arccosh(1 + ((m1 - m2)**2 / 2 + (s1 - s2)**2) / (2 * s1 * s2))
+
+
+def gamma_kl(p, q):
+    (k1, t1), (k2, t2) = _split(p), _split(q)
+    return (
+        (k1 - k2) * digamma(k1) - gammaln(k1) + gammaln(k2)
+        + k2 * (np.log(t2) - np.log(t1)) + k1 * (t1 - t2) / t2
+    )
+
+
+def gamma_log_bc(p, q):
+    # Exponential family: log BC = A(midpoint of natural parameters) - mean of A
+    (k1, t1), (k2, t2) = _split(p), _split(q)
+    k, t = (k1 + k2) / 2, 2 / (1 / t1 + 1 / t2)
+    log_partition = lambda k, t: gammaln(k) + k * np.log(t)
+    return log_partition(k, t) - (log_partition(k1, t1) + log_partition(k2, t2)) / 2
+
+
+def beta_kl(p, q):
+    (a1, b1), (a2, b2) = _split(p), _split(q)
+    return (
+        betaln(a2, b2) - betaln(a1, b1)
+        + (a1 - a2) * digamma(a1) + (b1 - b2) * digamma(b1)
+        + (a2 - a1 + b2 - b1) * digamma(a1 + b1)
+    )
+
+
+def beta_log_bc(p, q):
+    (a1, b1), (a2, b2) = _split(p), _split(q)
+    return betaln((a1 + a2) / 2, (b1 + b2) / 2) - (betaln(a1, b1) + betaln(a2, b2)) / 2
+
+
+# Closed forms: (KL, log Bhattacharyya coefficient, Fisher-Rao distance or None)
+CLOSED_FORMS = {
+    "normal": (normal_kl, normal_log_bc, normal_fisher_rao),
+    "gamma": (gamma_kl, gamma_log_bc, None),
+    "beta": (beta_kl, beta_log_bc, None),
+}
+
+
+def divergence(kind, family, p, q):
+    """``kind`` between the ``family`` members with parameters ``p`` and ``q``, broadcasting."""
+    kl, log_bc, fisher_rao = CLOSED_FORMS[family]
+    if kind == "kl":
+        return kl(p, q)
+    if kind == "symmetric_kl":
+        return kl(p, q) + kl(q, p)
+    if kind == "hellinger":
+        return np.sqrt(np.maximum(-np.expm1(log_bc(p, q)), 0))
+    if kind == "bhattacharyya":
+        return -log_bc(p, q)
+    if kind == "fisher_rao" and fisher_rao is not None:
+        return fisher_rao(p, q)
+    raise ValueError(f"no closed form for {kind!r} in the {family} family")
+
+
+# Tables of the densities each side of a quadrature needs: rows, then columns
+_TABLES = {
+    "kl": (("weighted", "entropy_term"), ("log_density",)),
+    "symmetric_kl": (("weighted", "log_density", "entropy_term"), ("weighted", "log_density", "entropy_term")),
+    "hellinger": (("root",), ("root",)),
+    "bhattacharyya": (("root",), ("root",)),
+}
+
+
+def _trapezoid_weights(x):
+    # Half of the intervals on either side of each grid point
+    weights = np.diff(x, prepend=x[0], append=x[-1])
+    return (weights[:-1] + weights[1:]) / 2
+
+
+def _tabulate(pdf, x, params, names, block_elements=BLOCK_ELEMENTS):
+    # The tables ``names`` of the densities ``params`` on the grid x, filled a
+    # block of densities at a time
+    x = np.asarray(x, dtype=float)
+    weights = _trapezoid_weights(x)
+    tables = {
+        name: np.empty(len(params) if name == "entropy_term" else (len(params), len(x))) for name in names
+    }
+    size = max(block_elements // len(x), 1)
+    for start in range(0, len(params), size):
+        stop = min(start + size, len(params))
+        density = pdf(x, params[start:stop, None, :])
+        weighted = density * weights
+        log_density = np.log(np.maximum(density, np.finfo(float).tiny))
+        for name, table in (("weighted", weighted), ("log_density", log_density)):
+            if name in tables:
+                tables[name][start:stop] = table
+        if "entropy_term" in tables:
+            tables["entropy_term"][start:stop] = np.sum(weighted * log_density, axis=-1)
+        if "root" in tables:
+            tables["root"][start:stop] = np.sqrt(weighted)
+    return tables
+
+
+def _quadrature_block(kind, rows, columns):
+    if kind == "kl":
+        return rows["entropy_term"][:, None] - rows["weighted"] @ columns["log_density"].T
+    if kind == "symmetric_kl":
+        forward = rows["entropy_term"][:, None] - rows["weighted"] @ columns["log_density"].T
+        backward = columns["entropy_term"][None, :] - rows["log_density"] @ columns["weighted"].T
+        return forward + backward
+    bc = np.minimum(rows["root"] @ columns["root"].T, 1)
+    if kind == "hellinger":
+        return np.sqrt(1 - bc)
+    return -np.log(bc)
+
+
+def divergence_blocks(kind, family, params, other=None, x=None, block_elements=BLOCK_ELEMENTS):
+    """Yield ``(start, stop, block)``: rows ``start:stop`` of the pairwise matrix of ``kind``.
+
+    ``family`` is a name in :data:`CLOSED_FORMS`, or a density
+    ``pdf(x, params)`` broadcasting to ``(..., len(x))`` integrated on the
+    grid ``x``.  ``params`` (shape ``(N, k)``) index the rows and ``other``
+    (shape ``(M, k)``, default ``params``) the columns.  Each block holds
+    about ``block_elements`` numbers.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"unknown divergence {kind!r}, expected one of {', '.join(KINDS)}")
+    params = np.asarray(params, dtype=float)
+    other = params if other is None else np.asarray(other, dtype=float)
+    if callable(family):
+        if x is None:
+            raise ValueError("a density family needs the quadrature grid x")
+        if kind not in _TABLES:
+            raise ValueError(f"{kind!r} has no quadrature; Fisher-Rao distances need a closed form")
+        # Only the column tables stay resident; the rows are tabulated per block
+        row_tables, column_tables = _TABLES[kind]
+        columns = _tabulate(family, x, other, column_tables, block_elements)
+        size = max(block_elements // max(len(other), len(x)), 1)
+        for start in range(0, len(params), size):
+            stop = min(start + size, len(params))
+            rows = _tabulate(family, x, params[start:stop], row_tables, block_elements)
+            yield start, stop, _quadrature_block(kind, rows, columns)
+        return
+    size = max(block_elements // max(len(other), 1), 1)
+    for start in range(0, len(params), size):
+        stop = min(start + size, len(params))
+        yield start, stop, divergence(kind, family, params[start:stop, None, :], other[None, :, :])
+
+
+def divergence_matrix(kind, family, params, other=None, x=None, out=None, block_elements=BLOCK_ELEMENTS):
+    """Pairwise ``(N, M)`` matrix of ``kind``; see :func:`divergence_blocks` for the arguments.
+
+    ``out`` may be any writable ``(N, M)`` array, e.g. a memory map from
+    :meth:`~mathvisualizations.datasets.DatasetWriter.allocate`; it is
+    filled block by block.
+    """
+    params = np.asarray(params, dtype=float)
+    rows = len(params)
+    columns = rows if other is None else len(other)
+    if out is None:
+        out = np.empty((rows, columns))
+    for start, stop, block in divergence_blocks(kind, family, params, other, x, block_elements):
+        out[start:stop] = block
+    return out
@@ -0,0 +1,279 @@
+"""Exponential families in natural and expectation coordinates.
+
+An exponential family ``p(x | η) = h(x) exp(η·T(x) - ψ(η))`` is determined,
+as a manifold, by its log-partition function ψ.  Its gradient is the
+expectation map ``μ = ∇ψ(η) = E[T(x)]``, its Hessian is the Fisher metric in
+natural coordinates, and the Bregman divergence of ψ is the KL divergence.
+The inverse map ``μ -> η`` is found by Newton's method on all points at
+once.  The manifold is dually flat: e-geodesics are straight lines in η and
+m-geodesics straight lines in μ.  Parameters have the coordinate axis
+last: ``η`` and ``μ`` have shape ``(..., d)`` and metrics ``(..., d, d)``.
+"""
+
+import numpy as np
+
+_EPS = np.finfo(float).eps
+
+
+class ExponentialFamily:
+    """The family with log-partition ``log_partition(eta)`` (shape ``(...)``).
+
+    ``gradient`` (``(..., d)``) and ``hessian`` (``(..., d, d)``) of ψ are
+    found by central differences unless given.  ``domain(eta)`` is True on
+    the natural parameter space and ``start`` is a point of it, where the
+    Newton iterations of :meth:`natural` begin by default.
+    ``mean_domain(mu)`` is True on the open expectation parameter space.
+    """
+
+    def __init__(self, name, log_partition, gradient=None, hessian=None, domain=None, start=None, step=1e-5,
+                 mean_domain=None):
+        self.name = name
+        self.log_partition = log_partition
+        self._gradient = gradient
+        self._hessian = hessian
+        self.domain = domain
+        self.mean_domain = mean_domain
+        self.step = step
+        self.start = np.asarray(start, dtype=float)
+        self.dim = self.start.size
+
+    def contains(self, eta):
+        eta = np.asarray(eta, dtype=float)
+        if self.domain is None:
+            return np.ones(eta.shape[:-1], dtype=bool)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.domain(eta)
+
+    def contains_mean(self, mu):
+        mu = np.asarray(mu, dtype=float)
+        if self.mean_domain is None:
+            return np.isfinite(mu).all(axis=-1)
+        with np.errstate(invalid="ignore"):
+            return self.mean_domain(mu)
+
+    def expectation(self, eta):
+        """Expectation parameters ``μ = ∇ψ(η)``."""
+        eta = np.asarray(eta, dtype=float)
+        if self._gradient is not None:
+            return self._gradient(eta)
+        offsets = self.step * np.eye(self.dim)
+        return np.stack(
+            [(self.log_partition(eta + h) - self.log_partition(eta - h)) / (2 * self.step) for h in offsets],
+            axis=-1,
+        )
+
+    def fisher_metric(self, eta):
+        """Fisher metric in natural coordinates, ``∇²ψ(η)``."""
+        eta = np.asarray(eta, dtype=float)
+        if self._hessian is not None:
+            return self._hessian(eta)
+        offsets = self.step * np.eye(self.dim)
+        columns = [(self.expectation(eta + h) - self.expectation(eta - h)) / (2 * self.step) for h in offsets]
+        G = np.stack(columns, axis=-1)
+        return (G + np.swapaxes(G, -1, -2)) / 2
+
+    def natural(self, mu, eta=None, tol=1e-10, max_iter=100):
+        """Natural parameters with ``∇ψ(η) = mu``, by damped Newton iterations on all points together.
+
+        Each step minimizes the convex function ``ψ(η) - η·μ`` along the
+        Newton direction, halving the step until it stays in the domain and
+        decreases that function, so the iterations cannot leave the natural
+        parameter space.  A point is done when its Newton step is below
+        ``tol`` (relative to ``η``), its residual is down to rounding errors,
+        or no step improves it.  Points without a solution are NaN: ``mu``
+        outside the open expectation parameter space, including its boundary
+        where η would be infinite, and points whose iterations run out.
+        Starting from nearby ``eta`` (e.g. the previous frame of a sweep)
+        saves most of the iterations.
+        """
+        mu = np.asarray(mu, dtype=float)
+        shape = mu.shape
+        mu = mu.reshape(-1, self.dim)
+        eta = np.array(np.broadcast_to(self.start if eta is None else eta, shape), dtype=float).reshape(-1, self.dim)
+        failed = ~self.contains_mean(mu)
+        active = np.flatnonzero(~failed)
+        for _ in range(max_iter):
+            residual = self.expectation(eta[active]) - mu[active]
+            G = self.fisher_metric(eta[active])
+            # Divergent points (no solution) drop out
+            finite = np.isfinite(residual).all(axis=-1) & np.isfinite(G).all(axis=(-2, -1))
+            finite[finite] = np.linalg.det(G[finite]) > 0
+            failed[active[~finite]] = True
+            active, residual, G = active[finite], residual[finite], G[finite]
+            direction = np.linalg.solve(G, residual[..., None])[..., 0]
+            # The last step is taken as well, within the tolerance.  With a nearly
+            # singular metric the steps stall at the size of rounding errors
+            converged = (
+                (np.linalg.norm(direction, axis=-1) <= tol * (1 + np.linalg.norm(eta[active], axis=-1)))
+                | (np.linalg.norm(residual, axis=-1) <= 4 * _EPS * (1 + np.linalg.norm(mu[active], axis=-1)))
+            )
+            eta[active[converged]] -= direction[converged]
+            active, residual, direction = active[~converged], residual[~converged], direction[~converged]
+            if not len(active):
+                break
+            current = self._objective(eta[active], mu[active])
+            slope = np.sum(residual * direction, axis=-1)
+            size = np.linalg.norm(residual, axis=-1)
+            t = np.ones(len(active))
+            pending = np.arange(len(active))
+            for _ in range(40):
+                index = active[pending]
+                candidate = eta[index] - t[pending, None] * direction[pending]
+                with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+                    value = self._objective(candidate, mu[index])
+                    new_size = np.linalg.norm(self.expectation(candidate) - mu[index], axis=-1)
+                # Sufficient decrease of ψ(η) - η·μ, or of the residual once the
+                # former is lost in rounding errors near the solution
+                decrease = (
+                    (value <= current[pending] - 1e-4 * t[pending] * slope[pending])
+                    | (new_size <= (1 - 1e-4 * t[pending]) * size[pending])
+                )
+                accepted = self.contains(candidate) & decrease
+                eta[index[accepted]] = candidate[accepted]
+                pending = pending[~accepted]
+                if not len(pending):
+                    break
+                t[pending] /= 2
+            # No step decreases either: the residual is down to rounding errors
+            active = np.delete(active, pending)
+        # Still moving after max_iter
+        failed[active] = True
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            error = np.linalg.norm(self.expectation(eta) - mu, axis=-1)
+        eta[failed | ~(error <= np.sqrt(tol) * (1 + np.linalg.norm(mu, axis=-1)))] = np.nan
+        return eta.reshape(shape)
+
+    def _objective(self, eta, mu):
+        # ψ(η) - η·μ, minimized where ∇ψ(η) = μ
+        return self.log_partition(eta) - np.sum(eta * mu, axis=-1)
+
+    def dual_potential(self, mu, eta=None):
+        """Legendre dual ``φ(μ) = η·μ - ψ(η)``, the negative entropy up to the base measure.
+
+        ``eta`` are the natural parameters of ``mu`` if already known.
+        """
+        mu = np.asarray(mu, dtype=float)
+        if eta is None:
+            eta = self.natural(mu)
+        return np.sum(eta * mu, axis=-1) - self.log_partition(eta)
+
+    def bregman(self, eta1, eta2):
+        """Bregman divergence ``ψ(η₁) - ψ(η₂) - ∇ψ(η₂)·(η₁ - η₂)``."""
+        eta1, eta2 = np.asarray(eta1, dtype=float), np.asarray(eta2, dtype=float)
+        return (
+            self.log_partition(eta1) - self.log_partition(eta2)
+            - np.sum(self.expectation(eta2) * (eta1 - eta2), axis=-1)
+        )
+
+    def kl_divergence(self, eta_p, eta_q):
+        """``KL(p || q)`` between the members with natural parameters ``eta_p`` and ``eta_q``."""
+        return self.bregman(eta_q, eta_p)
+
+    def e_geodesic(self, eta_start, eta_end, num=32):
+        """e-geodesics from ``eta_start`` to ``eta_end``: straight lines in natural parameters.
+
+        Endpoints of shape ``(..., d)`` give ``(eta, mu)`` with shape
+        ``(..., num, d)``, the geodesics in both coordinate systems.
+        """
+        eta = _segments(eta_start, eta_end, num)
+        return eta, self.expectation(eta)
+
+    def m_geodesic(self, eta_start, eta_end, num=32):
+        """m-geodesics from ``eta_start`` to ``eta_end``: straight lines in expectation parameters.
+
+        Returns ``(eta, mu)`` like :meth:`e_geodesic`.  The natural
+        parameters are solved for starting from the e-geodesic between the
+        same endpoints, which is close by.
+        """
+        mu = _segments(self.expectation(eta_start), self.expectation(eta_end), num)
+        return self.natural(mu, eta=_segments(eta_start, eta_end, num)), mu
+
+    def pythagorean_defect(self, eta_p, eta_q, eta_r):
+        """``KL(p || r) - KL(p || q) - KL(q || r)``.
+
+        It equals ``(μ_p - μ_q)·(η_q - η_r)`` and vanishes exactly when the
+        m-geodesic from p to q meets the e-geodesic from q to r at a right
+        angle, the generalized Pythagorean theorem of dually flat manifolds.
+        """
+        return (
+            self.kl_divergence(eta_p, eta_r) - self.kl_divergence(eta_p, eta_q) - self.kl_divergence(eta_q, eta_r)
+        )
+
+    def __repr__(self):
+        return f"ExponentialFamily({self.name!r})"
+
+
+def _segments(start, end, num):
+    # Straight lines from start to end, shape (..., num, d)
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    t = np.linspace(0, 1, num)[:, None]
+    return start[..., None, :] + t * (end - start)[..., None, :]
+
+
+def _normal_log_partition(eta):
+    # ψ(η) = -η₁²/(4η₂) - log(-2η₂)/2 + log(2π)/2
+    eta1, eta2 = eta[..., 0], eta[..., 1]
+    return -eta1**2 / (4 * eta2) - 0.5 * np.log(-2 * eta2) + 0.5 * np.log(2 * np.pi)
+
+
+def _normal_expectation(eta):
+    # (E[x], E[x²]) = (m, m² + σ²)
+    eta1, eta2 = eta[..., 0], eta[..., 1]
+    mean = -eta1 / (2 * eta2)
+    return np.stack([mean, mean**2 - 1 / (2 * eta2)], axis=-1)
+
+
+def _normal_fisher_metric(eta):
+    # Covariance of T(x) = (x, x²)
+    mean, variance = normal_from_natural(eta)
+    G = np.empty(mean.shape + (2, 2))
+    G[..., 0, 0] = variance
+    G[..., 0, 1] = G[..., 1, 0] = 2 * mean * variance
+    G[..., 1, 1] = 4 * mean**2 * variance + 2 * variance**2
+    return G
+
+
+def normal_natural(mean, variance):
+    """Natural parameters ``(m/σ², -1/(2σ²))`` of N(m, σ²)."""
+    mean, variance = np.broadcast_arrays(np.asarray(mean, dtype=float), np.asarray(variance, dtype=float))
+    return np.stack([mean / variance, -0.5 / variance], axis=-1)
+
+
+def normal_from_natural(eta):
+    """Mean and variance of the normal distribution with natural parameters ``eta``."""
+    eta = np.asarray(eta, dtype=float)
+    variance = -0.5 / eta[..., 1]
+    return eta[..., 0] * variance, variance
+
+
+# N(m, σ²) with sufficient statistic T(x) = (x, x²); η₂ < 0
+normal_family = ExponentialFamily(
+    "normal",
+    _normal_log_partition,
+    gradient=_normal_expectation,
+    hessian=_normal_fisher_metric,
+    domain=lambda eta: eta[..., 1] < 0,
+    start=[0.0, -0.5],
+    # E[x²] > E[x]²: positive variance
+    mean_domain=lambda mu: mu[..., 1] > mu[..., 0]**2,
+)
+
+# Poisson(λ) with η = log λ
+poisson_family = ExponentialFamily(
+    "poisson",
+    lambda eta: np.exp(eta[..., 0]),
+    gradient=np.exp,
+    hessian=lambda eta: np.exp(eta)[..., None],
+    start=[0.0],
+    mean_domain=lambda mu: mu[..., 0] > 0,
+)
+
+# Bernoulli(p) with η = log(p / (1 - p))
+bernoulli_family = ExponentialFamily(
+    "bernoulli",
+    lambda eta: np.logaddexp(0, eta[..., 0]),
+    gradient=lambda eta: 1 / (1 + np.exp(-eta)),
+    hessian=lambda eta: (np.exp(-np.logaddexp(0, eta) - np.logaddexp(0, -eta)))[..., None],
+    start=[0.0],
+    mean_domain=lambda mu: (mu[..., 0] > 0) & (mu[..., 0] < 1),
+)
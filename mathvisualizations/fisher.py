@@ -0,0 +1,53 @@
+"""Fisher information geometry of the normal family N(μ, σ²).
+
+All functions broadcast over their arguments, so a single call handles one
+distribution or a whole grid of them.
+"""
+
+import numpy as np
+
+from . import hyperbolic, metrics
+
+# Fisher distance of a small displacement: ds² = δθ^T G(θ) δθ
+fisher_distance = metrics.line_element
+
+
+def normal_pdf(x, mu, sigma):
+    return (1 / (sigma * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mu) / sigma)**2)
+
+
+def fisher_metric_normal(mu, sigma):
+    """Fisher metric of N(μ, σ²) in (μ, σ) coordinates, shape ``(..., 2, 2)``.
+
+    g_11 = 1/σ² (information about μ), g_22 = 2/σ² (information about σ),
+    g_12 = g_21 = 0.
+    """
+    mu, sigma = np.broadcast_arrays(np.asarray(mu, dtype=float), np.asarray(sigma, dtype=float))
+    G = np.zeros(sigma.shape + (2, 2))
+    G[..., 0, 0] = 1 / sigma**2
+    G[..., 1, 1] = 2 / sigma**2
+    return G
+
+
+def normal_geodesic(start, end, num=32):
+    """``num`` points ``(μ, σ)`` along the Fisher-Rao geodesic from ``start`` to ``end``.
+
+    With ``z = μ/√2 + iσ`` the Fisher metric is twice that of the hyperbolic
+    upper half-plane, so the geodesic is found in the Poincaré disk (via the
+    Cayley map) at constant speed.  Shape ``(..., num, 2)``.
+    """
+    z1, z2 = (p[..., 0] / np.sqrt(2) + 1j * p[..., 1] for p in (np.asarray(start), np.asarray(end)))
+    w = hyperbolic.geodesic((z1 - 1j) / (z1 + 1j), (z2 - 1j) / (z2 + 1j), num)
+    z = 1j * (1 + w) / (1 - w)
+    return np.stack([np.sqrt(2) * z.real, z.imag], axis=-1)
+
+
+def path_length(points, metric=fisher_metric_normal):
+    """Fisher length of the polyline ``points`` (shape ``(N, 2)``) in (μ, σ)."""
+    return metrics.path_length(points, metric)
+
+
+def peak_density_surface(mu, sigma):
+    # Lift (μ, σ) to the height of the density at its mean, 1/(σ√(2π))
+    height = normal_pdf(mu, mu, sigma)
+    return np.stack(np.broadcast_arrays(mu, sigma, height), axis=-1).astype(float)
@@ -0,0 +1,221 @@
+"""Riemannian statistics of normal distributions under the Fisher metric.
+
+Points are ``(μ, σ)`` with the coordinate axis last, as in
+:mod:`~mathvisualizations.fisher`.  In ``(μ/√2, σ)`` the Fisher metric is
+twice the hyperbolic metric of the upper half-plane, so the computations
+run on the hyperboloid model, where distances are ``arccosh`` of a
+Minkowski product and the log and exp maps are closed forms.  Distances
+to all centroids are then one ``(N, k)`` matrix product, and the tangent
+vectors of each cluster are summed with ``np.bincount``, so Karcher means
+and k-means of 10⁵ distributions cost a few passes over the points per
+iteration.  Tangent vectors are given in ``(dμ, dσ)`` components.
+"""
+
+import numpy as np
+
+# Signature of the Minkowski product -X₀Y₀ + X₁Y₁ + X₂Y₂
+_SIGNATURE = np.array([-1.0, 1.0, 1.0])
+
+
+def _minkowski(X, Y):
+    return np.sum(X * _SIGNATURE * Y, axis=-1)
+
+
+def to_hyperboloid(params):
+    """Points ``(..., 3)`` of the hyperboloid for the normal distributions ``params`` ``(..., 2)``."""
+    params = np.asarray(params, dtype=float)
+    x, y = params[..., 0] / np.sqrt(2), params[..., 1]
+    r2 = x**2 + y**2
+    return np.stack([(r2 + 1) / (2 * y), x / y, (r2 - 1) / (2 * y)], axis=-1)
+
+
+def from_hyperboloid(X):
+    """``(μ, σ)`` of the hyperboloid points ``X`` (shape ``(..., 3)``)."""
+    y = 1 / (X[..., 0] - X[..., 2])
+    return np.stack([np.sqrt(2) * X[..., 1] * y, y], axis=-1)
+
+
+def _frame(params):
+    # Minkowski-orthonormal tangent vectors y ∂X/∂x and y ∂X/∂y, shape (..., 2, 3)
+    params = np.asarray(params, dtype=float)
+    x, y = params[..., 0] / np.sqrt(2), params[..., 1]
+    d_x = np.stack([x, np.ones_like(x), x], axis=-1)
+    d_y = np.stack([(y**2 - x**2 - 1) / (2 * y), -x / y, (y**2 - x**2 + 1) / (2 * y)], axis=-1)
+    return np.stack([d_x, d_y], axis=-2)
+
+
+def _to_ambient(params, vectors):
+    # (dμ, dσ) -> tangent vector of the hyperboloid; (dx, dy) = (dμ/√2, dσ)
+    vectors = np.asarray(vectors, dtype=float)
+    y = np.asarray(params, dtype=float)[..., 1]
+    components = np.stack([vectors[..., 0] / np.sqrt(2), vectors[..., 1]], axis=-1) / y[..., None]
+    return np.sum(components[..., None] * _frame(params), axis=-2)
+
+
+def _from_ambient(params, V):
+    # Inverse of _to_ambient, through the orthonormal frame
+    y = np.asarray(params, dtype=float)[..., 1]
+    components = _minkowski(V[..., None, :], _frame(params)) * y[..., None]
+    return np.stack([np.sqrt(2) * components[..., 0], components[..., 1]], axis=-1)
+
+
+def _log(M, X):
+    # Tangent vectors at M pointing to X, with hyperbolic length arccosh(-<M, X>)
+    c = np.maximum(-_minkowski(M, X), 1)
+    d = np.arccosh(c)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.where(d > 1e-12, d / np.sinh(d), 1)
+    return scale[..., None] * (X - c[..., None] * M)
+
+
+def _exp(M, V):
+    n = np.sqrt(np.maximum(_minkowski(V, V), 0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.where(n > 1e-12, np.sinh(n) / n, 1)
+    X = np.cosh(n)[..., None] * M + scale[..., None] * V
+    # Back onto the hyperboloid against the drift of rounding errors
+    return X / np.sqrt(-_minkowski(X, X))[..., None]
+
+
+def fisher_log(base, points):
+    """Fisher log map: tangent vectors ``(dμ, dσ)`` at ``base`` whose geodesics reach ``points``."""
+    return _from_ambient(base, _log(to_hyperboloid(base), to_hyperboloid(points)))
+
+
+def fisher_exp(base, vectors):
+    """Fisher exp map: end points ``(μ, σ)`` of the geodesics from ``base`` with velocities ``vectors``."""
+    return from_hyperboloid(_exp(to_hyperboloid(base), _to_ambient(base, vectors)))
+
+
+def fisher_distance_matrix(params, centers):
+    """Fisher-Rao distances ``(N, k)`` between ``params`` ``(N, 2)`` and ``centers`` ``(k, 2)``."""
+    cosh = _cosh_matrix(to_hyperboloid(params), to_hyperboloid(centers))
+    return np.sqrt(2) * np.arccosh(np.maximum(cosh, 1))
+
+
+def _cosh_matrix(X, C):
+    # cosh of the hyperbolic distances, -<X, C>, as one matrix product
+    return -X @ (C * _SIGNATURE).T
+
+
+def _cluster_means(X, labels, centers, weights=None, tol=1e-10, max_iter=100):
+    # Karcher means of the clusters, all updated together from the starting centers
+    centers = centers.copy()
+    k = len(centers)
+    counts = np.bincount(labels, weights=weights, minlength=k)
+    occupied = counts > 0
+    counts = np.where(occupied, counts, 1)
+    for _ in range(max_iter):
+        V = _log(centers[labels], X)
+        if weights is not None:
+            V *= weights[:, None]
+        step = np.stack([np.bincount(labels, weights=V[:, j], minlength=k) for j in range(3)], axis=-1)
+        step /= counts[:, None]
+        centers[occupied] = _exp(centers[occupied], step[occupied])
+        if np.sqrt(np.max(np.maximum(_minkowski(step, step), 0))) <= tol:
+            break
+    return centers
+
+
+def karcher_mean(params, weights=None, labels=None, k=None, tol=1e-10, max_iter=100):
+    """Karcher (Fréchet) means minimizing the summed squared Fisher-Rao distances.
+
+    ``params`` has shape ``(N, 2)`` and ``weights`` ``(N,)``.  Without
+    ``labels`` the result is the mean ``(2,)`` of all points; with integer
+    ``labels`` ``(N,)`` it is the ``(k, 2)`` means of every cluster at
+    once, NaN for empty clusters.  Each iteration moves the means along
+    the average of the log maps; they start at the moment-matched normal of
+    each cluster.
+    """
+    params = np.asarray(params, dtype=float)
+    single = labels is None
+    labels = np.zeros(len(params), dtype=int) if single else np.asarray(labels)
+    k = (labels.max() + 1 if len(labels) else 0) if k is None else k
+    weights = None if weights is None else np.asarray(weights, dtype=float)
+    X = to_hyperboloid(params)
+    counts = np.bincount(labels, weights=weights, minlength=k)
+    # Mean and standard deviation of the mixture of each cluster's members
+    sums = [np.bincount(labels, weights=w if weights is None else w * weights, minlength=k) for w in (
+        params[:, 0], params[:, 0]**2 + params[:, 1]**2
+    )]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = sums[0] / counts
+        start = np.stack([mean, np.sqrt(np.maximum(sums[1] / counts - mean**2, 1e-12))], axis=-1)
+    occupied = counts > 0
+    centers = _cluster_means(X, labels, to_hyperboloid(np.where(occupied[:, None], start, 1)), weights, tol, max_iter)
+    result = np.where(occupied[:, None], from_hyperboloid(centers), np.nan)
+    return result[0] if single else result
+
+
+def kmeans_plus_plus(params, k, seed=0):
+    """``k`` initial centers chosen with probability proportional to the squared Fisher-Rao distance."""
+    params = np.asarray(params, dtype=float)
+    rng = np.random.default_rng(seed)
+    X = to_hyperboloid(params)
+    chosen = [rng.integers(len(params))]
+    nearest = np.full(len(params), np.inf)
+    for _ in range(1, k):
+        cosh = np.maximum(-_minkowski(X, X[chosen[-1]]), 1)
+        nearest = np.minimum(nearest, np.arccosh(cosh)**2)
+        chosen.append(rng.choice(len(params), p=nearest / nearest.sum()))
+    return params[chosen]
+
+
+def geodesic_kmeans(params, k, centers=None, max_iter=100, seed=0, mean_iter=10, tol=1e-3):
+    """k-means of the normal distributions ``params`` (shape ``(N, 2)``) in the Fisher-Rao distance.
+
+    Starts at ``centers`` ``(k, 2)`` or :func:`kmeans_plus_plus`.  Each
+    iteration assigns every point to its nearest center with one ``(N, k)``
+    matrix product and moves the centers to the Karcher means of their
+    clusters, warm-started from the previous centers with at most
+    ``mean_iter`` steps.  Stops when no assignment changes or no center
+    moves farther than ``tol`` in Fisher-Rao distance.  Well-separated
+    clusters settle in a few iterations; points without cluster structure
+    keep trading a few members between neighbouring clusters, and their
+    centers creep for dozens of iterations before they fall below ``tol``.
+
+    Returns the centers ``(k, 2)``, labels ``(N,)``, the centers after each
+    iteration ``(T, k, 2)`` (starting centers first) and the sum of squared
+    distances to the nearest center.
+    """
+    params = np.asarray(params, dtype=float)
+    if centers is None:
+        centers = kmeans_plus_plus(params, k, seed)
+    X, C = to_hyperboloid(params), to_hyperboloid(centers)
+    history = [from_hyperboloid(C)]
+    labels = None
+    for _ in range(max_iter):
+        new_labels = np.argmin(_cosh_matrix(X, C), axis=-1)
+        if labels is not None and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        previous, C = C, _cluster_means(X, labels, C, max_iter=mean_iter)
+        history.append(from_hyperboloid(C))
+        shift = np.sqrt(2) * np.arccosh(np.maximum(-_minkowski(previous, C), 1))
+        if np.max(shift) <= tol:
+            break
+    cosh = np.maximum(-_minkowski(X, C[labels]), 1)
+    inertia = 2 * np.sum(np.arccosh(cosh)**2)
+    return from_hyperboloid(C), labels, np.stack(history), inertia
+
+
+def tangent_pca(params, mean=None):
+    """Principal component analysis of ``params`` (shape ``(N, 2)``) in the tangent space at their Karcher mean.
+
+    Returns the mean ``(2,)``, the variances ``(2,)`` about it in decreasing order,
+    the principal directions ``(2, 2)`` as tangent vectors ``(dμ, dσ)`` of
+    unit Fisher length (rows), and the scores ``(N, 2)``, the coordinates
+    of the log maps along them.  ``fisher_exp(mean, t * direction)`` draws
+    the principal geodesics.
+    """
+    params = np.asarray(params, dtype=float)
+    if mean is None:
+        mean = karcher_mean(params)
+    # Orthonormal coordinates of the log maps; Fisher lengths are √2 times hyperbolic ones
+    V = _log(to_hyperboloid(mean), to_hyperboloid(params))
+    coords = np.sqrt(2) * _minkowski(V[:, None, :], _frame(mean))
+    variances, axes = np.linalg.eigh(coords.T @ coords / len(coords))
+    variances, axes = variances[::-1], axes[:, ::-1]
+    # Unit Fisher vectors: (dμ, dσ) = σ (a₁, a₂/√2)
+    directions = mean[1] * axes.T * np.array([1, 1 / np.sqrt(2)])
+    return mean, variances, directions, coords @ axes
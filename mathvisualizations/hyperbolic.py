@@ -0,0 +1,228 @@
+"""Hyperbolic geometry in the Poincaré disk model.
+
+Points of the disk are complex numbers ``z`` with ``|z| < 1``; every
+function broadcasts over arrays of them.  Orientation-preserving isometries
+are Möbius maps stored as complex matrices ``[[a, b], [conj(b), conj(a)]]``
+with ``|a|² - |b|² = 1`` (shape ``(..., 2, 2)``), so they compose by matrix
+multiplication.
+"""
+
+import numpy as np
+
+
+def poincare_metric(x, y):
+    # ds² = 4 (dx² + dy²) / (1 - r²)²
+    r2 = np.asarray(x, dtype=float)**2 + np.asarray(y, dtype=float)**2
+    G = np.zeros(r2.shape + (2, 2))
+    G[..., 0, 0] = G[..., 1, 1] = 4 / (1 - r2)**2
+    return G
+
+
+def distance(z, w):
+    """Hyperbolic distance ``2 artanh |z - w| / |1 - conj(z) w|``."""
+    z, w = np.asarray(z, dtype=complex), np.asarray(w, dtype=complex)
+    return 2 * np.arctanh(np.abs(z - w) / np.abs(1 - np.conj(z) * w))
+
+
+def translation(a):
+    """The isometry moving 0 to ``a`` along the geodesic through them."""
+    a = np.asarray(a, dtype=complex)
+    M = np.ones(a.shape + (2, 2), dtype=complex)
+    M[..., 0, 1] = a
+    M[..., 1, 0] = np.conj(a)
+    return M / np.sqrt(1 - np.abs(a)**2)[..., None, None]
+
+
+def rotation(theta):
+    """Rotation of the disk by ``theta`` about 0."""
+    half = np.exp(0.5j * np.asarray(theta, dtype=float))
+    M = np.zeros(half.shape + (2, 2), dtype=complex)
+    M[..., 0, 0] = half
+    M[..., 1, 1] = np.conj(half)
+    return M
+
+
+def inverse(M):
+    # Inverse of a matrix with determinant 1
+    M = np.asarray(M, dtype=complex)
+    inv = np.empty_like(M)
+    inv[..., 0, 0], inv[..., 1, 1] = M[..., 1, 1], M[..., 0, 0]
+    inv[..., 0, 1], inv[..., 1, 0] = -M[..., 0, 1], -M[..., 1, 0]
+    return inv
+
+
+def isometry_path(a=0, theta=0, t=1.0):
+    """Isometries from the identity (``t = 0``) to "rotate by ``theta``, then move 0 to ``a``" (``t = 1``).
+
+    The rotation angle grows linearly and 0 travels along the geodesic to
+    ``a`` at constant hyperbolic speed.  Shape ``(..., 2, 2)`` for ``t`` of
+    shape ``(...)``.
+    """
+    a, t = complex(a), np.asarray(t, dtype=float)
+    direction = a / abs(a) if a else 0
+    return translation(np.tanh(t * np.arctanh(abs(a))) * direction) @ rotation(t * theta)
+
+
+def apply_mobius(M, z):
+    """``(a z + b) / (c z + d)``; ``M`` of shape ``(..., 2, 2)`` broadcasts against ``z``."""
+    M, z = np.asarray(M, dtype=complex), np.asarray(z, dtype=complex)
+    return (M[..., 0, 0] * z + M[..., 0, 1]) / (M[..., 1, 0] * z + M[..., 1, 1])
+
+
+def geodesic(z, w, num=32):
+    """``num`` points along the geodesic from ``z`` to ``w``, equally spaced in hyperbolic length.
+
+    Shape ``(..., num)`` for ``z`` and ``w`` broadcasting to ``(...)``.  The
+    segment is a radius after moving ``z`` to 0, where it is sampled, and is
+    then moved back.
+    """
+    z, w = np.broadcast_arrays(np.asarray(z, dtype=complex), np.asarray(w, dtype=complex))
+    v = apply_mobius(inverse(translation(z)), w)[..., None]
+    t = np.linspace(0, 1, num)
+    # Radius tanh(t d / 2) where tanh(d / 2) = |v|
+    r = np.abs(v)
+    direction = np.divide(v, r, out=np.zeros_like(v), where=r > 0)
+    samples = np.tanh(t * np.arctanh(r)) * direction
+    return apply_mobius(translation(z)[..., None, :, :], samples)
+
+
+def geodesic_line(z, w, num=64, cutoff=0.999):
+    """The whole geodesic through ``z`` and ``w``, up to Euclidean radius ``cutoff`` after moving ``z`` to 0.
+
+    Shape ``(..., num)``, running from the end beyond ``z`` to the end beyond ``w``.
+    """
+    z, w = np.broadcast_arrays(np.asarray(z, dtype=complex), np.asarray(w, dtype=complex))
+    v = apply_mobius(inverse(translation(z)), w)[..., None]
+    samples = np.linspace(-cutoff, cutoff, num) * v / np.abs(v)
+    return apply_mobius(translation(z)[..., None, :, :], samples)
+
+
+def circle(center, radius, num=64):
+    """``num`` points at hyperbolic distance ``radius`` from ``center``; shape ``(..., num)``."""
+    angles = np.linspace(0, 2 * np.pi, num)
+    samples = np.tanh(np.asarray(radius, dtype=float)[..., None] / 2) * np.exp(1j * angles)
+    return apply_mobius(translation(center)[..., None, :, :], samples)
+
+
+def triangle_angles(a, b, c):
+    """Interior angles at ``a``, ``b`` and ``c`` of the geodesic triangle; shape ``(..., 3)``."""
+    vertices = np.stack(np.broadcast_arrays(*(np.asarray(p, dtype=complex) for p in (a, b, c))), axis=-1)
+    others = np.roll(vertices, -1, axis=-1), np.roll(vertices, -2, axis=-1)
+    # Move each vertex to 0, where the geodesics leaving it are radii
+    to_origin = inverse(translation(vertices))
+    u, v = (apply_mobius(to_origin, p) for p in others)
+    return np.abs(np.angle(u / v))
+
+
+def triangle_area(a, b, c):
+    # Gauss-Bonnet with curvature -1: the angle defect
+    return np.pi - triangle_angles(a, b, c).sum(axis=-1)
+
+
+def regular_polygon(p, q):
+    """Vertices of the {p, q} tile centered at 0, shape ``(p,)``.
+
+    Its circumradius R satisfies ``cosh R = cot(π/p) cot(π/q)``.
+    """
+    if (p - 2) * (q - 2) <= 4:
+        raise ValueError(f"{{{p}, {q}}} is not a hyperbolic tiling: need (p - 2)(q - 2) > 4")
+    R = np.arccosh(1 / (np.tan(np.pi / p) * np.tan(np.pi / q)))
+    return np.tanh(R / 2) * np.exp(2j * np.pi * np.arange(p) / p)
+
+
+def tile_generators(p, q):
+    """Half-turns about the edge midpoints of the central tile, shape ``(p, 2, 2)``.
+
+    The half-turn about an edge maps the central tile onto its neighbor
+    across that edge, so words in these generate every tile.
+    """
+    vertices = regular_polygon(p, q)
+    midpoints = geodesic(vertices, np.roll(vertices, -1), num=3)[:, 1]
+    T = translation(midpoints)
+    return T @ rotation(np.pi) @ inverse(T)
+
+
+# Integer offsets of a hash cell and its eight neighbors
+_NEIGHBOR_CELLS = np.array([(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1)])
+
+
+def _cell_keys(cells):
+    # (..., 2) integer cells -> one int64 key per cell
+    cells = cells + 2**30
+    return (cells[..., 0] << 32) | cells[..., 1]
+
+
+def tile_size(p, q, centers):
+    """Estimated Euclidean diameter of {p, q} tiles centered at ``centers``.
+
+    Exact for the central tile; elsewhere the tile shrinks with the
+    conformal factor ``1 - |c|²`` of the disk.
+    """
+    return 2 * np.abs(regular_polygon(p, q)[0]) * (1 - np.abs(centers)**2)
+
+
+def tessellation(p, q, layers=None, min_size=None, max_tiles=None):
+    """Isometries placing the tiles of {p, q}, expanding outward from the center.
+
+    Each step maps the whole frontier through the generators at once.  A
+    tile is kept if it is within ``layers`` steps of the center and its
+    :func:`tile_size` is at least ``min_size`` (in disk radii, so a pixel
+    threshold is ``pixels / disk radius in pixels``); at most ``max_tiles``
+    are returned.  Duplicates are found with a spatial hash of the tile
+    centers: the cells are far smaller than the distance between two tiles
+    but far larger than rounding errors, so a center matches a known tile
+    exactly when its cell or one of the eight around it is taken.
+
+    Returns ``(N, 2, 2)`` matrices ordered by distance from the center in
+    steps, the central tile first.
+    """
+    if layers is None and min_size is None and max_tiles is None:
+        raise ValueError("give layers, min_size or max_tiles to bound the tiling")
+    generators = tile_generators(p, q)
+    cell = max(1e-3 * (min_size or 1e-6), 1e-10)
+    frontier = np.eye(2, dtype=complex)[None]
+    known = _cell_keys(np.zeros(2, dtype=np.int64))[None]
+    tiles = [frontier]
+    count, depth = 1, 0
+    while len(frontier) and (layers is None or depth < layers):
+        candidates = (frontier[:, None] @ generators).reshape(-1, 2, 2)
+        # Renormalize against drift in the determinant
+        candidates /= np.sqrt(np.linalg.det(candidates))[:, None, None]
+        centers = candidates[:, 0, 1] / candidates[:, 1, 1]
+        if min_size is not None:
+            large = tile_size(p, q, centers) >= min_size
+            candidates, centers = candidates[large], centers[large]
+
+        cells = np.floor(to_xy(centers) / cell).astype(np.int64)
+        keys, first = np.unique(_cell_keys(cells), return_index=True)
+        candidates, cells = candidates[first], cells[first]
+        around = _cell_keys(cells[:, None, :] + _NEIGHBOR_CELLS)
+        # Already placed, or a candidate in a neighboring cell with a smaller key
+        seen = np.isin(around, known).any(axis=1)
+        index = np.minimum(np.searchsorted(keys, around), len(keys) - 1)
+        duplicate = ((keys[index] == around) & (around < keys[:, None])).any(axis=1)
+        new = ~seen & ~duplicate
+
+        frontier = candidates[new]
+        if max_tiles is not None:
+            frontier = frontier[:max_tiles - count]
+            new = np.flatnonzero(new)[:len(frontier)]
+        known = np.union1d(known, keys[new])
+        tiles.append(frontier)
+        count += len(frontier)
+        depth += 1
+    return np.concatenate(tiles)
+
+
+def tile_boundaries(tiles, p, q, num=16):
+    """Boundary of each tile as a closed polyline, shape ``(N, p * (num - 1) + 1)``."""
+    vertices = regular_polygon(p, q)
+    edges = geodesic(vertices, np.roll(vertices, -1), num)[:, :-1].ravel()
+    boundary = np.append(edges, vertices[0])
+    return apply_mobius(np.asarray(tiles)[:, None], boundary)
+
+
+def to_xy(z):
+    # Complex points -> (..., 2) coordinates
+    z = np.asarray(z)
+    return np.stack([z.real, z.imag], axis=-1)
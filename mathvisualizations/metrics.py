@@ -0,0 +1,48 @@
+"""Riemannian metrics on 2D coordinate charts and lengths measured with them.
+
+A metric is a function ``metric(x, y)`` returning the matrices ``g_ij`` with
+shape ``(..., 2, 2)`` for coordinate arrays of shape ``(...)``.
+"""
+
+import numpy as np
+
+
+def polynomial_metric(x, y):
+    # ds² = (1 + 0.2x²)dx² + (1 + 0.2y²)dy² + 0.1xy dx dy
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    G = np.empty(x.shape + (2, 2))
+    G[..., 0, 0] = 1 + 0.2 * x**2
+    G[..., 1, 1] = 1 + 0.2 * y**2
+    G[..., 0, 1] = G[..., 1, 0] = 0.1 * x * y
+    return G
+
+
+def radial_metric(x, y):
+    # Grows with the distance r from the origin: g_xx = g_yy = 1 + 0.3r², g_xy = 0.1r
+    r = np.hypot(x, y)
+    G = np.empty(r.shape + (2, 2))
+    G[..., 0, 0] = G[..., 1, 1] = 1 + 0.3 * r**2
+    G[..., 0, 1] = G[..., 1, 0] = 0.1 * r
+    return G
+
+
+def line_element(G, delta):
+    # ds = sqrt(δx^T G δx) for a small displacement δx
+    return np.sqrt(np.einsum("...i,...ij,...j->...", delta, G, delta))
+
+
+def straight_path(start, end, t):
+    """Points ``start + t (end - start)``; shape ``(len(t), 2)`` for array ``t``."""
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    t = np.asarray(t, dtype=float)[..., None]
+    return start + t * (end - start)
+
+
+def path_length(points, metric):
+    """Length of the polyline ``points`` (shape ``(N, 2)``) under ``metric``.
+
+    Each segment is measured with the metric at its starting point.
+    """
+    points = np.asarray(points, dtype=float)
+    G = metric(points[:-1, 0], points[:-1, 1])
+    return line_element(G, np.diff(points, axis=0)).sum()
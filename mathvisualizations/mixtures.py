@@ -0,0 +1,169 @@
+"""Gaussian mixtures fitted to many datasets at once.
+
+B datasets of n samples have shape ``(B, n)``; shorter datasets are padded
+with NaN, which every function ignores.  A mixture of K normal components
+is given by ``(weights, means, sigmas)``, each of shape ``(..., K)``.
+:func:`fit_mixtures` runs EM on all datasets together: every iteration is a
+few broadcasted ``(B, K, n)`` operations, and datasets drop out of the
+batch as they converge.  Its empirical Fisher information uses the
+coordinates ``θ = (w_1, ..., w_{K-1}, μ_1, ..., μ_K, σ_1, ..., σ_K)``, with
+``w_K = 1 - w_1 - ... - w_{K-1}``.  For ``K = 1`` these are the ``(μ, σ)`` of
+:mod:`~mathvisualizations.fisher`.
+"""
+
+import numpy as np
+
+from .densities import normal_log_pdf
+
+
+def mixture_log_pdf(x, weights, means, sigmas):
+    """Log density at ``x`` (shape ``(..., n)``) of the mixtures with parameters of shape ``(..., K)``."""
+    return _log_sum(_component_log_pdfs(x, weights, means, sigmas))
+
+
+def _component_log_pdfs(x, weights, means, sigmas):
+    # log w_k + log N(x | μ_k, σ_k²), shape (..., K, n) so that sums over the
+    # samples run along contiguous memory
+    x = np.asarray(x, dtype=float)[..., None, :]
+    weights, means, sigmas = (np.asarray(p, dtype=float)[..., None] for p in (weights, means, sigmas))
+    with np.errstate(divide="ignore"):
+        return np.log(weights) + normal_log_pdf(x, means, sigmas)
+
+
+def _log_sum(log_terms):
+    # log Σ_k exp, over the component axis -2
+    peak = np.max(log_terms, axis=-2)
+    peak = np.where(np.isfinite(peak), peak, 0)
+    return peak + np.log(np.sum(np.exp(log_terms - peak[..., None, :]), axis=-2))
+
+
+def responsibilities(x, weights, means, sigmas):
+    """Posterior component probabilities ``(..., K, n)`` and the mean log-likelihood ``(...)`` of each dataset.
+
+    NaN samples have zero responsibilities and do not count.
+    """
+    x = np.asarray(x, dtype=float)
+    valid = ~np.isnan(x)
+    log_joint = _component_log_pdfs(np.where(valid, x, 0), weights, means, sigmas)
+    log_density = _log_sum(log_joint)
+    resp = np.exp(log_joint - log_density[..., None, :]) * valid[..., None, :]
+    log_likelihood = np.sum(np.where(valid, log_density, 0), axis=-1) / np.sum(valid, axis=-1)
+    return resp, log_likelihood
+
+
+def initial_params(data, components=2):
+    """Equal weights, means at the quantiles ``(k + ½)/K`` and the overall spread for every σ."""
+    data = np.asarray(data, dtype=float)
+    # Sorting moves the NaN padding to the end of each dataset
+    ordered = np.sort(data, axis=-1)
+    count = np.sum(~np.isnan(data), axis=-1, keepdims=True)
+    position = (np.arange(components) + 0.5) / components * (count - 1)
+    below = np.floor(position).astype(int)
+    above = np.minimum(below + 1, count - 1)
+    fraction = position - below
+    means = (
+        (1 - fraction) * np.take_along_axis(ordered, below, axis=-1)
+        + fraction * np.take_along_axis(ordered, above, axis=-1)
+    )
+    sigmas = np.repeat(np.nanstd(data, axis=-1, keepdims=True), components, axis=-1)
+    weights = np.full(means.shape, 1 / components)
+    return weights, means, sigmas
+
+
+def fit_mixtures(data, components=2, params=None, max_iter=200, tol=1e-8, min_sigma=1e-3):
+    """EM fits of K-component Gaussian mixtures to the datasets ``data`` (shape ``(B, n)``).
+
+    ``params`` are initial ``(weights, means, sigmas)``, by default
+    :func:`initial_params`.  A dataset is done when its mean log-likelihood
+    changes by less than ``tol`` (relative) in one iteration.  σ is kept
+    above ``min_sigma``, and a component left without samples keeps its
+    previous parameters.  Components are sorted by their means.
+
+    Returns ``(weights, means, sigmas)`` of shape ``(B, K)``, the mean
+    log-likelihood ``(B,)`` and whether each fit converged ``(B,)``.
+    """
+    data = np.asarray(data, dtype=float)
+    shape = data.shape[:-1]
+    data = data.reshape(-1, data.shape[-1])
+    if params is None:
+        params = initial_params(data, components)
+    weights, means, sigmas = (
+        np.array(np.broadcast_to(p, data.shape[:-1] + (components,)), dtype=float) for p in params
+    )
+    log_likelihood = np.full(len(data), -np.inf)
+    converged = np.zeros(len(data), dtype=bool)
+    active = np.arange(len(data))
+    for _ in range(max_iter):
+        x = data[active]
+        resp, current = responsibilities(x, weights[active], means[active], sigmas[active])
+        done = np.abs(current - log_likelihood[active]) <= tol * (1 + np.abs(current))
+        log_likelihood[active] = current
+        converged[active[done]] = True
+        active, x, resp = active[~done], x[~done], resp[~done]
+        if not len(active):
+            break
+        # M-step, with the NaN padding zeroed out of the sums
+        x = np.nan_to_num(x)[..., None, :]
+        counts = resp.sum(axis=-1)
+        occupied = counts > 1e-10 * resp.shape[-1]
+        safe = np.where(occupied, counts, 1)
+        new_means = np.sum(resp * x, axis=-1) / safe
+        new_variance = np.sum(resp * (x - new_means[..., None])**2, axis=-1) / safe
+        weights[active] = counts / counts.sum(axis=-1, keepdims=True)
+        means[active] = np.where(occupied, new_means, means[active])
+        sigmas[active] = np.where(occupied, np.sqrt(np.maximum(new_variance, min_sigma**2)), sigmas[active])
+    order = np.argsort(means, axis=-1)
+    weights, means, sigmas = (np.take_along_axis(p, order, axis=-1) for p in (weights, means, sigmas))
+    components = weights.shape[-1]
+    return (
+        tuple(p.reshape(shape + (components,)) for p in (weights, means, sigmas)),
+        log_likelihood.reshape(shape),
+        converged.reshape(shape),
+    )
+
+
+def mixture_scores(x, weights, means, sigmas):
+    """Scores ``∂ log p(x | θ) / ∂θ``, shape ``(..., 3K - 1, n)``; zero at NaN samples."""
+    x = np.asarray(x, dtype=float)
+    weights, means, sigmas = (np.asarray(p, dtype=float) for p in (weights, means, sigmas))
+    resp, _ = responsibilities(x, weights, means, sigmas)
+    weights, means, sigmas = (p[..., None] for p in (weights, means, sigmas))
+    z = (np.nan_to_num(x)[..., None, :] - means) / sigmas
+    # ∂/∂w_k = r_k/w_k - r_K/w_K for k < K, since w_K takes up the difference
+    ratio = resp / weights
+    return np.concatenate(
+        [ratio[..., :-1, :] - ratio[..., -1:, :], resp * z / sigmas, resp * (z**2 - 1) / sigmas],
+        axis=-2,
+    )
+
+
+def empirical_fisher(data, weights, means, sigmas):
+    """Empirical Fisher information, the mean of ``s sᵀ`` over the samples, shape ``(..., 3K - 1, 3K - 1)``."""
+    scores = mixture_scores(data, weights, means, sigmas)
+    count = np.sum(~np.isnan(np.asarray(data, dtype=float)), axis=-1)
+    return scores @ np.swapaxes(scores, -1, -2) / count[..., None, None]
+
+
+def project_to_normal(weights, means, sigmas):
+    """``(μ, σ)`` of the normal distribution closest to each mixture, shape ``(..., 2)``.
+
+    This is the m-projection, minimizing ``KL(mixture || normal)``: the
+    normal with the mixture's mean and variance.
+    """
+    weights, means, sigmas = (np.asarray(p, dtype=float) for p in (weights, means, sigmas))
+    mean = np.sum(weights * means, axis=-1)
+    variance = np.sum(weights * (sigmas**2 + (means - mean[..., None])**2), axis=-1)
+    return np.stack([mean, np.sqrt(variance)], axis=-1)
+
+
+def sample_mixtures(weights, means, sigmas, size, seed=0):
+    """``size`` samples of each mixture, shape ``(..., size)``."""
+    weights, means, sigmas = (np.asarray(p, dtype=float) for p in (weights, means, sigmas))
+    rng = np.random.default_rng(seed)
+    shape = weights.shape[:-1] + (size,)
+    # Component of each sample by inverting the cumulative weights
+    cumulative = np.cumsum(weights, axis=-1)
+    u = rng.random(shape) * cumulative[..., -1:]
+    component = np.minimum(np.sum(u[..., None] >= cumulative[..., None, :], axis=-1), weights.shape[-1] - 1)
+    pick = lambda p: np.take_along_axis(np.broadcast_to(p, shape[:-1] + p.shape[-1:]), component, axis=-1)
+    return pick(means) + pick(sigmas) * rng.standard_normal(shape)
@@ -0,0 +1,287 @@
+"""Array-backed mobjects for large batches of dots, line segments and curves.
+
+A ``DotCloud`` or ``LineSet`` is a single ``VMobject`` whose points hold
+one subpath per dot or segment, built from contiguous arrays in one NumPy
+operation.  The whole batch shares one style and is filled or stroked in
+one draw call, instead of carrying a mobject with its own style per
+element.  ``Create``, ``FadeIn`` and the other ``VMobject`` animations work
+unchanged.  Batches with several colors are ``VGroup`` s with one batch per
+color.
+
+:func:`coords_to_points` maps whole coordinate arrays through an axes
+object in one affine operation, and :func:`polyline` / :func:`polylines`
+build curves from sampled coordinates without a ``c2p`` call per sample;
+:func:`polyline_set` draws thousands of them as one mobject and
+:func:`graphs` draws the rows of a density matrix.
+:class:`MobiusTransform` moves everything drawn in a Poincaré disk by
+hyperbolic isometries, and :class:`GraphMorph` morphs one graph through a
+precomputed tensor of values.
+
+Unlike the rest of the package this module imports Manim.
+"""
+
+from functools import cache
+
+import numpy as np
+from manim import (
+    BLUE,
+    Animation,
+    DEFAULT_DOT_RADIUS,
+    DEFAULT_STROKE_WIDTH,
+    ORIGIN,
+    RED,
+    WHITE,
+    Circle,
+    LinearBase,
+    VGroup,
+    VMobject,
+)
+
+from .densities import graph_coords
+from .hyperbolic import apply_mobius
+
+
+@cache
+def _unit_circle():
+    # Bezier control points of a unit circle, the same curves as Dot uses
+    points = Circle(radius=1).points
+    return points - points.mean(axis=0)
+
+
+def _as_points(points):
+    # (N, 2) or (N, 3) scene coordinates -> (N, 3) floats
+    points = np.asarray(points, dtype=float).reshape(-1, np.shape(points)[-1])
+    if points.shape[1] == 2:
+        points = np.column_stack([points, np.zeros(len(points))])
+    return points
+
+
+def coords_to_points(axes, coords):
+    """Scene points of axes coordinates ``coords`` (shape ``(..., 2)`` or ``(..., 3)``).
+
+    Linear axes are affine maps, so the origin and the images of the unit
+    vectors are enough to map every point in one matrix product.  Coordinates
+    beyond the number of axes are ignored, as in ``axes.c2p``.  Axes with a
+    non-linear scaling (e.g. logarithmic) go through ``axes.c2p``.
+    """
+    coords = np.asarray(coords, dtype=float)
+    dims = min(coords.shape[-1], len(axes.axes))
+    coords = coords[..., :dims]
+    if not all(isinstance(axis.scaling, LinearBase) for axis in axes.axes.submobjects[:dims]):
+        flat = coords.reshape(-1, dims)
+        return np.asarray(axes.c2p(*flat.T)).T.reshape(*coords.shape[:-1], 3)
+    origin = np.asarray(axes.c2p(*np.zeros(dims)), dtype=float)
+    basis = np.array([axes.c2p(*unit) for unit in np.eye(dims)], dtype=float) - origin
+    return origin + coords @ basis
+
+
+def polyline(axes, coords, color=WHITE, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+    """Curve through the samples ``coords`` (shape ``(N, 2)`` or ``(N, 3)``) of ``axes``."""
+    curve = VMobject(color=color, stroke_width=stroke_width, **kwargs)
+    curve.set_points_as_corners(coords_to_points(axes, coords))
+    return curve
+
+
+def polylines(axes, coords, colors, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+    """One :func:`polyline` per curve of ``coords`` (shape ``(K, N, 2)``), as a ``VGroup``.
+
+    ``colors`` holds one color per curve.  All curves are mapped to the scene
+    in a single :func:`coords_to_points` call.
+    """
+    points = coords_to_points(axes, coords)
+    curves = VGroup()
+    for curve_points, color in zip(points, colors):
+        curve = VMobject(color=color, stroke_width=stroke_width, **kwargs)
+        curve.set_points_as_corners(curve_points)
+        curves.add(curve)
+    return curves
+
+
+def graphs(axes, x, y, colors=None, color=WHITE, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+    """Graphs of the rows of ``y`` (shape ``(K, N)``) over ``x`` (shape ``(N,)``).
+
+    ``y`` is typically a :func:`~mathvisualizations.densities.pdf_matrix`.
+    With one entry of ``colors`` per row the result is :func:`polylines`;
+    otherwise all K graphs share ``color`` and form a single
+    :func:`polyline_set`, which is cheaper for hundreds of curves.
+    """
+    coords = graph_coords(x, y)
+    if colors is not None:
+        return polylines(axes, coords, colors, stroke_width=stroke_width, **kwargs)
+    return polyline_set(coords_to_points(axes, coords), color=color, stroke_width=stroke_width, **kwargs)
+
+
+class DotCloud(VMobject):
+    """Filled dots at ``points`` (shape ``(N, 2)`` or ``(N, 3)``).
+
+    ``radius`` is a scalar or one radius per dot.
+    """
+
+    def __init__(self, points, radius=DEFAULT_DOT_RADIUS, color=WHITE, fill_opacity=1.0, **kwargs):
+        super().__init__(color=color, fill_opacity=fill_opacity, stroke_width=0, **kwargs)
+        self.set_dots(points, radius)
+
+    def set_dots(self, points, radius=DEFAULT_DOT_RADIUS):
+        points = _as_points(points)
+        radius = np.broadcast_to(np.asarray(radius, dtype=float), len(points))
+        circle = _unit_circle()
+        self.set_points((points[:, None, :] + radius[:, None, None] * circle).reshape(-1, 3))
+        return self
+
+    @property
+    def num_dots(self):
+        return len(self.points) // len(_unit_circle())
+
+    def get_dot_centers(self):
+        # The control points of each circle are symmetric about its center
+        return self.points.reshape(self.num_dots, -1, 3).mean(axis=1)
+
+
+class LineSet(VMobject):
+    """Straight segments from ``starts[i]`` to ``ends[i]`` (shape ``(N, 2)`` or ``(N, 3)``)."""
+
+    def __init__(self, starts, ends, color=WHITE, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+        super().__init__(color=color, stroke_width=stroke_width, **kwargs)
+        self.set_segments(starts, ends)
+
+    def set_segments(self, starts, ends):
+        starts, ends = _as_points(starts), _as_points(ends)
+        # A straight cubic Bezier has its handles at the thirds
+        t = np.array([0, 1/3, 2/3, 1])[None, :, None]
+        self.set_points((starts[:, None, :] + t * (ends - starts)[:, None, :]).reshape(-1, 3))
+        return self
+
+    @property
+    def num_segments(self):
+        return len(self.points) // 4
+
+
+def polyline_set(points, color=WHITE, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+    """Many polylines as one :class:`LineSet`; ``points`` has shape ``(K, M, 2)`` or ``(K, M, 3)``.
+
+    Consecutive segments of a polyline share their end points, so each
+    polyline is one continuous subpath with proper joins.
+    """
+    points = np.asarray(points, dtype=float)
+    starts = points[:, :-1].reshape(-1, points.shape[-1])
+    ends = points[:, 1:].reshape(-1, points.shape[-1])
+    return LineSet(starts, ends, color=color, stroke_width=stroke_width, **kwargs)
+
+
+def dot_clouds(points, colors, radius=DEFAULT_DOT_RADIUS, **kwargs):
+    """One :class:`DotCloud` per distinct color, as a ``VGroup``.
+
+    ``colors`` holds one color per point; ``radius`` is a scalar or one per point.
+    """
+    points = _as_points(points)
+    colors = np.asarray([str(color) for color in colors])
+    radius = np.broadcast_to(np.asarray(radius, dtype=float), len(points))
+    clouds = VGroup()
+    for color in dict.fromkeys(colors):
+        mask = colors == color
+        clouds.add(DotCloud(points[mask], radius[mask], color=color, **kwargs))
+    return clouds
+
+
+def coordinate_grid(axes, x_values, y_values, x_color=BLUE, y_color=RED, stroke_width=1, **kwargs):
+    """Grid lines of ``axes``: a vertical line at each x and a horizontal one at each y.
+
+    Lines span the extent of the other values, as in the hand-built grids of
+    the scenes.  Returns ``VGroup(vertical, horizontal)``.
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    y_low, y_high = np.full_like(x_values, y_values[0]), np.full_like(x_values, y_values[-1])
+    x_low, x_high = np.full_like(y_values, x_values[0]), np.full_like(y_values, x_values[-1])
+    vertical = LineSet(
+        coords_to_points(axes, np.column_stack([x_values, y_low])),
+        coords_to_points(axes, np.column_stack([x_values, y_high])),
+        color=x_color, stroke_width=stroke_width, **kwargs,
+    )
+    horizontal = LineSet(
+        coords_to_points(axes, np.column_stack([x_low, y_values])),
+        coords_to_points(axes, np.column_stack([x_high, y_values])),
+        color=y_color, stroke_width=stroke_width, **kwargs,
+    )
+    return VGroup(vertical, horizontal)
+
+
+class MobiusTransform(Animation):
+    """Apply the disk isometries ``isometry(t)`` (a ``(2, 2)`` matrix, the identity at 0) to ``mobject``.
+
+    ``mobject`` is drawn in a Poincaré disk of ``radius`` around ``center``.
+    The points of its whole family are gathered into one complex array when
+    the animation begins, and every frame maps that cached array through the
+    isometry of the current time in one vectorized call, so rounding errors
+    do not build up from frame to frame.  Control points are mapped like any
+    other point, which is accurate for finely sampled curves.
+    """
+
+    def __init__(self, mobject, isometry, radius=1.0, center=ORIGIN, **kwargs):
+        self.isometry = isometry
+        self.radius = radius
+        self.center = np.asarray(center, dtype=float)
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        self.members = [member for member in self.mobject.get_family() if len(member.points)]
+        points = np.concatenate([member.points for member in self.members])
+        self.splits = np.cumsum([len(member.points) for member in self.members])[:-1]
+        disk = (points - self.center) / self.radius
+        self.original = disk[:, 0] + 1j * disk[:, 1]
+        self.depth = points[:, 2]
+        super().begin()
+
+    def create_starting_mobject(self):
+        # The cached points replace the usual copy of the mobject
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        z = apply_mobius(self.isometry(self.rate_func(alpha)), self.original)
+        points = np.column_stack([z.real, z.imag, np.zeros_like(self.depth)]) * self.radius + self.center
+        points[:, 2] = self.depth
+        for member, member_points in zip(self.members, np.split(points, self.splits)):
+            member.points = member_points
+
+
+class GraphMorph(Animation):
+    """Morph the graph ``curve`` through the rows of ``values`` (shape ``(T, N)``) over ``x`` (shape ``(N,)``).
+
+    ``curve`` is a polyline of N points on ``axes``, e.g. from :func:`polyline`
+    or :func:`graphs`.  The Bezier control points of all T frames are
+    computed once when the animation begins; each rendered frame blends the
+    two nearest of them into the curve's existing point array, so no
+    mobject or array is allocated per frame and a few hundred precomputed
+    frames play smoothly at any frame rate.
+    """
+
+    def __init__(self, curve, axes, x, values, **kwargs):
+        self.axes = axes
+        self.x = np.asarray(x, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        super().__init__(curve, **kwargs)
+
+    def begin(self):
+        anchors = coords_to_points(self.axes, graph_coords(self.x, self.values))
+        # set_points_as_corners: straight cubic segments with handles at the thirds
+        t = np.array([0, 1/3, 2/3, 1])[None, None, :, None]
+        starts, ends = anchors[:, :-1, None, :], anchors[:, 1:, None, :]
+        self.frames = (starts + t * (ends - starts)).reshape(len(anchors), -1, 3)
+        if self.mobject.points.shape != self.frames.shape[1:]:
+            self.mobject.set_points(self.frames[0].copy())
+        self.buffer = np.empty_like(self.frames[0])
+        super().begin()
+
+    def create_starting_mobject(self):
+        # The precomputed frames replace the usual copy of the mobject
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        position = np.clip(self.rate_func(alpha), 0, 1) * (len(self.frames) - 1)
+        index = min(int(position), len(self.frames) - 2) if len(self.frames) > 1 else 0
+        weight = position - index
+        points = self.mobject.points
+        np.multiply(self.frames[index], 1 - weight, out=points)
+        if weight:
+            np.multiply(self.frames[index + 1], weight, out=self.buffer)
+            points += self.buffer
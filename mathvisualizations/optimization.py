@@ -0,0 +1,62 @@
+"""Loss landscape and gradient descent paths of the machine learning scene."""
+
+import numpy as np
+
+
+def loss_function(x, y):
+    # L = (x-1)² + (y-1)² + 0.5 sin(2πx) sin(2πy)
+    return (x-1)**2 + (y-1)**2 + 0.5 * np.sin(2*np.pi*x) * np.sin(2*np.pi*y)
+
+
+def loss_gradient(x, y):
+    # ∇L, shape (..., 2)
+    dx = 2 * (x - 1) + np.pi * np.cos(2*np.pi*x) * np.sin(2*np.pi*y)
+    dy = 2 * (y - 1) + np.pi * np.sin(2*np.pi*x) * np.cos(2*np.pi*y)
+    return np.stack(np.broadcast_arrays(dx, dy), axis=-1)
+
+
+def parameter_metric(x, y):
+    # Fisher-like metric with σ = 1 + 0.2r: g_11 = g_22 = 1/σ², g_12 = 0.1 sin(x + y)
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    sigma = 1 + 0.2 * np.hypot(x, y)
+    G = np.empty(x.shape + (2, 2))
+    G[..., 0, 0] = G[..., 1, 1] = 1 / sigma**2
+    G[..., 0, 1] = G[..., 1, 0] = 0.1 * np.sin(x + y)
+    return G
+
+
+def gradient_descent(start, learning_rate=0.1, steps=20, metric=None):
+    """Iterates of (natural) gradient descent on :func:`loss_function`.
+
+    ``start`` may hold several starting points, shape ``(..., 2)``; the
+    result has shape ``(steps + 1, ..., 2)``.  With a ``metric`` the step is
+    the natural gradient G⁻¹∇L, falling back to ∇L where G is singular.
+    """
+    current = np.array(start, dtype=float)
+    path = [current.copy()]
+    for _ in range(steps):
+        gradient = loss_gradient(current[..., 0], current[..., 1])
+        if metric is not None:
+            G = metric(current[..., 0], current[..., 1])
+            singular = np.isclose(np.linalg.det(G), 0)
+            G[singular] = np.eye(2)
+            gradient = np.linalg.solve(G, gradient[..., None])[..., 0]
+        current = current - learning_rate * gradient
+        path.append(current.copy())
+    return np.array(path)
+
+
+def natural_gradient_descent(start, learning_rate=0.1, steps=20, metric=parameter_metric):
+    return gradient_descent(start, learning_rate, steps, metric)
+
+
+def loss_contour_points(level, num=100, tolerance=0.1, extent=2):
+    """Grid points where the loss is within ``tolerance`` of ``level``.
+
+    The ``num × num`` grid covers ``[-extent, extent]²``; points are returned
+    x-major with shape ``(M, 2)``.
+    """
+    values = np.linspace(-extent, extent, num)
+    x, y = np.meshgrid(values, values, indexing="ij")
+    mask = np.abs(loss_function(x, y) - level) < tolerance
+    return np.stack([x[mask], y[mask]], axis=-1)
@@ -0,0 +1,5 @@
+"""Render tooling built on top of Manim's renderer.
+
+Every module in this subpackage imports Manim.  Each tool can be run as a
+script, e.g. ``python -m mathvisualizations.render.incremental``.
+"""
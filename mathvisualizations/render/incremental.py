@@ -0,0 +1,78 @@
+"""Incremental re-rendering of a single scene.
+
+Manim fingerprints every ``self.play``/``self.wait`` call from the state of
+the mobjects on screen, the animation parameters and the camera, and names
+the partial movie after that hash.  A call whose hash already has a file in
+``media/videos/partial_movie_files/<Scene>`` is not rendered again, so after
+an edit only the invalidated segments, and the later segments whose starting
+state changed with them, are re-encoded.  This tool renders with that cache
+forced on and reports which segments were reused::
+
+    python -m mathvisualizations.render.incremental fisher_metric_detailed.py FisherMetricDetailed -q l
+"""
+
+import argparse
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from .loader import QUALITIES, load_scene
+from .profiling import profile_if_enabled
+
+# Manim deletes the oldest partial movies once a scene has more than
+# max_files_cached of them, and FisherInformationManifold alone has 100
+MAX_FILES_CACHED = 1000
+
+
+def render_incremental(scene_class, quality="medium_quality", **options):
+    """Render ``scene_class`` reusing cached segments.
+
+    Extra keyword arguments are config options for this render.  Returns
+    the scene and one dict per play/wait call with its index, hash and
+    whether the segment was ``"reused"`` from the cache or ``"rendered"``.
+    """
+    options = {
+        "quality": quality,
+        "disable_caching": False,
+        "max_files_cached": max(config.max_files_cached, MAX_FILES_CACHED),
+        **options,
+    }
+    with tempconfig(options):
+        scene = profile_if_enabled(scene_class)()
+        partial_dir = Path(scene.renderer.file_writer.partial_movie_directory)
+        cached = {path.stem for path in partial_dir.glob(f"*{config.movie_file_extension}")}
+        scene.render()
+
+    segments = []
+    for index, hash_ in enumerate(scene.renderer.animations_hashes):
+        status = "reused" if hash_ in cached else "rendered"
+        segments.append({"index": index, "hash": hash_, "status": status})
+    return scene, segments
+
+
+def format_report(scene_name, segments):
+    rendered = [segment["index"] for segment in segments if segment["status"] == "rendered"]
+    report = f"{scene_name}: {len(segments)} segments, {len(segments) - len(rendered)} reused, {len(rendered)} rendered"
+    if rendered:
+        report += f" (first invalidated segment: {rendered[0]})"
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-render only the segments of a scene whose inputs changed.")
+    parser.add_argument("file", help="scene file, e.g. fisher_metric_detailed.py")
+    parser.add_argument("scene", help="scene class name, e.g. FisherMetricDetailed")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="m")
+    parser.add_argument("-v", "--verbose", action="store_true", help="list every segment")
+    args = parser.parse_args(argv)
+
+    scene_class = load_scene(args.file, args.scene)
+    _, segments = render_incremental(scene_class, QUALITIES[args.quality])
+    if args.verbose:
+        for segment in segments:
+            print(f"  {segment['index']:3d}  {segment['status']:8s}  {segment['hash']}")
+    print(format_report(args.scene, segments))
+
+
+if __name__ == "__main__":
+    main()
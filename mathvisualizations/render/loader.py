@@ -0,0 +1,39 @@
+"""Load scene classes from the scene files at the repository root."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# -q flags of the manim CLI
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_module(file_name):
+    # Import a scene file the same way the manim CLI does, with its folder on
+    # sys.path so that it can import its neighbours
+    path = Path(file_name).resolve()
+    module_name = path.stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene(file_name, scene_name):
+    module = load_module(file_name)
+    try:
+        return getattr(module, scene_name)
+    except AttributeError:
+        raise ValueError(f"{file_name} does not define a scene named {scene_name!r}") from None
@@ -0,0 +1,331 @@
+"""Per-animation profiling: where the render time of a scene goes.
+
+Every ``play``/``wait`` call, every ``MathTex``/``Tex`` compile and every
+encoder flush is timed (wall and CPU) and, optionally, its memory
+allocations are traced.  The scene code that runs between two plays is
+recorded as a ``build`` span, so Python geometry and mobject construction
+show up next to rasterization (``raster``), frame hand-off to the encoder
+(``encode``) and LaTeX (``tex``).
+
+Profiling is switched on in the ``[profiling]`` section of ``manim.cfg``::
+
+    [profiling]
+    enabled = True
+
+and then applies to every render tool in this package.  When it is off the
+scene class is used unchanged, so there is no overhead at all.  Each
+profiled render writes ``<Scene>.json`` and ``<Scene>.folded`` (collapsed
+stacks in microseconds, for ``flamegraph.pl`` or speedscope) to the output
+directory::
+
+    python -m mathvisualizations.render.profiling affine_connection_3d.py AffineConnection3D -q l
+"""
+
+import argparse
+import configparser
+import json
+import re
+import time
+import tracemalloc
+from pathlib import Path
+
+from manim import Wait, tempconfig
+from manim.mobject.text import tex_mobject
+
+from .loader import QUALITIES, load_scene
+
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "output_dir": "./media/profiles",
+    "track_allocations": True,
+}
+
+# Spans reported individually; the others only appear in the call tree
+RECORDED_KINDS = ("play", "wait", "tex", "flush")
+
+
+def load_settings(path="manim.cfg"):
+    """Read the ``[profiling]`` section of a manim config file."""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return {
+        "enabled": parser.getboolean("profiling", "enabled", fallback=DEFAULT_SETTINGS["enabled"]),
+        "output_dir": parser.get("profiling", "output_dir", fallback=DEFAULT_SETTINGS["output_dir"]),
+        "track_allocations": parser.getboolean(
+            "profiling", "track_allocations", fallback=DEFAULT_SETTINGS["track_allocations"]
+        ),
+    }
+
+
+def _node(kind, name):
+    return {"kind": kind, "name": name, "calls": 0, "wall": 0.0, "cpu": 0.0,
+            "alloc_bytes": 0, "peak_bytes": 0, "children": {}}
+
+
+class Profiler:
+    """Nested wall/CPU/allocation spans merged into a call tree."""
+
+    def __init__(self, name, track_allocations=False):
+        self.track_allocations = track_allocations
+        self.tree = _node("scene", name)
+        self.records = []
+        self.stack = []
+
+    def _memory(self):
+        if not self.track_allocations:
+            return 0, 0
+        return tracemalloc.get_traced_memory()
+
+    def push(self, kind, name, **info):
+        current, peak = self._memory()
+        if self.stack:
+            # Fold the peak seen so far into the enclosing span before resetting it
+            parent = self.stack[-1]
+            parent["peak"] = max(parent["peak"], peak)
+        if self.track_allocations:
+            tracemalloc.reset_peak()
+        parent_node = self.stack[-1]["node"] if self.stack else None
+        if parent_node is None:
+            node = self.tree
+        else:
+            node = parent_node["children"].setdefault((kind, name), _node(kind, name))
+        self.stack.append({
+            "kind": kind, "name": name, "info": info, "node": node,
+            "wall": time.perf_counter(), "cpu": time.process_time(),
+            "memory": current, "peak": current,
+        })
+
+    def pop(self):
+        wall, cpu = time.perf_counter(), time.process_time()
+        current, peak = self._memory()
+        span = self.stack.pop()
+        span["peak"] = max(span["peak"], peak)
+        if self.stack:
+            self.stack[-1]["peak"] = max(self.stack[-1]["peak"], span["peak"])
+        if self.track_allocations:
+            tracemalloc.reset_peak()
+
+        record = {
+            "wall": wall - span["wall"],
+            "cpu": cpu - span["cpu"],
+            "alloc_bytes": current - span["memory"],
+            "peak_bytes": span["peak"] - span["memory"],
+        }
+        node = span["node"]
+        node["calls"] += 1
+        for key in ("wall", "cpu", "alloc_bytes"):
+            node[key] += record[key]
+        node["peak_bytes"] = max(node["peak_bytes"], record["peak_bytes"])
+
+        if span["kind"] in RECORDED_KINDS:
+            self.records.append({"kind": span["kind"], "name": span["name"], **span["info"], **record})
+        return record
+
+    def measure(self, kind, name, function):
+        # Wrap ``function`` so every call is recorded as a span
+        def measured(*args, **kwargs):
+            self.push(kind, name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.pop()
+        return measured
+
+    def report(self):
+        """JSON-serializable report: totals, individual spans and the call tree."""
+        def export(node):
+            children = [export(child) for child in node["children"].values()]
+            return {**{k: v for k, v in node.items() if k != "children"}, "children": children}
+
+        tree = export(self.tree)
+        by_kind = {}
+        for record in self.records:
+            by_kind.setdefault(record["kind"], []).append(record)
+        return {
+            "scene": self.tree["name"],
+            "track_allocations": self.track_allocations,
+            "total": {k: tree[k] for k in ("wall", "cpu", "alloc_bytes", "peak_bytes")},
+            "by_kind": _totals_by_kind(tree),
+            "animations": by_kind.get("play", []) + by_kind.get("wait", []),
+            "tex": by_kind.get("tex", []),
+            "flushes": by_kind.get("flush", []),
+            "tree": tree,
+        }
+
+    def folded_stacks(self):
+        """Collapsed stacks (``a;b;c <self time in µs>``) for flame graph tools."""
+        lines = []
+
+        def walk(node, prefix):
+            frame = _frame_name(node)
+            path = f"{prefix};{frame}" if prefix else frame
+            children = node["children"].values()
+            own = node["wall"] - sum(child["wall"] for child in children)
+            if own > 0:
+                lines.append(f"{path} {round(own * 1e6)}")
+            for child in children:
+                walk(child, path)
+
+        walk(self.tree, "")
+        return "\n".join(lines) + "\n"
+
+
+def _frame_name(node):
+    # Flame graph tools split frames on ";" and take the count after the last space
+    name = re.sub(r"\s+", " ", str(node["name"])).replace(";", ",").strip()
+    if len(name) > 60:
+        name = name[:57] + "..."
+    return f"{node['kind']} {name}" if node["kind"] != "scene" else name
+
+
+def _totals_by_kind(tree):
+    # Self time per span kind, so nested spans are not counted twice
+    totals = {}
+
+    def walk(node):
+        own = node["wall"] - sum(child["wall"] for child in node["children"])
+        totals[node["kind"]] = totals.get(node["kind"], 0.0) + own
+        for child in node["children"]:
+            walk(child)
+
+    walk(tree)
+    return totals
+
+
+def _describe_play(args):
+    names = []
+    for animation in args:
+        mobject = getattr(animation, "mobject", None)
+        if mobject is None:
+            names.append(type(animation).__name__)
+        else:
+            names.append(f"{type(animation).__name__}({type(mobject).__name__})")
+    return ", ".join(names)
+
+
+class _ProfilingMixin:
+    # Set by profiled_scene_class
+    profile_output_dir = None
+    profile_track_allocations = False
+
+    def render(self, *args, **kwargs):
+        self.profiler = Profiler(type(self).__name__, self.profile_track_allocations)
+        started_tracing = self.profile_track_allocations and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        # MathTex and Tex compile through this module-level import
+        compile_tex = tex_mobject.tex_to_svg_file
+
+        def measured_tex(expression, *tex_args, **tex_kwargs):
+            self.profiler.push("tex", expression)
+            try:
+                return compile_tex(expression, *tex_args, **tex_kwargs)
+            finally:
+                self.profiler.pop()
+
+        tex_mobject.tex_to_svg_file = measured_tex
+        renderer = self.renderer
+        file_writer = renderer.file_writer
+        renderer.camera.capture_mobjects = self.profiler.measure(
+            "raster", "capture_mobjects", renderer.camera.capture_mobjects
+        )
+        file_writer.write_frame = self.profiler.measure("encode", "write_frame", file_writer.write_frame)
+        file_writer.end_animation = self.profiler.measure("flush", "end_animation", file_writer.end_animation)
+        file_writer.finish = self.profiler.measure("flush", "finish", file_writer.finish)
+
+        self.profiler.push("scene", type(self).__name__)
+        self.profiler.push("build", f"{0:03d}")
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self.profiler.pop()
+            self.profiler.pop()
+            tex_mobject.tex_to_svg_file = compile_tex
+            if started_tracing:
+                tracemalloc.stop()
+            self.profile_paths = write_report(self.profiler, self.profile_output_dir)
+
+    def play(self, *args, **kwargs):
+        index = self.renderer.num_plays
+        kind = "wait" if args and all(isinstance(a, Wait) for a in args) else "play"
+        # End the build span of the code that led up to this call
+        self.profiler.pop()
+        self.profiler.push(kind, f"{index:03d} {_describe_play(args)}", index=index)
+        try:
+            super().play(*args, **kwargs)
+        finally:
+            self.profiler.pop()
+            self.profiler.push("build", f"{index + 1:03d}")
+
+
+def profiled_scene_class(scene_class, output_dir=None, track_allocations=None):
+    settings = load_settings()
+    if output_dir is None:
+        output_dir = settings["output_dir"]
+    if track_allocations is None:
+        track_allocations = settings["track_allocations"]
+    # Keep the scene's name so the file writer uses the usual directories
+    return type(
+        scene_class.__name__,
+        (_ProfilingMixin, scene_class),
+        {
+            "profile_output_dir": str(output_dir),
+            "profile_track_allocations": track_allocations,
+        },
+    )
+
+
+def profile_if_enabled(scene_class):
+    """``scene_class`` itself, or a profiled subclass if ``manim.cfg`` enables profiling."""
+    if not load_settings()["enabled"]:
+        return scene_class
+    return profiled_scene_class(scene_class)
+
+
+def write_report(profiler, output_dir):
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    name = profiler.tree["name"]
+    json_path = output_dir / f"{name}.json"
+    json_path.write_text(json.dumps(profiler.report(), indent=2))
+    folded_path = output_dir / f"{name}.folded"
+    folded_path.write_text(profiler.folded_stacks())
+    return json_path, folded_path
+
+
+def format_summary(report, limit=10):
+    lines = [f"{report['scene']}: {report['total']['wall']:.2f}s wall, {report['total']['cpu']:.2f}s CPU"]
+    for kind, seconds in sorted(report["by_kind"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {kind:<6} {seconds:8.3f}s")
+    slowest = sorted(report["animations"], key=lambda record: -record["wall"])[:limit]
+    if slowest:
+        lines.append("Slowest play/wait calls:")
+        for record in slowest:
+            lines.append(f"  {record['wall']:8.3f}s  {record['name']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene and report where the time went.")
+    parser.add_argument("file", help="scene file, e.g. affine_connection_3d.py")
+    parser.add_argument("scene", help="scene class name, e.g. AffineConnection3D")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="m")
+    parser.add_argument("-o", "--output-dir", help="defaults to output_dir in manim.cfg")
+    parser.add_argument("--no-allocations", action="store_true", help="skip tracemalloc, which slows the render")
+    args = parser.parse_args(argv)
+
+    scene_class = load_scene(args.file, args.scene)
+    track_allocations = False if args.no_allocations else None
+    # Asking for a profile explicitly does not need the manim.cfg switch
+    scene_class = profiled_scene_class(scene_class, args.output_dir, track_allocations)
+    with tempconfig({"quality": QUALITIES[args.quality]}):
+        scene = scene_class()
+        scene.render()
+    print(format_summary(scene.profiler.report()))
+    for path in scene.profile_paths:
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
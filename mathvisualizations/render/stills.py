@@ -0,0 +1,114 @@
+"""Still-frame fast path: PNG keyframes without rendering any video.
+
+``construct()`` runs with every animation collapsed to its end state, so no
+intermediate frames are rasterized and nothing is encoded.  A frame is only
+drawn where one is requested: at given timestamps, at every ``play``/``wait``
+boundary, and at the end of the scene::
+
+    python -m mathvisualizations.render.stills torus_manifold.py TorusManifold
+    python -m mathvisualizations.render.stills fisher_matrix_values.py FisherMatrixValues --every-play
+    python -m mathvisualizations.render.stills torus_manifold.py TorusManifold -t 2 4.5 -q h
+"""
+
+import argparse
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from .loader import QUALITIES, load_scene
+from .profiling import profile_if_enabled
+
+
+class _StillsMixin:
+    # Set by still_scene_class
+    still_timestamps = ()
+    still_every_play = False
+    still_output_dir = None
+
+    def setup(self):
+        super().setup()
+        self.still_pending = sorted(self.still_timestamps)
+        self.still_paths = []
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        # Waits are frozen frames and never reach play_internal, so anything
+        # still pending up to here sees the end state
+        end = self.renderer.time
+        while self.still_pending and self.still_pending[0] <= end:
+            self.save_still(f"t_{self.still_pending.pop(0):07.2f}s")
+        if self.still_every_play:
+            self.save_still(f"play_{self.renderer.num_plays - 1:03d}")
+
+    def play_internal(self, skip_rendering=False):
+        # The renderer has already advanced its clock past this (skipped) play
+        start = self.renderer.time - self.duration
+        while self.still_pending and self.still_pending[0] < self.renderer.time:
+            t = self.still_pending.pop(0)
+            self.update_to_time(max(t - start, 0))
+            self.save_still(f"t_{t:07.2f}s")
+        super().play_internal(skip_rendering)
+
+    def save_still(self, name):
+        self.renderer.static_image = None
+        self.renderer.update_frame(self, ignore_skipping=True)
+        path = Path(self.still_output_dir) / f"{name}.png"
+        self.renderer.camera.get_image().save(path)
+        self.still_paths.append(path)
+
+
+def still_scene_class(scene_class, output_dir, timestamps=(), every_play=False):
+    # Keep the scene's name so the file writer uses the usual directories
+    return type(
+        scene_class.__name__,
+        (_StillsMixin, scene_class),
+        {
+            "still_timestamps": tuple(timestamps),
+            "still_every_play": every_play,
+            "still_output_dir": str(output_dir),
+        },
+    )
+
+
+def render_stills(scene_class, output_dir=None, timestamps=(), every_play=False, quality="medium_quality"):
+    """Write PNG keyframes of ``scene_class`` and return their paths.
+
+    The final frame is always written as ``final.png``.
+    """
+    if output_dir is None:
+        output_dir = Path(config.media_dir) / "images" / scene_class.__name__
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    options = {
+        "quality": quality,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+    }
+    with tempconfig(options):
+        scene_class = profile_if_enabled(still_scene_class(scene_class, output_dir, timestamps, every_play))
+        scene = scene_class(skip_animations=True)
+        scene.render()
+        scene.save_still("final")
+    return scene.still_paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write still frames of a scene without rendering its animations.")
+    parser.add_argument("file", help="scene file, e.g. torus_manifold.py")
+    parser.add_argument("scene", help="scene class name, e.g. TorusManifold")
+    parser.add_argument("-t", "--timestamps", type=float, nargs="+", default=(), help="scene times in seconds")
+    parser.add_argument("--every-play", action="store_true", help="write a frame after every play/wait call")
+    parser.add_argument("-o", "--output-dir", help="defaults to media/images/<Scene>")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="m")
+    args = parser.parse_args(argv)
+
+    scene_class = load_scene(args.file, args.scene)
+    paths = render_stills(scene_class, args.output_dir, args.timestamps, args.every_play, QUALITIES[args.quality])
+    for path in paths:
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
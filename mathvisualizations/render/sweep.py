@@ -0,0 +1,207 @@
+"""Render every combination of a parameter grid of one scene.
+
+Parameters are class attributes of the scene (``TorusManifold.R``,
+``AffineConnection3D.surface_params``, ``FisherMetricDetailed.dist1_params``);
+a dotted name sets one entry of a dict attribute.  Values are JSON lists::
+
+    python -m mathvisualizations.render.sweep torus_manifold.py TorusManifold -p R=[1.5,2,2.5] -p r=[0.5,0.8]
+    python -m mathvisualizations.render.sweep affine_connection_3d.py AffineConnection3D \\
+        -p surface_params.a=[0.1,0.15,0.2] -p surface_params.b=[0,0.08] -j 4
+    python -m mathvisualizations.render.sweep fisher_metric_detailed.py FisherMetricDetailed \\
+        -p "dist2_params=[[1,0.8],[0.5,1.2]]" -q l
+
+Variants keep the scene's class name, so segments that do not depend on the
+parameters (titles, axes, shared surfaces) hash the same in every variant.
+The first variant is rendered on its own into the scene's partial movie
+cache; every other variant then renders in a process pool into its own
+partial movie directory, ``partial_movie_files/<variant>``, prefilled with
+hard links to the cached segments, so it reuses them without sharing the
+segment list or the files being encoded with the other workers.  Segments
+the variants rendered are linked back into the scene's cache afterwards.
+Each variant's movie is named ``<Scene>_<hash of its parameters>`` and
+listed with its parameters in ``media/sweeps/<Scene>/manifest.json``.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from manim import config
+
+from .incremental import MAX_FILES_CACHED, render_incremental
+from .loader import QUALITIES, load_scene
+
+
+def expand_grid(grid):
+    """One dict of parameters per combination, in the grid's key order."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def variant_name(scene_name, params):
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:10]
+    return f"{scene_name}_{digest}"
+
+
+def variant_class(scene_class, params):
+    """Subclass of ``scene_class`` with its parameter attributes replaced."""
+    attributes = {}
+    for key, value in params.items():
+        name, _, entry = key.partition(".")
+        if not hasattr(scene_class, name):
+            raise ValueError(f"{scene_class.__name__} has no parameter {name!r}")
+        if entry:
+            base = attributes.get(name, getattr(scene_class, name))
+            if not isinstance(base, dict) or entry not in base:
+                raise ValueError(f"{scene_class.__name__}.{name} has no entry {entry!r}")
+            attributes[name] = {**base, entry: value}
+        else:
+            attributes[name] = value
+    # Keep the scene's name so that unchanged segments hash the same in every variant
+    return type(scene_class.__name__, (scene_class,), attributes)
+
+
+def render_variant(
+    file_name, scene_name, params, quality="medium_quality", max_files_cached=MAX_FILES_CACHED, partial_movie_dir=None
+):
+    name = variant_name(scene_name, params)
+    record = {"name": name, "params": params}
+    options = {"output_file": name, "max_files_cached": max_files_cached}
+    if partial_movie_dir is not None:
+        options["partial_movie_dir"] = str(partial_movie_dir)
+    start = time.perf_counter()
+    try:
+        scene_class = variant_class(load_scene(file_name, scene_name), params)
+        scene, segments = render_incremental(scene_class, quality, **options)
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+        return record
+    file_writer = scene.renderer.file_writer
+    record.update(
+        output=str(file_writer.movie_file_path),
+        partial_movie_dir=str(file_writer.partial_movie_directory),
+        seconds=time.perf_counter() - start,
+        segments=len(segments),
+        reused=sum(segment["status"] == "reused" for segment in segments),
+    )
+    return record
+
+
+def link_segments(source, target):
+    """Hard-link the partial movies of ``source`` missing from ``target`` into it.
+
+    Files are copied where hard links are not possible.
+    """
+    source, target = Path(source), Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+    for path in source.glob(f"*{config.movie_file_extension}"):
+        destination = target / path.name
+        if destination.exists():
+            continue
+        try:
+            os.link(path, destination)
+        except OSError:
+            shutil.copy2(path, destination)
+
+
+def render_sweep(file_name, scene_name, grid, quality="medium_quality", workers=None, output_dir=None):
+    """Render every combination of ``grid`` and write a manifest of the outputs.
+
+    Returns the manifest; variants that failed carry an ``"error"`` entry.
+    """
+    variants = expand_grid(grid)
+    # Fail on unknown parameters before starting any render
+    scene_class = load_scene(file_name, scene_name)
+    for params in variants:
+        variant_class(scene_class, params)
+
+    first = render_variant(file_name, scene_name, variants[0], quality)
+    records = [first]
+    # Room in each cache for every segment of every variant
+    max_files_cached = max(MAX_FILES_CACHED, first.get("segments", 0) * len(variants))
+    rest = variants[1:]
+    if "partial_movie_dir" not in first:
+        # Without the scene's cache there is nothing to give each worker its
+        # own directory next to, so the others render one after another
+        records.extend(render_variant(file_name, scene_name, params, quality, max_files_cached) for params in rest)
+    elif rest:
+        cache = Path(first["partial_movie_dir"])
+        directories = [cache.parent / variant_name(scene_name, params) for params in rest]
+        for directory in directories:
+            link_segments(cache, directory)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(render_variant, file_name, scene_name, params, quality, max_files_cached, directory)
+                for params, directory in zip(rest, directories)
+            ]
+            records.extend(future.result() for future in futures)
+        for directory in directories:
+            link_segments(directory, cache)
+
+    manifest = {
+        "scene": scene_name,
+        "file": str(file_name),
+        "quality": quality,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "grid": grid,
+        "variants": records,
+    }
+    if output_dir is None:
+        output_dir = Path(config.media_dir) / "sweeps" / scene_name
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def _parse_parameter(text):
+    key, separator, values = text.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"expected KEY=[values], got {text!r}")
+    try:
+        values = json.loads(values)
+    except json.JSONDecodeError as error:
+        raise argparse.ArgumentTypeError(f"{key}: {error}") from None
+    if not isinstance(values, list):
+        values = [values]
+    return key, values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene for every combination of a parameter grid.")
+    parser.add_argument("file", help="scene file, e.g. torus_manifold.py")
+    parser.add_argument("scene", help="scene class name, e.g. TorusManifold")
+    parser.add_argument("-p", "--param", type=_parse_parameter, action="append", default=[],
+                        metavar="KEY=[VALUES]", help="class attribute and the JSON list of values to sweep")
+    parser.add_argument("--grid", help="JSON file mapping parameters to lists of values")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="m")
+    parser.add_argument("-j", "--workers", type=int, help="processes in the pool (default: CPU count)")
+    parser.add_argument("-o", "--output-dir", help="defaults to media/sweeps/<Scene>")
+    args = parser.parse_args(argv)
+
+    grid = json.loads(Path(args.grid).read_text()) if args.grid else {}
+    grid.update(args.param)
+    if not grid:
+        parser.error("give at least one parameter with -p or --grid")
+
+    manifest = render_sweep(args.file, args.scene, grid, QUALITIES[args.quality], args.workers, args.output_dir)
+    failed = 0
+    for record in manifest["variants"]:
+        if "error" in record:
+            failed += 1
+            print(f"FAILED {record['name']} {record['params']}: {record['error']}")
+        else:
+            print(f"{record['output']}  ({record['reused']}/{record['segments']} segments reused)")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
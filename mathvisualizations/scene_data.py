@@ -0,0 +1,101 @@
+"""The arrays behind individual scenes, at any resolution.
+
+Each producer takes the scene's constants as keyword arguments (defaults
+match the scene) and returns ``(arrays, params)``, ready for
+:func:`mathvisualizations.datasets.export_dataset`.
+"""
+
+import numpy as np
+
+from .connections import geodesic_spray
+from .fisher import fisher_metric_normal, peak_density_surface
+from .optimization import gradient_descent, loss_function, natural_gradient_descent
+from .surfaces import (
+    saddle_christoffel_symbols,
+    saddle_metric,
+    saddle_surface,
+    torus_metric,
+    torus_surface,
+)
+
+
+def _grid(u_range, v_range, resolution):
+    u = np.linspace(*u_range, resolution)
+    v = np.linspace(*v_range, resolution)
+    return u, v, *np.meshgrid(u, v, indexing="ij")
+
+
+def torus_manifold(R=2, r=0.8, resolution=64):
+    u, v, uu, vv = _grid((0, 2*np.pi), (0, 2*np.pi), resolution)
+    arrays = {
+        "u": u,
+        "v": v,
+        "points": torus_surface(uu, vv, R, r),
+        "metric": torus_metric(uu, vv, R, r),
+    }
+    return arrays, {"R": R, "r": r, "resolution": resolution}
+
+
+def _saddle(u_range, resolution, spray_point, spray_num, params):
+    u, v, uu, vv = _grid(u_range, u_range, resolution)
+    spray = geodesic_spray(
+        lambda x, y: saddle_christoffel_symbols(x, y, **params), spray_point, num=spray_num, t_max=1.5
+    )
+    arrays = {
+        "u": u,
+        "v": v,
+        "points": saddle_surface(uu, vv, **params),
+        "metric": saddle_metric(uu, vv, **params),
+        "christoffel": saddle_christoffel_symbols(uu, vv, **params),
+        # (steps + 1, spray_num, 2) parameter coordinates and their points on the surface
+        "spray": spray,
+        "spray_points": saddle_surface(spray[..., 0], spray[..., 1], **params),
+    }
+    settings = {
+        "u_range": list(u_range), "resolution": resolution,
+        "spray_point": list(spray_point), "spray_num": spray_num,
+    }
+    return arrays, {**params, **settings}
+
+
+def affine_connection_3d(a=0.15, b=0.08, ku=3*np.pi, kv=2*np.pi, resolution=100,
+                         spray_point=(1.0, 1.0), spray_num=16):
+    return _saddle((-2.5, 2.5), resolution, spray_point, spray_num, dict(a=a, b=b, ku=ku, kv=kv))
+
+
+def metric_tensor_3d(a=0.1, b=0.05, ku=2*np.pi, kv=2*np.pi, resolution=100,
+                     spray_point=(1.0, 1.0), spray_num=16):
+    return _saddle((-3, 3), resolution, spray_point, spray_num, dict(a=a, b=b, ku=ku, kv=kv))
+
+
+def fisher_information_manifold(resolution=100):
+    mu, sigma, mm, ss = _grid((-2.5, 2.5), (0.3, 2.5), resolution)
+    arrays = {
+        "mu": mu,
+        "sigma": sigma,
+        "points": peak_density_surface(mm, ss),
+        "metric": fisher_metric_normal(mm, ss),
+    }
+    return arrays, {"resolution": resolution}
+
+
+def ml_information_geometry(resolution=200, learning_rate=0.1, steps=20, start=(-1.5, -1.5)):
+    x, y, xx, yy = _grid((-2, 2), (-2, 2), resolution)
+    arrays = {
+        "x": x,
+        "y": y,
+        "loss": loss_function(xx, yy),
+        "standard_path": gradient_descent(start, learning_rate, steps),
+        "natural_path": natural_gradient_descent(start, learning_rate, steps),
+    }
+    params = {"resolution": resolution, "learning_rate": learning_rate, "steps": steps, "start": list(start)}
+    return arrays, params
+
+
+SCENE_DATASETS = {
+    "torus_manifold": torus_manifold,
+    "affine_connection_3d": affine_connection_3d,
+    "metric_tensor_3d": metric_tensor_3d,
+    "fisher_information_manifold": fisher_information_manifold,
+    "ml_information_geometry": ml_information_geometry,
+}
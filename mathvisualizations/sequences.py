@@ -0,0 +1,33 @@
+"""Sequences shown in the topology scenes.
+
+Their convergence is measured by :mod:`~mathvisualizations.convergence`.
+"""
+
+import numpy as np
+
+
+def cauchy_sequence_point(n):
+    # x_n = 1/(n+1), converging to 0
+    return 1 / (np.asarray(n) + 1)
+
+
+def spiral_sequence(n, radius=1.5, decay=0.1, turn=np.pi / 3):
+    """Points of an inward spiral, shape ``(len(n), 2)`` for array ``n``.
+
+    The n-th term sits at angle ``n * turn`` and radius ``radius (1 - decay n)``.
+    """
+    n = np.asarray(n, dtype=float)
+    r = radius * (1 - decay * n)
+    return np.stack([r * np.cos(n * turn), r * np.sin(n * turn)], axis=-1)
+
+
+def wobbling_circle_sets(n, num_points=64, radius=0.6, amplitude=0.5, decay=0.7, lobes=3):
+    """Point samples of closed curves closing in on the circle of ``radius``, shape ``(len(n), num_points, 2)``.
+
+    The n-th curve has radius ``radius (1 + amplitude decay^n cos(lobes θ + n))``,
+    so its Hausdorff distance to the circle is ``radius amplitude decay^n``.
+    """
+    n = np.asarray(n, dtype=float)[..., None]
+    theta = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    r = radius * (1 + amplitude * decay**n * np.cos(lobes * theta + n))
+    return np.stack([r * np.cos(theta), r * np.sin(theta)], axis=-1)
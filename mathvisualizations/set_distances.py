@@ -0,0 +1,107 @@
+"""Hausdorff and Chamfer distances between point-sampled sets.
+
+A set is an array of sample points ``(P, d)``, and a sequence of sets is a
+list of them (sizes may differ) or one array ``(B, P, d)``.  With
+``d(x, B)`` the distance from ``x`` to the nearest point of ``B``:
+
+- Hausdorff: ``max(max_{x∈A} d(x, B), max_{y∈B} d(y, A))``
+- Chamfer: ``mean_{x∈A} d(x, B) + mean_{y∈B} d(y, A)``, less sensitive to outliers
+
+Each set is wrapped once in a :class:`PointSet` holding a
+``scipy.spatial.cKDTree`` of its points, and a coarse sample of every
+``stride``-th point in tree order with the distance from each point to its
+nearest coarse point.  The Hausdorff distance queries the coarse points of
+one set against the tree of the other; their largest distance is a lower
+bound, and only the points whose covering distance can lift them above it
+are queried exactly, a few percent of the points when the sets are apart.
+The result is exact.  Chamfer distances need every nearest neighbour and
+query all points.  Queries run on all cores.
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def _tree(points):
+    # Midpoint splits without shrinking the cells to their points: on curves
+    # the shrunk cells are thin slivers, and queries far from the curve visit
+    # ten times as many of them
+    return cKDTree(points, balanced_tree=False, compact_nodes=False)
+
+
+class PointSet:
+    """The sample points ``points`` (shape ``(P, d)``) of a set, with its KD-tree.
+
+    ``coarse`` are every ``stride``-th point in tree order; ``covering[i]``
+    is the distance from point ``i`` to its nearest coarse point
+    ``owner[i]``.
+    """
+
+    def __init__(self, points, stride=16, workers=-1):
+        self.points = np.asarray(points, dtype=float)
+        self.tree = _tree(self.points)
+        # Consecutive points in tree order are neighbours, so this is an even sample
+        self.coarse = self.points[self.tree.indices[::stride]]
+        self.covering, self.owner = _tree(self.coarse).query(self.points, workers=workers)
+
+    def nearest_distances(self, points, workers=-1):
+        """``d(x, self)`` for each of ``points`` (shape ``(N, d)``)."""
+        return self.tree.query(points, workers=workers)[0]
+
+    def __len__(self):
+        return len(self.points)
+
+
+def point_sets(sets):
+    """:class:`PointSet` s of ``sets``; those already built are reused."""
+    if isinstance(sets, PointSet):
+        return [sets]
+    return [s if isinstance(s, PointSet) else PointSet(s) for s in sets]
+
+
+def _as_point_set(points):
+    return points if isinstance(points, PointSet) else PointSet(points)
+
+
+def directed_hausdorff(a, b, workers=-1):
+    """``max_{x∈a} d(x, b)``, the largest distance from a point of ``a`` to the set ``b``."""
+    a, b = _as_point_set(a), _as_point_set(b)
+    # The coarse points are points of a, so the maximum is at least theirs, and
+    # d(x, b) ≤ |x - owner| + d(owner, b): only points reaching it remain
+    coarse = b.nearest_distances(a.coarse, workers)
+    candidates = a.covering + coarse[a.owner] >= coarse.max()
+    return b.nearest_distances(a.points[candidates], workers).max()
+
+
+def hausdorff_distance(a, b, workers=-1):
+    a, b = _as_point_set(a), _as_point_set(b)
+    return max(directed_hausdorff(a, b, workers), directed_hausdorff(b, a, workers))
+
+
+def chamfer_distance(a, b, workers=-1):
+    a, b = _as_point_set(a), _as_point_set(b)
+    return b.nearest_distances(a.points, workers).mean() + a.nearest_distances(b.points, workers).mean()
+
+
+SET_DISTANCES = {
+    "hausdorff": hausdorff_distance,
+    "chamfer": chamfer_distance,
+}
+
+
+def set_distances(sets, reference=None, kind="hausdorff", workers=-1):
+    """``kind`` distances ``(B,)`` of the sets ``sets`` to the set ``reference``.
+
+    Without ``reference`` the distances are between consecutive sets,
+    shape ``(B - 1,)``.  Every set is indexed once, also when it is
+    compared with both of its neighbours; passing :class:`PointSet` s
+    reuses their trees across calls.
+    """
+    distance = SET_DISTANCES[kind]
+    sets = point_sets(sets)
+    if reference is None:
+        pairs = zip(sets[:-1], sets[1:])
+    else:
+        reference = _as_point_set(reference)
+        pairs = ((s, reference) for s in sets)
+    return np.array([distance(a, b, workers) for a, b in pairs], dtype=float)
@@ -0,0 +1,155 @@
+"""Symmetric positive definite matrices with the affine-invariant metric.
+
+The covariances of d-dimensional normal distributions with a fixed mean
+form the SPD matrices, and their Fisher metric is half the affine-invariant
+metric ``<U, V>_P = tr(P⁻¹ U P⁻¹ V)``, so Fisher-Rao distances are
+:func:`distance` divided by √2.  Matrices are stacks of shape
+``(..., d, d)`` and every function works on whole stacks.  Matrix
+functions go through one ``np.linalg.eigh`` of the stack, and distances,
+geodesics and log maps only need the eigendecomposition of ``P^{-1/2} Q
+P^{-1/2}``.
+
+2×2 SPD matrices ``[[a, b], [b, c]]`` are the interior of the cone
+``z > sqrt(x² + y²)`` in the coordinates ``(x, y, z) = (b, (a - c)/2, (a + c)/2)``,
+see :func:`cone_coords`.
+"""
+
+import numpy as np
+
+
+def symmetrize(A):
+    return (A + np.swapaxes(A, -1, -2)) / 2
+
+
+def matrix_function(A, function):
+    """``V f(Λ) Vᵀ`` for the symmetric matrices ``A = V Λ Vᵀ`` (shape ``(..., d, d)``)."""
+    w, V = np.linalg.eigh(A)
+    return (V * function(w)[..., None, :]) @ np.swapaxes(V, -1, -2)
+
+
+def spd_sqrt(A):
+    return matrix_function(A, np.sqrt)
+
+
+def spd_inv_sqrt(A):
+    return matrix_function(A, lambda w: 1 / np.sqrt(w))
+
+
+def spd_log(A):
+    return matrix_function(A, np.log)
+
+
+def sym_exp(A):
+    return matrix_function(A, np.exp)
+
+
+def _whitening(P):
+    # P^{1/2} and P^{-1/2} from one eigendecomposition
+    w, V = np.linalg.eigh(P)
+    Vt = np.swapaxes(V, -1, -2)
+    root = np.sqrt(w)[..., None, :]
+    return (V * root) @ Vt, (V / root) @ Vt
+
+
+def log_map(P, Q):
+    """Tangent vectors at ``P`` pointing to ``Q``: ``P^{1/2} log(P^{-1/2} Q P^{-1/2}) P^{1/2}``."""
+    root, inv_root = _whitening(P)
+    return root @ spd_log(symmetrize(inv_root @ Q @ inv_root)) @ root
+
+
+def exp_map(P, V):
+    """End points ``P^{1/2} exp(P^{-1/2} V P^{-1/2}) P^{1/2}`` of the geodesics from ``P`` with velocity ``V``."""
+    root, inv_root = _whitening(P)
+    return root @ sym_exp(symmetrize(inv_root @ V @ inv_root)) @ root
+
+
+def distance(P, Q):
+    """Affine-invariant distance ``‖log(P^{-1/2} Q P^{-1/2})‖_F``, broadcasting over the stacks."""
+    _, inv_root = _whitening(P)
+    w = np.linalg.eigvalsh(symmetrize(inv_root @ Q @ inv_root))
+    return np.sqrt(np.sum(np.log(w)**2, axis=-1))
+
+
+def fisher_rao_distance(P, Q):
+    """Fisher-Rao distance between ``N(m, P)`` and ``N(m, Q)`` with a common mean."""
+    return distance(P, Q) / np.sqrt(2)
+
+
+def geodesic(P, Q, num=32):
+    """``num`` points ``P^{1/2} (P^{-1/2} Q P^{-1/2})^t P^{1/2}`` from ``P`` to ``Q``, shape ``(..., num, d, d)``."""
+    root, inv_root = _whitening(P)
+    w, V = np.linalg.eigh(symmetrize(inv_root @ Q @ inv_root))
+    t = np.linspace(0, 1, num)
+    # Powers of the eigenvalues for every t at once
+    powers = np.exp(t[:, None] * np.log(w)[..., None, :])
+    V = V[..., None, :, :]
+    root = root[..., None, :, :]
+    return root @ (V * powers[..., None, :]) @ np.swapaxes(V, -1, -2) @ root
+
+
+def log_euclidean_mean(matrices, weights=None):
+    """``exp(Σ wᵢ log Pᵢ)`` of stacks ``(..., B, d, d)`` with weights ``(..., B)``, the mean of the matrix logarithms."""
+    return sym_exp(_weighted_mean(spd_log(matrices), weights))
+
+
+def _weighted_mean(values, weights):
+    # Mean over the stack axis -3
+    if weights is None:
+        return np.mean(values, axis=-3)
+    weights = np.asarray(weights, dtype=float)[..., None, None]
+    return np.sum(weights * values, axis=-3) / np.sum(weights, axis=-3)
+
+
+def frechet_mean(matrices, weights=None, tol=1e-10, max_iter=50):
+    """Fréchet (Karcher) means of stacks of SPD matrices, minimizing the sum of squared distances.
+
+    ``matrices`` has shape ``(..., B, d, d)`` and ``weights`` ``(..., B)``;
+    the result has shape ``(..., d, d)``.  The iterations
+    ``M <- exp_M(mean of log_M(Pᵢ))`` start at the :func:`log_euclidean_mean`
+    and run on all groups together; a group stops when its step is below
+    ``tol``.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    shape = matrices.shape[:-3]
+    B, d = matrices.shape[-3:-1]
+    matrices = matrices.reshape(-1, B, d, d)
+    if weights is not None:
+        weights = np.broadcast_to(np.asarray(weights, dtype=float), shape + (B,)).reshape(-1, B)
+    mean = log_euclidean_mean(matrices, weights)
+    active = np.arange(len(mean))
+    for _ in range(max_iter):
+        root, inv_root = _whitening(mean[active])
+        # Mean of the log maps, in whitened coordinates at the current mean
+        logs = spd_log(symmetrize(inv_root[:, None] @ matrices[active] @ inv_root[:, None]))
+        step = _weighted_mean(logs, None if weights is None else weights[active])
+        mean[active] = root @ sym_exp(step) @ root
+        active = active[np.linalg.norm(step, axis=(-2, -1)) > tol]
+        if not len(active):
+            break
+    return mean.reshape(shape + (d, d))
+
+
+def cone_coords(A):
+    """Coordinates ``(b, (a - c)/2, (a + c)/2)`` of the 2×2 matrices ``[[a, b], [b, c]]``, shape ``(..., 3)``."""
+    A = np.asarray(A, dtype=float)
+    a, b, c = A[..., 0, 0], A[..., 0, 1], A[..., 1, 1]
+    return np.stack([b, (a - c) / 2, (a + c) / 2], axis=-1)
+
+
+def cone_matrix(coords):
+    """The 2×2 symmetric matrices with :func:`cone_coords` ``coords``, shape ``(..., 2, 2)``."""
+    coords = np.asarray(coords, dtype=float)
+    x, y, z = coords[..., 0], coords[..., 1], coords[..., 2]
+    return np.stack([np.stack([z + y, x], axis=-1), np.stack([x, z - y], axis=-1)], axis=-2)
+
+
+def cone_surface(u, v):
+    # Boundary z = sqrt(x² + y²) of the SPD cone at height u and angle v:
+    # the positive semidefinite matrices of rank one
+    return np.stack(np.broadcast_arrays(u * np.cos(v), u * np.sin(v), u), axis=-1).astype(float)
+
+
+def random_spd(num, d=2, spread=0.5, seed=0):
+    """``num`` random SPD matrices ``exp(S)`` with symmetric ``S`` of normal entries, shape ``(num, d, d)``."""
+    rng = np.random.default_rng(seed)
+    return sym_exp(symmetrize(spread * rng.standard_normal((num, d, d))))
@@ -0,0 +1,95 @@
+"""Parameterized surfaces and the geometry they induce.
+
+Surfaces return points with the coordinate axis last, so ``(3,)`` for
+scalar ``u, v`` and ``(..., 3)`` for arrays.  Metrics have shape
+``(..., 2, 2)`` and Christoffel symbols ``(..., 2, 2, 2)`` indexed as
+``gamma[..., λ, μ, ν] = Γ^λ_μν`` with coordinate 0 = u and 1 = v.
+"""
+
+import numpy as np
+
+
+def torus_surface(u, v, R=2, r=0.8):
+    # R: major radius, r: minor radius
+    x = (R + r * np.cos(v)) * np.cos(u)
+    y = (R + r * np.cos(v)) * np.sin(u)
+    z = r * np.sin(v)
+    return np.stack(np.broadcast_arrays(x, y, z), axis=-1)
+
+
+def torus_metric(u, v, R=2, r=0.8):
+    # g_uu = (R + r cos v)², g_vv = r², g_uv = 0
+    u, v = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+    G = np.zeros(u.shape + (2, 2))
+    G[..., 0, 0] = (R + r * np.cos(v))**2
+    G[..., 1, 1] = r**2
+    return G
+
+
+def saddle_surface(u, v, a=0.15, b=0.08, ku=3 * np.pi, kv=2 * np.pi):
+    # Saddle with modulation: z = a(u² - v²) + b sin(ku u) cos(kv v).
+    # With b = 0 this is the plain hyperbolic paraboloid z = a(u² - v²).
+    z = a * (u**2 - v**2) + b * np.sin(ku * u) * np.cos(kv * v)
+    return np.stack(np.broadcast_arrays(u, v, z), axis=-1).astype(float)
+
+
+def saddle_derivatives(u, v, a=0.15, b=0.08, ku=3 * np.pi, kv=2 * np.pi):
+    """First and second partial derivatives of :func:`saddle_surface`.
+
+    Returns ``(d1, d2)`` with ``d1[..., i, :] = ∂_i r`` and
+    ``d2[..., i, j, :] = ∂_i ∂_j r``.
+    """
+    u, v = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+    su, cu = np.sin(ku * u), np.cos(ku * u)
+    sv, cv = np.sin(kv * v), np.cos(kv * v)
+
+    d1 = np.zeros(u.shape + (2, 3))
+    d1[..., 0, 0] = 1
+    d1[..., 1, 1] = 1
+    d1[..., 0, 2] = 2 * a * u + b * ku * cu * cv
+    d1[..., 1, 2] = -2 * a * v - b * kv * su * sv
+
+    # Only the height varies to second order
+    d2 = np.zeros(u.shape + (2, 2, 3))
+    d2[..., 0, 0, 2] = 2 * a - b * ku**2 * su * cv
+    d2[..., 0, 1, 2] = d2[..., 1, 0, 2] = -b * ku * kv * cu * sv
+    d2[..., 1, 1, 2] = -2 * a - b * kv**2 * su * cv
+    return d1, d2
+
+
+def induced_metric(d1):
+    # g_ij = ∂_i r · ∂_j r
+    return np.einsum("...ik,...jk->...ij", d1, d1)
+
+
+def christoffel_symbols(d1, d2):
+    """Levi-Civita connection of the metric induced by an embedding.
+
+    Γ^λ_μν = ½ g^λσ (∂_μ g_νσ + ∂_ν g_μσ - ∂_σ g_μν), where the metric
+    derivatives come from ∂_k g_ij = ∂_k∂_i r · ∂_j r + ∂_i r · ∂_k∂_j r.
+    """
+    g_inv = np.linalg.inv(induced_metric(d1))
+    dg = np.einsum("...kia,...ja->...kij", d2, d1)
+    dg = dg + np.swapaxes(dg, -1, -2)
+    # First kind Γ_σμν, with dg[..., k, i, j] = ∂_k g_ij
+    first_kind = 0.5 * (
+        np.einsum("...mns->...smn", dg)
+        + np.einsum("...nms->...smn", dg)
+        - dg
+    )
+    return np.einsum("...ls,...smn->...lmn", g_inv, first_kind)
+
+
+def saddle_metric(u, v, **params):
+    d1, _ = saddle_derivatives(u, v, **params)
+    return induced_metric(d1)
+
+
+def saddle_christoffel_symbols(u, v, **params):
+    return christoffel_symbols(*saddle_derivatives(u, v, **params))
+
+
+def saddle_tangents(u, v, **params):
+    # Unit tangent vectors along u and v, shape (..., 2, 3)
+    d1, _ = saddle_derivatives(u, v, **params)
+    return d1 / np.linalg.norm(d1, axis=-1, keepdims=True)
@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.charts import curved_coordinates
+from mathvisualizations.metrics import radial_metric
+from mathvisualizations.mobjects import coordinate_grid
+
 class MetricProjection(Scene):
     def construct(self):
         # Set up the scene
@@ -31,19 +35,13 @@ class MetricProjection(Scene):
         left_label = Text("Curved Manifold\n(Metric g_μν)", font_size=18, color=RED).next_to(left_axes, DOWN)
         right_label = Text("Euclidean Projection\n(Flat Metric δ_μν)", font_size=18, color=GREEN).next_to(right_axes, DOWN)
         
-        # Create the curved coordinate system (polar-like coordinates)
-        def curved_coordinates(r, theta):
-            # This creates a curved coordinate system
-            x = r * np.cos(theta) * (1 + 0.2 * r**2)
-            y = r * np.sin(theta) * (1 + 0.2 * r**2)
-            return np.array([x, y])
-        
+        # The curved coordinate system (polar-like coordinates) comes from curved_coordinates
         # Create coordinate grid for curved space
         curved_grid = VGroup()
         
         # Radial lines
         for theta in np.linspace(0, 2*np.pi, 8, endpoint=False):
-            points = [curved_coordinates(r, theta) for r in np.linspace(0, 2, 20)]
+            points = curved_coordinates(np.linspace(0, 2, 20), theta)
             points = [left_axes.c2p(p[0], p[1], 0) for p in points]
             line = VMobject()
             line.set_points_as_corners(points)
@@ -53,7 +51,7 @@ class MetricProjection(Scene):
         
         # Concentric curves
         for r in np.linspace(0.5, 2, 4):
-            points = [curved_coordinates(r, theta) for theta in np.linspace(0, 2*np.pi, 50)]
+            points = curved_coordinates(r, np.linspace(0, 2*np.pi, 50))
             points = [left_axes.c2p(p[0], p[1], 0) for p in points]
             line = VMobject()
             line.set_points_as_corners(points)
@@ -62,27 +60,10 @@ class MetricProjection(Scene):
             curved_grid.add(line)
         
         # Create regular grid for Euclidean space
-        euclidean_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=right_axes.c2p(x, -2, 0),
-                end=right_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=2
-            )
-            euclidean_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=right_axes.c2p(-2, y, 0),
-                end=right_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=2
-            )
-            euclidean_grid.add(line)
+        euclidean_grid = coordinate_grid(
+            right_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9),
+            stroke_width=2,
+        )
         
         # Show coordinate systems
         self.play(Create(left_axes), Create(right_axes))
@@ -101,11 +82,8 @@ class MetricProjection(Scene):
         
         for pos in positions:
             x, y = pos
-            r = np.sqrt(x**2 + y**2)
             # Metric components that vary with position
-            g_11 = 1 + 0.3 * r**2  # g_xx
-            g_22 = 1 + 0.3 * r**2  # g_yy
-            g_12 = 0.1 * r  # g_xy
+            (g_11, g_12), (_, g_22) = radial_metric(x, y)
             
             metric_text = MathTex(
                 f"g = \\begin{{pmatrix}} {g_11:.2f} & {g_12:.2f} \\\\ {g_12:.2f} & {g_22:.2f} \\end{{pmatrix}}",
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.metrics import path_length
+from mathvisualizations.surfaces import saddle_derivatives, saddle_metric, saddle_surface
+
 class MetricTensor3D(ThreeDScene):
     def construct(self):
         # Set up the 3D scene
@@ -12,12 +15,11 @@ class MetricTensor3D(ThreeDScene):
         self.play(Write(title))
         
         # Create a 3D curved manifold surface
+        # Hyperbolic paraboloid with modulation: z = 0.1(u² - v²) + 0.05 sin(2πu) cos(2πv)
+        surface_params = dict(a=0.1, b=0.05, ku=2*np.pi, kv=2*np.pi)
+        
         def manifold_surface(u, v):
-            # Create a curved surface: hyperbolic paraboloid with modulation
-            x = u
-            y = v
-            z = 0.1 * (u**2 - v**2) + 0.05 * np.sin(2*np.pi*u) * np.cos(2*np.pi*v)
-            return np.array([x, y, z])
+            return saddle_surface(u, v, **surface_params)
         
         # Create the surface
         surface = Surface(
@@ -55,22 +57,10 @@ class MetricTensor3D(ThreeDScene):
         self.play(*[Create(line) for line in u_lines + v_lines])
         self.wait(1)
         
-        # Create metric tensor function for 3D surface
+        # For a 3D surface, the metric is induced from the embedding
+        # g_ij = ∂ᵢr · ∂ⱼr where r(u,v) is the surface parameterization
         def metric_tensor_3d(u, v):
-            # For a 3D surface, the metric is induced from the embedding
-            # g_ij = ∂ᵢr · ∂ⱼr where r(u,v) is the surface parameterization
-            
-            # Calculate tangent vectors
-            du = np.array([1, 0, 0.2*u + 0.1*np.pi*np.cos(2*np.pi*u)*np.cos(2*np.pi*v)])
-            dv = np.array([0, 1, -0.2*v - 0.1*np.pi*np.sin(2*np.pi*u)*np.sin(2*np.pi*v)])
-            
-            # Calculate metric components
-            g_11 = np.dot(du, du)  # g_uu
-            g_12 = np.dot(du, dv)  # g_uv
-            g_21 = g_12            # g_vu (symmetric)
-            g_22 = np.dot(dv, dv)  # g_vv
-            
-            return np.array([[g_11, g_12], [g_21, g_22]])
+            return saddle_metric(u, v, **surface_params)
         
         # Show metric tensor at different points
         metric_points = [(-2, -2), (0, 0), (2, 2), (-2, 2), (2, -2)]
@@ -101,8 +91,7 @@ class MetricTensor3D(ThreeDScene):
         base_point_3d = manifold_surface(base_point[0], base_point[1])
         
         # Calculate tangent vectors
-        du = np.array([1, 0, 0.2*base_point[0] + 0.1*np.pi*np.cos(2*np.pi*base_point[0])*np.cos(2*np.pi*base_point[1])])
-        dv = np.array([0, 1, -0.2*base_point[1] - 0.1*np.pi*np.sin(2*np.pi*base_point[0])*np.sin(2*np.pi*base_point[1])])
+        (du, dv), _ = saddle_derivatives(base_point[0], base_point[1], **surface_params)
         
         # Normalize tangent vectors
         du_norm = du / np.linalg.norm(du)
@@ -149,31 +138,9 @@ class MetricTensor3D(ThreeDScene):
         self.play(Create(geodesic_path))
         self.wait(1)
         
-        # Calculate distance along the geodesic using the metric
-        def calculate_geodesic_distance(metric_func):
-            total_distance = 0
-            for i in range(len(t_vals) - 1):
-                t1, t2 = t_vals[i], t_vals[i+1]
-                u1, v1 = 2*np.cos(t1), 2*np.sin(t1)
-                u2, v2 = 2*np.cos(t2), 2*np.sin(t2)
-                
-                # Get metric at current point
-                G = metric_func(u1, v1)
-                
-                # Calculate infinitesimal displacement
-                du = u2 - u1
-                dv = v2 - v1
-                delta = np.array([du, dv])
-                
-                # Calculate distance: ds² = δx^T G δx
-                ds_squared = delta.T @ G @ delta
-                ds = np.sqrt(ds_squared)
-                total_distance += ds
-            
-            return total_distance
-        
-        # Calculate distance
-        distance = calculate_geodesic_distance(metric_tensor_3d)
+        # Calculate distance along the geodesic using the metric: ds² = δx^T G δx
+        circle_params = np.stack([2*np.cos(t_vals), 2*np.sin(t_vals)], axis=-1)
+        distance = path_length(circle_params, metric_tensor_3d)
         
         # Show distance calculation
         distance_text = VGroup(
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.metrics import path_length, polynomial_metric, straight_path
+from mathvisualizations.mobjects import coordinate_grid
+
 class MetricTensorVisualization(Scene):
     def construct(self):
         # Set up the scene
@@ -37,41 +40,15 @@ class MetricTensorVisualization(Scene):
         self.wait(1)
         
         # Create coordinate grid
-        coord_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            coord_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            coord_grid.add(line)
+        coord_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Show coordinate grid
         self.play(Create(coord_grid))
         self.wait(1)
         
-        # Create metric tensor function
-        def metric_tensor(x, y):
-            # Example metric: ds² = (1 + 0.2x²)dx² + (1 + 0.2y²)dy² + 0.1xy dx dy
-            # This creates a position-dependent metric
-            g_11 = 1 + 0.2 * x**2  # coefficient of dx²
-            g_22 = 1 + 0.2 * y**2  # coefficient of dy²
-            g_12 = 0.1 * x * y     # coefficient of dx dy
-            g_21 = g_12             # symmetric metric
-            return np.array([[g_11, g_12], [g_21, g_22]])
+        # Example metric: ds² = (1 + 0.2x²)dx² + (1 + 0.2y²)dy² + 0.1xy dx dy
+        # This creates a position-dependent metric
+        metric_tensor = polynomial_metric
         
         # Show metric tensor at different points
         metric_points = [(-1.5, -1.5), (0, 0), (1.5, 1.5), (-1.5, 1.5), (1.5, -1.5)]
@@ -118,11 +95,7 @@ class MetricTensorVisualization(Scene):
         self.wait(1)
         
         # Create path between points
-        path_points = []
-        for t in np.linspace(0, 1, 50):
-            x = point1[0] + t * (point2[0] - point1[0])
-            y = point1[1] + t * (point2[1] - point1[1])
-            path_points.append(np.array([x, y]))
+        path_points = straight_path(point1, point2, np.linspace(0, 1, 50))
         
         path_coords = [left_axes.c2p(p[0], p[1], 0) for p in path_points]
         
@@ -135,33 +108,8 @@ class MetricTensorVisualization(Scene):
         self.play(Create(geodesic_path))
         self.wait(1)
         
-        # Calculate distance using metric tensor
-        def calculate_distance(point1, point2, metric_func):
-            # Approximate distance by integrating along path
-            path_points = []
-            for t in np.linspace(0, 1, 100):
-                x = point1[0] + t * (point2[0] - point1[0])
-                y = point1[1] + t * (point2[1] - point1[1])
-                path_points.append(np.array([x, y]))
-            
-            total_distance = 0
-            for i in range(len(path_points) - 1):
-                current_point = path_points[i]
-                next_point = path_points[i + 1]
-                delta = next_point - current_point
-                
-                # Get metric at current point
-                G = metric_func(current_point[0], current_point[1])
-                
-                # Calculate infinitesimal distance: ds² = δx^T G δx
-                ds_squared = delta.T @ G @ delta
-                ds = np.sqrt(ds_squared)
-                total_distance += ds
-            
-            return total_distance
-        
-        # Calculate distance
-        distance = calculate_distance(point1, point2, metric_tensor)
+        # Calculate distance by integrating ds² = δx^T G δx along the path
+        distance = path_length(straight_path(point1, point2, np.linspace(0, 1, 100)), metric_tensor)
         
         # Show distance calculation
         distance_text = VGroup(
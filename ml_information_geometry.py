@@ -1,6 +1,14 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.mobjects import coordinate_grid
+from mathvisualizations.optimization import (
+    gradient_descent,
+    loss_contour_points,
+    natural_gradient_descent,
+    parameter_metric,
+)
+
 class MLInformationGeometry(Scene):
     def construct(self):
         # Set up the scene
@@ -38,10 +46,8 @@ class MLInformationGeometry(Scene):
         for pos in positions:
             x, y = pos
             # Fisher metric components
-            sigma = 1 + 0.2 * np.sqrt(x**2 + y**2)
-            g_11 = 1 / (sigma**2)
-            g_22 = 1 / (sigma**2)
-            g_12 = 0.1 * np.sin(x + y)
+            G = parameter_metric(x, y)
+            g_11, g_12, g_22 = G[0, 0], G[0, 1], G[1, 1]
             
             metric_text = MathTex(
                 f"g = \\begin{{pmatrix}} {g_11:.2f} & {g_12:.2f} \\\\ {g_12:.2f} & {g_22:.2f} \\end{{pmatrix}}",
@@ -52,42 +58,15 @@ class MLInformationGeometry(Scene):
             fisher_metrics.add(metric_text)
         
         # Create coordinate grid
-        param_grid = VGroup()
-        
-        # Vertical lines
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            param_grid.add(line)
-        
-        # Horizontal lines
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            param_grid.add(line)
-        
-        # Create loss landscape
-        def loss_function(x, y):
-            # Example loss function: L = (x-1)² + (y-1)² + 0.5*sin(2πx)*sin(2πy)
-            return (x-1)**2 + (y-1)**2 + 0.5 * np.sin(2*np.pi*x) * np.sin(2*np.pi*y)
+        param_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Create contour plot of loss function
+        # L = (x-1)² + (y-1)² + 0.5*sin(2πx)*sin(2πy)
         loss_contours = VGroup()
         for level in np.linspace(0.5, 3.5, 6):
             # Create contour at this level
-            contour_points = []
-            for x in np.linspace(-2, 2, 100):
-                for y in np.linspace(-2, 2, 100):
-                    if abs(loss_function(x, y) - level) < 0.1:
-                        contour_points.append(right_axes.c2p(x, level, 0))
+            contour_xy = loss_contour_points(level)
+            contour_points = [right_axes.c2p(x, level, 0) for x in contour_xy[:, 0]]
             
             if len(contour_points) > 10:
                 # Create contour line
@@ -111,64 +90,10 @@ class MLInformationGeometry(Scene):
         self.play(Create(loss_contours))
         self.wait(1)
         
-        # Create optimization paths
-        # Standard gradient descent
-        def standard_gradient_descent():
-            # Start from (-1.5, -1.5)
-            path = [np.array([-1.5, -1.5])]
-            current = np.array([-1.5, -1.5])
-            learning_rate = 0.1
-            
-            for _ in range(20):
-                # Compute gradient
-                dx = 2 * (current[0] - 1) + np.pi * np.cos(2*np.pi*current[0]) * np.sin(2*np.pi*current[1])
-                dy = 2 * (current[1] - 1) + np.pi * np.sin(2*np.pi*current[0]) * np.cos(2*np.pi*current[1])
-                gradient = np.array([dx, dy])
-                
-                # Update parameters
-                current = current - learning_rate * gradient
-                path.append(current.copy())
-            
-            return path
-        
-        # Natural gradient descent
-        def natural_gradient_descent():
-            # Start from (-1.5, -1.5)
-            path = [np.array([-1.5, -1.5])]
-            current = np.array([-1.5, -1.5])
-            learning_rate = 0.1
-            
-            for _ in range(20):
-                # Compute gradient
-                dx = 2 * (current[0] - 1) + np.pi * np.cos(2*np.pi*current[0]) * np.sin(2*np.pi*current[1])
-                dy = 2 * (current[1] - 1) + np.pi * np.sin(2*np.pi*current[0]) * np.cos(2*np.pi*current[1])
-                gradient = np.array([dx, dy])
-                
-                # Compute Fisher metric at current point
-                sigma = 1 + 0.2 * np.sqrt(current[0]**2 + current[1]**2)
-                g_11 = 1 / (sigma**2)
-                g_22 = 1 / (sigma**2)
-                g_12 = 0.1 * np.sin(current[0] + current[1])
-                
-                # Fisher metric matrix
-                G = np.array([[g_11, g_12], [g_12, g_22]])
-                
-                # Natural gradient: G^(-1) * gradient
-                try:
-                    G_inv = np.linalg.inv(G)
-                    natural_grad = G_inv @ gradient
-                except:
-                    natural_grad = gradient
-                
-                # Update parameters
-                current = current - learning_rate * natural_grad
-                path.append(current.copy())
-            
-            return path
-        
-        # Create optimization paths
-        standard_path = standard_gradient_descent()
-        natural_path = natural_gradient_descent()
+        # Create optimization paths from (-1.5, -1.5)
+        # Standard gradient: θ ← θ - α∇L, natural gradient: θ ← θ - αG⁻¹∇L
+        standard_path = gradient_descent([-1.5, -1.5], learning_rate=0.1, steps=20)
+        natural_path = natural_gradient_descent([-1.5, -1.5], learning_rate=0.1, steps=20)
         
         # Convert to Manim objects
         standard_path_obj = VMobject()
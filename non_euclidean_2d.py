@@ -1,33 +1,60 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.hyperbolic import (
+    apply_mobius,
+    distance,
+    geodesic,
+    geodesic_line,
+    isometry_path,
+    tessellation,
+    tile_boundaries,
+    to_xy,
+    translation,
+    triangle_angles,
+)
+from mathvisualizations.mobjects import MobiusTransform, polyline_set
+
 class NonEuclidean2D(Scene):
+    # Radius of the Poincaré disk on screen
+    disk_radius = 2.5
+    # Schläfli symbol {p, q} of the tiling: regular p-gons, q around each vertex
+    tiling = (7, 3)
+    # Tiles smaller than this many pixels across are not generated
+    min_tile_pixels = 2
+    
     def construct(self):
         # Set up the scene
         title = Text("Non-Euclidean Geometry in 2D", font_size=36, color=WHITE).to_edge(UP)
         self.play(Write(title))
         
-        # Create a curved coordinate system (Poincaré disk model)
-        def poincare_metric(r):
-            # Metric factor for hyperbolic geometry
-            return 4 / (1 - r**2)**2
+        # Poincaré disk model: points z with |z| < 1, ds² = 4|dz|² / (1 - |z|²)²
+        def disk_points(z):
+            # Complex disk points -> scene points
+            xy = self.disk_radius * to_xy(np.ravel(z))
+            return np.column_stack([xy, np.zeros(len(xy))])
+        
+        def disk_curve(z, color, stroke_width=3):
+            curve = VMobject(color=color, stroke_width=stroke_width)
+            curve.set_points_as_corners(disk_points(z))
+            return curve
         
         # Create curved grid lines
-        grid_lines = VGroup()
+        grid_lines = VGroup(Circle(radius=self.disk_radius, color=WHITE, stroke_width=2))
         
         # Radial lines (geodesics through origin)
         for angle in np.linspace(0, 2*np.pi, 8, endpoint=False):
             line = Line(
                 start=ORIGIN,
-                end=2.5 * np.array([np.cos(angle), np.sin(angle), 0]),
+                end=self.disk_radius * np.array([np.cos(angle), np.sin(angle), 0]),
                 color=BLUE,
                 stroke_width=2
             )
             grid_lines.add(line)
         
-        # Concentric circles (equidistant curves)
-        for r in np.linspace(0.5, 2.5, 5):
-            circle = Circle(radius=r, color=RED, stroke_width=1)
+        # Concentric circles at hyperbolic distances 0.5, 1, ..., 2.5 from the origin
+        for d in np.linspace(0.5, 2.5, 5):
+            circle = Circle(radius=self.disk_radius * np.tanh(d / 2), color=RED, stroke_width=1)
             grid_lines.add(circle)
         
         # Show the curved grid
@@ -36,39 +63,38 @@ class NonEuclidean2D(Scene):
         
         # Create a triangle in non-Euclidean space
         # In hyperbolic geometry, triangle angles sum to less than 180°
-        triangle_points = [
-            np.array([0.5, 0.5, 0]),
-            np.array([1.5, 0.3, 0]),
-            np.array([0.8, 1.2, 0])
-        ]
-        
-        triangle = Polygon(*triangle_points, color=YELLOW, stroke_width=3, fill_opacity=0.3)
+        # Its sides are geodesics: arcs of circles orthogonal to the boundary
+        vertices = np.array([0.2 + 0.2j, 0.6 + 0.12j, 0.32 + 0.48j])
+        sides = geodesic(vertices, np.roll(vertices, -1), num=40)
+        triangle = disk_curve(sides[:, :-1].ravel(), YELLOW)
+        triangle.close_path()
+        triangle.set_fill(YELLOW, opacity=0.3)
         self.play(Create(triangle))
         
-        # Add angle measurements
+        # Add angle measurements (angles between the tangent arcs at each vertex)
+        angles_deg = np.degrees(triangle_angles(*vertices))
+        triangle_points = disk_points(vertices)
         angles = []
         for i in range(3):
-            p1 = triangle_points[i]
-            p2 = triangle_points[(i+1) % 3]
-            p3 = triangle_points[(i+2) % 3]
+            p1 = triangle_points[(i-1) % 3]
+            p2 = triangle_points[i]
+            p3 = triangle_points[(i+1) % 3]
             
-            # Calculate angle
             v1 = p1 - p2
             v2 = p3 - p2
-            cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
-            angle_rad = np.arccos(np.clip(cos_angle, -1, 1))
-            angle_deg = angle_rad * 180 / np.pi
-            
-            angle_text = MathTex(f"{angle_deg:.1f}°", font_size=20, color=WHITE)
+            angle_text = MathTex(f"{angles_deg[i]:.1f}°", font_size=20, color=WHITE)
             angle_text.move_to(p2 + 0.3 * (v1 + v2) / (np.linalg.norm(v1) + np.linalg.norm(v2)))
             angles.append(angle_text)
         
         self.play(*[Write(angle) for angle in angles])
         
-        # Show angle sum
-        angle_sum = sum([float(angle.tex_string.replace("°", "")) for angle in angles])
-        sum_text = MathTex(f"\\text{{Sum of angles: }} {angle_sum:.1f}° < 180°", 
-                          font_size=24, color=YELLOW)
+        # Show angle sum; the defect is the triangle's area
+        angle_sum = angles_deg.sum()
+        sum_text = MathTex(
+            f"\\text{{Sum of angles: }} {angle_sum:.1f}° < 180°"
+            f"\\quad \\text{{Area}} = \\pi - \\textstyle\\sum \\alpha_i = {np.radians(180 - angle_sum):.3f}",
+            font_size=24, color=YELLOW
+        )
         sum_text.to_edge(DOWN)
         self.play(Write(sum_text))
         self.wait(2)
@@ -76,67 +102,95 @@ class NonEuclidean2D(Scene):
         # Clear and show parallel lines in non-Euclidean space
         self.play(FadeOut(triangle), FadeOut(sum_text), *[FadeOut(angle) for angle in angles])
         
-        # Create parallel lines that diverge (hyperbolic parallel postulate)
-        line1 = Line(start=np.array([-2, -1, 0]), end=np.array([2, -1, 0]), 
-                    color=GREEN, stroke_width=3)
-        line2 = Line(start=np.array([-2, 0, 0]), end=np.array([2, 0, 0]), 
-                    color=GREEN, stroke_width=3)
+        # A geodesic and several geodesics through a point P that never meet it
+        # (hyperbolic parallel postulate)
+        point = 0.45j
+        line1 = disk_curve(geodesic_line(-0.5, 0.5), GREEN)
+        line2 = disk_curve(geodesic_line(point, point + 0.1), GREEN)
         
-        # Add a transversal
-        transversal = Line(start=np.array([-1, -1.5, 0]), end=np.array([-1, 1.5, 0]), 
-                          color=ORANGE, stroke_width=2)
+        # The two limiting parallels, meeting line1 only at the boundary
+        limiting_parallels = VGroup(
+            disk_curve(geodesic_line(point, 0.999), ORANGE, stroke_width=2),
+            disk_curve(geodesic_line(point, -0.999), ORANGE, stroke_width=2),
+        )
         
         self.play(Create(line1), Create(line2))
-        self.play(Create(transversal))
+        self.play(Create(limiting_parallels))
         
-        # Show that these lines are not truly parallel in non-Euclidean space
-        parallel_text = Text("In non-Euclidean space, 'parallel' lines can intersect!", 
+        # Unlike the Euclidean plane, P has many lines through it that miss line1
+        parallel_text = Text("Through a point pass many lines that never meet a given line!", 
                            font_size=24, color=RED)
         parallel_text.to_edge(DOWN)
         self.play(Write(parallel_text))
         self.wait(2)
         
         # Show geodesic deviation
-        self.play(FadeOut(line1), FadeOut(line2), FadeOut(transversal), FadeOut(parallel_text))
-        
-        # Create two initially parallel geodesics that diverge
-        t = np.linspace(0, 3, 100)
-        geodesic1_x = t
-        geodesic1_y = 0.1 * t**2  # Curved path
-        
-        geodesic2_x = t
-        geodesic2_y = 0.1 * t**2 + 0.5  # Parallel curved path
-        
-        points1 = [np.array([x, y, 0]) for x, y in zip(geodesic1_x, geodesic1_y)]
-        points2 = [np.array([x, y, 0]) for x, y in zip(geodesic2_x, geodesic2_y)]
-        
-        curve1 = VMobject()
-        curve1.set_points_as_corners(points1)
-        curve1.set_color(BLUE)
-        curve1.set_stroke(width=3)
-        
-        curve2 = VMobject()
-        curve2.set_points_as_corners(points2)
-        curve2.set_color(RED)
-        curve2.set_stroke(width=3)
+        self.play(FadeOut(line1), FadeOut(line2), FadeOut(limiting_parallels), FadeOut(parallel_text))
+        
+        # Two geodesics crossing the vertical diameter at right angles, close
+        # together at the center and diverging towards the boundary
+        crossings = np.array([-0.05j, 0.05j])
+        starts = translation(crossings)
+        curve1, curve2 = [
+            disk_curve(geodesic_line(z, apply_mobius(M, 0.5)), color)
+            for z, M, color in zip(crossings, starts, (BLUE, RED))
+        ]
+        # Points at hyperbolic distance s along each from the diameter, and the
+        # geodesic segments joining them
+        s = np.array([-4.0, -2.0, 0.0, 2.0, 4.0])
+        along = apply_mobius(starts[:, None], np.tanh(s / 2))
+        separations = distance(along[0], along[1])
+        rungs = VGroup(*[disk_curve(geodesic(z, w, num=16), YELLOW, stroke_width=2) for z, w in along.T])
         
         self.play(Create(curve1), Create(curve2))
+        self.play(Create(rungs))
         
         # Show deviation
-        deviation_text = Text("Geodesic deviation shows curvature of space", 
-                            font_size=24, color=WHITE)
+        deviation_text = Text(
+            "Geodesic deviation: separation " + ", ".join(f"{d:.2f}" for d in separations[2:])
+            + " at distance s = 0, 2, 4 from the center: sinh(D/2) grows like cosh(s)",
+            font_size=20, color=WHITE
+        )
         deviation_text.to_edge(DOWN)
         self.play(Write(deviation_text))
         self.wait(2)
         
+        # Tile the disk with regular polygons, all congruent in the hyperbolic metric
+        self.play(FadeOut(curve1), FadeOut(curve2), FadeOut(rungs), FadeOut(deviation_text), FadeOut(grid_lines))
+        p, q = self.tiling
+        pixels_per_unit = config.pixel_width / config.frame_width
+        tiles = tessellation(p, q, min_size=self.min_tile_pixels / (self.disk_radius * pixels_per_unit))
+        # Every tile boundary in one batched polyline mobject
+        boundaries = tile_boundaries(tiles, p, q, num=8)
+        tiling = VGroup(
+            polyline_set(self.disk_radius * to_xy(boundaries), color=BLUE_B, stroke_width=1),
+            Circle(radius=self.disk_radius, color=WHITE, stroke_width=2),
+        )
+        tiling_text = Text(f"{{{p}, {q}}} tiling: {len(tiles)} congruent {p}-gons, {q} at each vertex",
+                           font_size=24, color=WHITE)
+        tiling_text.to_edge(DOWN)
+        self.play(Create(tiling), Write(tiling_text), run_time=3)
+        self.wait(2)
+        
+        # Isometries of the disk (Möbius maps) move every tile onto another tile:
+        # slide the center to a, back again, then turn by one tile's angle
+        a = 0.6 + 0.3j
+        for isometry in (
+            lambda t: isometry_path(a, 0, t),
+            lambda t: isometry_path(-a, 0, t),
+            lambda t: isometry_path(0, 2*np.pi / p, t),
+        ):
+            self.play(MobiusTransform(tiling[0], isometry, radius=self.disk_radius), run_time=2)
+        self.wait(1)
+        
         # Final explanation
         final_text = VGroup(
             Text("Key concepts of non-Euclidean geometry:", font_size=28, color=WHITE),
             Text("• Triangle angles don't sum to 180°", font_size=20, color=YELLOW),
-            Text("• Parallel lines can intersect", font_size=20, color=GREEN),
+            Text("• Many parallels pass through one point", font_size=20, color=GREEN),
             Text("• Geodesics deviate in curved space", font_size=20, color=BLUE)
         ).arrange(DOWN, buff=0.3).to_edge(DOWN)
         
-        self.play(FadeOut(deviation_text))
+        self.play(FadeOut(tiling_text))
         self.play(Write(final_text))
         self.wait(3)
@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
-from scipy.stats import norm
+
+from mathvisualizations.densities import pdf_matrix
+from mathvisualizations.divergences import divergence_matrix
+from mathvisualizations.fisher import peak_density_surface
+from mathvisualizations.mobjects import graphs
 
 class NormalDistributionManifold(ThreeDScene):
     def construct(self):
@@ -36,8 +40,7 @@ class NormalDistributionManifold(ThreeDScene):
         def statistical_manifold_surface(mu, sigma):
             # For visualization, we'll show the maximum probability density
             # P(x) = 1/(σ√(2π)) at x = μ (the mean)
-            max_prob = 1 / (sigma * np.sqrt(2 * np.pi))
-            return np.array([mu, sigma, max_prob])
+            return peak_density_surface(mu, sigma)
         
         # Create the surface
         surface = Surface(
@@ -130,27 +133,21 @@ class NormalDistributionManifold(ThreeDScene):
             {"mu": 2, "sigma": 1.5, "color": BLUE, "name": "N(2, 2.25)"}
         ]
         
-        pdf_curves = []
-        pdf_labels = []
+        # Create the normal distribution curves, one row per distribution
+        mus = np.array([dist["mu"] for dist in distributions])
+        sigmas = np.array([dist["sigma"] for dist in distributions])
+        x_values = np.linspace(-4, 4, 200)
+        params = np.column_stack([mus, sigmas])
+        y_values = pdf_matrix("normal", params, x_values)
+        
+        # Scale to fit in the coordinate system
+        y_values = y_values * 1.5 / np.max(y_values, axis=1, keepdims=True)
+        
+        pdf_curves = graphs(pdf_axes, x_values, y_values, [dist["color"] for dist in distributions], stroke_width=3)
         
+        pdf_labels = []
         for dist in distributions:
-            mu, sigma = dist["mu"], dist["sigma"]
-            
-            # Create the normal distribution curve
-            x_values = np.linspace(-4, 4, 200)
-            y_values = norm.pdf(x_values, mu, sigma)
-            
-            # Scale to fit in the coordinate system
-            y_values = y_values * 1.5 / np.max(y_values)
-            
-            points = [pdf_axes.c2p(x, y, 0) for x, y in zip(x_values, y_values)]
-            
-            curve = VMobject()
-            curve.set_points_as_corners(points)
-            curve.set_color(dist["color"])
-            curve.set_stroke(width=3)
-            
-            pdf_curves.append(curve)
+            mu = dist["mu"]
             
             # Add label
             label = Text(dist["name"], font_size=12, color=dist["color"])
@@ -163,6 +160,18 @@ class NormalDistributionManifold(ThreeDScene):
         
         self.wait(2)
         
+        # How far apart the three distributions are: Fisher-Rao distances and KL divergences
+        divergence_tables = VGroup()
+        for kind, symbol in (("fisher_rao", r"d_{FR}"), ("kl", r"KL(p_i \| p_j)")):
+            matrix = divergence_matrix(kind, "normal", params)
+            rows = r" \\ ".join(" & ".join(f"{value:.2f}" for value in row) for row in matrix)
+            divergence_tables.add(MathTex(f"{symbol} = \\begin{{pmatrix}} {rows} \\end{{pmatrix}}", font_size=18))
+        divergence_tables.arrange(DOWN, buff=0.3).to_edge(RIGHT)
+        self.add_fixed_in_frame_mobjects(divergence_tables)
+        
+        self.play(Write(divergence_tables))
+        self.wait(2)
+        
         # Show the relationship between manifold and PDFs
         relationship_text = VGroup(
             Text("Manifold-PDF Relationship:", font_size=16, color=WHITE),
@@ -178,7 +187,7 @@ class NormalDistributionManifold(ThreeDScene):
         
         # Return to 3D view to show the complete manifold
         self.play(FadeOut(pdf_axes), FadeOut(pdf_x_label), FadeOut(pdf_y_label), 
-                  FadeOut(*pdf_curves), FadeOut(*pdf_labels), FadeOut(relationship_text))
+                  FadeOut(*pdf_curves), FadeOut(*pdf_labels), FadeOut(relationship_text), FadeOut(divergence_tables))
         
         # Move camera to show different perspectives of the manifold
         self.set_camera_orientation(phi=60 * DEGREES, theta=60 * DEGREES)
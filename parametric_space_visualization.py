@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.mobjects import DotCloud, coords_to_points
+from mathvisualizations.surfaces import saddle_surface
+
 class ParametricSpaceVisualization(ThreeDScene):
     def construct(self):
         # Set up the scene
@@ -31,15 +34,10 @@ class ParametricSpaceVisualization(ThreeDScene):
         self.wait(1)
         
         # Create parameter space grid
-        grid = VGroup()
-        
-        # Create grid lines for different parameter values
-        for alpha in np.linspace(-3, 3, 13):
-            for beta in np.linspace(-3, 3, 13):
-                # Create a point in parameter space
-                point = axes.c2p(alpha, beta, 0)
-                grid_point = Dot(point=point, color=BLUE, radius=0.02)
-                grid.add(grid_point)
+        # One point in parameter space per (alpha, beta)
+        alpha, beta = np.meshgrid(np.linspace(-3, 3, 13), np.linspace(-3, 3, 13), indexing="ij")
+        coords = np.column_stack([alpha.ravel(), beta.ravel(), np.zeros(alpha.size)])
+        grid = DotCloud(coords_to_points(axes, coords), color=BLUE, radius=0.02)
         
         # Show parameter space grid
         self.play(Create(grid))
@@ -48,8 +46,7 @@ class ParametricSpaceVisualization(ThreeDScene):
         # Create parameter space surface
         def parametric_surface(alpha, beta):
             # Define a parametric surface: z = f(alpha, beta)
-            gamma = 0.3 * (alpha**2 - beta**2) + 0.1 * np.sin(alpha) * np.cos(beta)
-            return np.array([alpha, beta, gamma])
+            return saddle_surface(alpha, beta, a=0.3, b=0.1, ku=1, kv=1)
         
         # Create the surface
         surface = Surface(
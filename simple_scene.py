@@ -1,5 +1,7 @@
 from manim import *
 
+from mathvisualizations.mobjects import polyline
+
 class SimpleAffineCurves(Scene):
     def construct(self):
         # Set up the coordinate system
@@ -30,11 +32,7 @@ class SimpleAffineCurves(Scene):
         t = np.linspace(0, 2*np.pi, 100)
         x_ellipse = 2 * np.cos(t)
         y_ellipse = np.sin(t)
-        ellipse_points = [axes.c2p(x, y) for x, y in zip(x_ellipse, y_ellipse)]
-        ellipse = VMobject()
-        ellipse.set_points_as_corners(ellipse_points)
-        ellipse.set_color(GREEN)
-        ellipse.set_stroke(width=3)
+        ellipse = polyline(axes, np.column_stack([x_ellipse, y_ellipse]), color=GREEN, stroke_width=3)
         
         ellipse_label = MathTex(r"\frac{x^2}{4} + y^2 = 1", color=GREEN).to_corner(UR)
         
@@ -71,11 +69,8 @@ class SimpleAffineCurves(Scene):
         
         # Move ellipse point
         t_ellipse = np.linspace(0, 2*np.pi, 50)
-        ellipse_path_points = [axes.c2p(2*np.cos(t), np.sin(t)) for t in t_ellipse]
-        ellipse_path = VMobject()
-        ellipse_path.set_points_as_corners(ellipse_path_points)
-        ellipse_path.set_color(ORANGE)
-        ellipse_path.set_stroke(width=2)
+        ellipse_path_points = np.column_stack([2*np.cos(t_ellipse), np.sin(t_ellipse)])
+        ellipse_path = polyline(axes, ellipse_path_points, color=ORANGE, stroke_width=2)
         
         # Move points along the curves
         self.play(
@@ -0,0 +1,118 @@
+from manim import *
+import numpy as np
+
+from mathvisualizations.mobjects import DotCloud, coords_to_points, polyline, polyline_set
+from mathvisualizations.spd import (
+    cone_coords,
+    cone_surface,
+    distance,
+    fisher_rao_distance,
+    frechet_mean,
+    geodesic,
+    log_euclidean_mean,
+    random_spd,
+)
+
+class SPDConeManifold(ThreeDScene):
+    # Number of random covariance matrices and their spread exp(spread · S)
+    num_matrices = 400
+    spread = 0.4
+
+    def construct(self):
+        # Set up the 3D scene
+        self.set_camera_orientation(phi=70 * DEGREES, theta=-50 * DEGREES)
+        
+        title = Text("2×2 Covariance Matrices as a Cone", font_size=28, color=WHITE).to_edge(UP)
+        subtitle = Text("Affine-invariant metric on SPD matrices", font_size=18, color=BLUE).next_to(title, DOWN)
+        self.add_fixed_in_frame_mobjects(title, subtitle)
+        self.play(Write(title), Write(subtitle))
+        
+        # [[a, b], [b, c]] sits at (b, (a - c)/2, (a + c)/2); it is positive
+        # definite exactly inside the cone z > sqrt(x² + y²)
+        axes = ThreeDAxes(
+            x_range=[-3, 3, 1],
+            y_range=[-3, 3, 1],
+            z_range=[0, 3, 1],
+            x_length=6,
+            y_length=6,
+            z_length=3
+        )
+        x_label = axes.get_x_axis_label(MathTex(r"b"))
+        y_label = axes.get_y_axis_label(MathTex(r"\tfrac{a - c}{2}"))
+        z_label = axes.get_z_axis_label(MathTex(r"\tfrac{a + c}{2}"))
+        self.play(Create(axes), Write(x_label), Write(y_label), Write(z_label))
+        
+        cone = Surface(
+            lambda u, v: coords_to_points(axes, cone_surface(u, v)),
+            u_range=[0, 2.8],
+            v_range=[0, 2 * np.pi],
+            resolution=(12, 32)
+        )
+        cone.set_style(fill_opacity=0.15, stroke_width=0.5, stroke_color=BLUE)
+        cone.set_fill(BLUE)
+        
+        cone_label = MathTex(r"ac - b^2 = 0", font_size=20, color=BLUE)
+        cone_label.to_corner(UR).shift(DOWN)
+        self.add_fixed_in_frame_mobjects(cone_label)
+        self.play(Create(cone), Write(cone_label))
+        self.wait(1)
+        
+        # A cloud of random covariance matrices, one dot each
+        matrices = random_spd(self.num_matrices, d=2, spread=self.spread)
+        cloud = DotCloud(coords_to_points(axes, cone_coords(matrices)), color=WHITE, radius=0.025)
+        self.play(FadeIn(cloud))
+        self.wait(1)
+        
+        # Arithmetic, log-Euclidean and Fréchet means of the whole stack
+        means = {
+            "Arithmetic mean": (matrices.mean(axis=0), RED),
+            "Log-Euclidean mean": (log_euclidean_mean(matrices), ORANGE),
+            "Fréchet mean": (frechet_mean(matrices), YELLOW),
+        }
+        mean_dots = VGroup(*[
+            Dot3D(coords_to_points(axes, cone_coords(mean)), color=color, radius=0.07)
+            for mean, color in means.values()
+        ])
+        mean_legend = VGroup(*[
+            Text(name, font_size=14, color=color) for name, (_, color) in means.items()
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.15).to_corner(UL).shift(DOWN * 1.2)
+        self.add_fixed_in_frame_mobjects(mean_legend)
+        self.play(*[FadeIn(dot) for dot in mean_dots], Write(mean_legend))
+        self.wait(1)
+        
+        # Geodesics from the Fréchet mean to part of the cloud: the mean
+        # minimizes the sum of their squared lengths
+        frechet = means["Fréchet mean"][0]
+        spokes = geodesic(frechet, matrices[:60], num=24)
+        spoke_lines = polyline_set(coords_to_points(axes, cone_coords(spokes)), color=YELLOW, stroke_width=1, stroke_opacity=0.5)
+        self.play(Create(spoke_lines), run_time=2)
+        self.wait(1)
+        self.play(FadeOut(spoke_lines), FadeOut(cloud))
+        
+        # One geodesic against the straight segment between the same matrices
+        P = np.array([[3.0, 0.0], [0.0, 0.2]])
+        Q = np.array([[0.2, 0.0], [0.0, 3.0]])
+        geodesic_curve = polyline(axes, cone_coords(geodesic(P, Q, num=64)), color=GREEN, stroke_width=4)
+        chord = polyline(axes, cone_coords(np.stack([P, Q])), color=GRAY, stroke_width=2)
+        endpoints = VGroup(*[
+            Dot3D(coords_to_points(axes, cone_coords(M)), color=GREEN, radius=0.06) for M in (P, Q)
+        ])
+        self.play(FadeIn(endpoints), Create(chord))
+        self.play(Create(geodesic_curve), run_time=2)
+        
+        distance_text = VGroup(
+            MathTex(
+                r"d(P, Q) = \big\| \log(P^{-1/2} Q P^{-1/2}) \big\|_F = " + f"{distance(P, Q):.3f}",
+                font_size=20, color=GREEN
+            ),
+            MathTex(r"d_{\mathrm{Fisher}} = d / \sqrt{2} = " + f"{fisher_rao_distance(P, Q):.3f}", font_size=20, color=YELLOW),
+            Text("The geodesic dips into the cone, below the straight chord", font_size=14, color=WHITE)
+        ).arrange(DOWN, buff=0.2).to_edge(DOWN)
+        self.add_fixed_in_frame_mobjects(distance_text)
+        self.play(Write(distance_text))
+        
+        # Turn around the cone
+        self.begin_ambient_camera_rotation(rate=0.3)
+        self.wait(4)
+        self.stop_ambient_camera_rotation()
+        self.wait(1)
@@ -1,7 +1,15 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.atlas import plane_disk_atlas, random_sphere_points, sphere_atlas
+from mathvisualizations.charts import chart_grid
+from mathvisualizations.metrics import polynomial_metric
+from mathvisualizations.mobjects import DotCloud, coordinate_grid, coords_to_points, polyline
+
 class StatisticalManifoldChartsAtlas(Scene):
+    # Random points of the sphere on which its chart metrics are compared
+    sphere_points = 100_000
+
     def construct(self):
         # Set up the scene
         title = Text("Charts & Atlas on Statistical Manifold", font_size=32, color=WHITE).to_edge(UP)
@@ -40,27 +48,8 @@ class StatisticalManifoldChartsAtlas(Scene):
         # Each point represents a probability distribution P(x|θ)
         
         # Create coordinate grid
-        coord_grid = VGroup()
-        
-        # Vertical lines (parameter θ₁)
-        for x in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(x, -2, 0),
-                end=left_axes.c2p(x, 2, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            coord_grid.add(line)
-        
-        # Horizontal lines (parameter θ₂)
-        for y in np.linspace(-2, 2, 9):
-            line = Line(
-                start=left_axes.c2p(-2, y, 0),
-                end=left_axes.c2p(2, y, 0),
-                color=RED,
-                stroke_width=1
-            )
-            coord_grid.add(line)
+        # Vertical lines (parameter θ₁) and horizontal lines (parameter θ₂)
+        coord_grid = coordinate_grid(left_axes, np.linspace(-2, 2, 9), np.linspace(-2, 2, 9))
         
         # Show coordinate grid
         self.play(Create(coord_grid))
@@ -138,34 +127,25 @@ class StatisticalManifoldChartsAtlas(Scene):
         # Show how coordinates transform between charts
         
         # Create coordinate grid in chart 1 (Normal family)
-        chart1_grid = VGroup()
-        for x in np.linspace(-0.8, 0.8, 5):
-            for y in np.linspace(-0.8, 0.8, 5):
-                point = left_axes.c2p(x, y, 0)
-                dot = Dot(point=point, color=RED, radius=0.03)
-                chart1_grid.add(dot)
-        
-        # Create transformed grid in chart 2 (Exponential family)
-        chart2_grid = VGroup()
-        for x in np.linspace(-0.8, 0.8, 5):
-            for y in np.linspace(-0.8, 0.8, 5):
-                # Transform from normal to exponential family coordinates
-                # This is a simplified example transformation
-                x2 = x + 1.2
-                y2 = y + 1.2
-                point = right_axes.c2p(x2, y2, 0)
-                dot = Dot(point=point, color=GREEN, radius=0.03)
-                chart2_grid.add(dot)
+        atlas = plane_disk_atlas(metric=polynomial_metric)
+        grid = chart_grid(1.2, 25)
+        chart1_coords = grid[atlas["U1"].contains_coords(grid)]
+        chart1_grid = DotCloud(coords_to_points(left_axes, chart1_coords), color=RED, radius=0.02)
+        
+        # The points of the overlap U₁ ∩ U₂ and their coordinates in chart 2 (Exponential family)
+        overlap_coords = chart1_coords[atlas.overlap("U1", "U2", chart1_coords)]
+        overlap_grid = DotCloud(coords_to_points(left_axes, overlap_coords), color=YELLOW, radius=0.03)
+        transformed = atlas.transition("U1", "U2", overlap_coords)
+        chart2_grid = DotCloud(coords_to_points(right_axes, transformed), color=GREEN, radius=0.03)
         
         # Show coordinate grids
         self.play(Create(chart1_grid))
+        self.play(Create(overlap_grid))
         self.wait(1)
         
         # Show transformation arrows
         transformation_arrows = VGroup()
-        for i in range(len(chart1_grid)):
-            start_point = chart1_grid[i].get_center()
-            end_point = chart2_grid[i].get_center()
+        for start_point, end_point in zip(overlap_grid.get_dot_centers(), chart2_grid.get_dot_centers()):
             arrow = Arrow(start=start_point, end=end_point, color=YELLOW, stroke_width=2)
             transformation_arrows.add(arrow)
         
@@ -200,27 +180,38 @@ class StatisticalManifoldChartsAtlas(Scene):
         self.play(Write(stats_text))
         self.wait(2)
         
-        # Show Fisher metric at different points
-        fisher_points = [(-1, -1), (0, 0), (1, 1)]
+        # Show Fisher metric at different points, each in the coordinates of a chart containing it
+        fisher_points = np.array([(-1, -1), (0, 0), (1, 1)], dtype=float)
+        chart_index = atlas.domain_masks(fisher_points).argmax(axis=1)
         fisher_displays = VGroup()
         
-        for point in fisher_points:
-            x, y = point
-            # Simplified Fisher metric for demonstration
-            g_11 = 1 + 0.2 * x**2
-            g_12 = 0.1 * x * y
-            g_22 = 1 + 0.2 * y**2
+        for point, k in zip(fisher_points, chart_index):
+            chart = atlas[k]
+            (g_11, g_12), (_, g_22) = chart.metric(chart.to_coords(point))
             
             fisher_text = MathTex(
-                f"g = \\begin{{pmatrix}} {g_11:.2f} & {g_12:.2f} \\\\ {g_12:.2f} & {g_22:.2f} \\end{{pmatrix}}",
+                f"g^{{({k + 1})}} = \\begin{{pmatrix}} {g_11:.2f} & {g_12:.2f} \\\\ {g_12:.2f} & {g_22:.2f} \\end{{pmatrix}}",
                 font_size=10,
                 color=YELLOW
             )
             
-            point_pos = left_axes.c2p(x, y, 0)
+            point_pos = coords_to_points(left_axes, point)
             fisher_text.move_to(point_pos + UP * 0.6)
             fisher_displays.add(fisher_text)
         
+        # The chart metrics must agree on overlaps: g_i = J^T g_j J with J the
+        # transition Jacobian.  The plane charts above are translations of one
+        # global metric, so the check is shown on the curved charts of the sphere
+        report = sphere_atlas().metric_consistency(random_sphere_points(self.sphere_points))
+        consistency_text = MathTex(
+            f"S^2:\\ \\max_{{U_i \\cap U_j}} \\frac{{\\|g_i - J^T g_j J\\|}}{{\\|g_i\\|}} = "
+            f"{max(entry['max'] for entry in report.values()):.1e}",
+            font_size=16,
+            color=YELLOW
+        )
+        consistency_text.move_to(right_axes.c2p(0, 1.5, 0))
+        fisher_displays.add(consistency_text)
+        
         self.play(*[Write(metric) for metric in fisher_displays])
         self.wait(2)
         
@@ -260,13 +251,8 @@ class StatisticalManifoldChartsAtlas(Scene):
         
         # Create the path
         t_vals = np.linspace(0, 2*np.pi, 100)
-        path_points = [distribution_path(t) for t in t_vals]
-        path_coords = [left_axes.c2p(p[0], p[1], 0) for p in path_points]
-        
-        distribution_path_obj = VMobject()
-        distribution_path_obj.set_points_as_corners(path_coords)
-        distribution_path_obj.set_color(YELLOW)
-        distribution_path_obj.set_stroke(width=3)
+        path_points = distribution_path(t_vals).T
+        distribution_path_obj = polyline(left_axes, path_points, color=YELLOW, stroke_width=3)
         
         # Show the path
         self.play(Create(distribution_path_obj))
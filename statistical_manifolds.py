@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.exponential_families import normal_family
+from mathvisualizations.mobjects import DotCloud, coordinate_grid, coords_to_points, polyline, polyline_set
+
 class StatisticalManifolds(Scene):
     def construct(self):
         # Set up the scene
@@ -21,7 +24,7 @@ class StatisticalManifolds(Scene):
         # Right: Expectation parameters (dual coordinates)
         right_axes = Axes(
             x_range=[-2, 2, 0.5],
-            y_range=[-2, 2, 0.5],
+            y_range=[0, 4, 0.5],
             x_length=4,
             y_length=4
         )
@@ -29,54 +32,31 @@ class StatisticalManifolds(Scene):
         
         # Add labels
         left_label = Text("Natural Parameters\n(η₁, η₂)", font_size=18, color=RED).next_to(left_axes, DOWN)
-        right_label = Text("Expectation Parameters\n(μ₁, μ₂)", font_size=18, color=GREEN).next_to(right_axes, DOWN)
+        right_label = Text("Expectation Parameters\n(μ₁, μ₂) = (E[x], E[x²])", font_size=18, color=GREEN).next_to(right_axes, DOWN)
         
         # Create exponential family manifold
-        # Example: 2D Gaussian with varying parameters
-        def exponential_family_manifold(eta1, eta2):
-            # Natural parameters to expectation parameters
-            # For Gaussian: μ = -η/2, σ² = 1/(2η)
-            mu1 = -eta1 / 2
-            mu2 = -eta2 / 2
-            return np.array([mu1, mu2])
+        # Example: the normal family N(m, σ²), T(x) = (x, x²), in natural
+        # parameters η = (m/σ², -1/(2σ²)); the log-partition function is
+        # ψ(η) = -η₁²/(4η₂) - log(-2η₂)/2 + log(2π)/2, and μ = ∇ψ(η)
+        family = normal_family
+        eta1_values = np.linspace(-1.5, 1.5, 7)
+        eta2_values = np.linspace(-3, -0.5, 6)
         
         # Create coordinate grid in natural parameter space
-        natural_grid = VGroup()
-        
-        # Vertical lines
-        for eta1 in np.linspace(-3, 3, 7):
-            line = Line(
-                start=left_axes.c2p(eta1, -3, 0),
-                end=left_axes.c2p(eta1, 3, 0),
-                color=BLUE,
-                stroke_width=1
-            )
-            natural_grid.add(line)
-        
-        # Horizontal lines
-        for eta2 in np.linspace(-3, 3, 7):
-            line = Line(
-                start=left_axes.c2p(-3, eta2, 0),
-                end=left_axes.c2p(3, eta2, 0),
-                color=RED,
-                stroke_width=1
-            )
-            natural_grid.add(line)
-        
-        # Create dual grid in expectation parameter space
-        expectation_grid = VGroup()
-        
-        # Transform grid points
-        for eta1 in np.linspace(-3, 3, 7):
-            for eta2 in np.linspace(-3, 3, 7):
-                mu1, mu2 = exponential_family_manifold(eta1, eta2)
-                if -2 <= mu1 <= 2 and -2 <= mu2 <= 2:
-                    point = Dot(
-                        point=right_axes.c2p(mu1, mu2, 0),
-                        color=YELLOW,
-                        radius=0.02
-                    )
-                    expectation_grid.add(point)
+        natural_grid = coordinate_grid(left_axes, eta1_values, eta2_values)
+        
+        # Create dual grid in expectation parameter space: the images of the
+        # grid lines, sampled densely, and of the grid nodes
+        s = np.linspace(0, 1, 50)
+        lines = np.concatenate([
+            np.stack(np.broadcast_arrays(eta1_values[:, None], eta2_values[0] + s * np.ptp(eta2_values)), axis=-1),
+            np.stack(np.broadcast_arrays(eta1_values[0] + s * np.ptp(eta1_values), eta2_values[:, None]), axis=-1),
+        ])
+        nodes = np.stack(np.meshgrid(eta1_values, eta2_values, indexing="ij"), axis=-1).reshape(-1, 2)
+        expectation_grid = VGroup(
+            polyline_set(coords_to_points(right_axes, family.expectation(lines)), color=BLUE, stroke_width=1),
+            DotCloud(coords_to_points(right_axes, family.expectation(nodes)), color=YELLOW, radius=0.02),
+        )
         
         # Show coordinate systems
         self.play(Create(left_axes), Create(right_axes))
@@ -91,56 +71,63 @@ class StatisticalManifolds(Scene):
         self.play(Create(expectation_grid))
         self.wait(1)
         
-        # Create geodesic curves in natural parameter space
-        def natural_geodesic(t):
-            # A geodesic with respect to the Fisher metric
-            eta1 = 2 * np.cos(t)
-            eta2 = 2 * np.sin(t)
-            return np.array([eta1, eta2])
-        
-        natural_path = ParametricFunction(
-            lambda t: left_axes.c2p(*natural_geodesic(t), 0),
-            t_range=[0, 2*np.pi],
-            color=YELLOW,
-            stroke_width=4
+        # Geodesics of the dual connections between the same endpoints:
+        # e-geodesics are straight in η, m-geodesics straight in μ
+        eta_starts = np.column_stack([np.linspace(-1.2, 1.2, 5), np.full(5, -2.8)])
+        eta_ends = np.column_stack([np.linspace(1.2, -1.2, 5), np.full(5, -0.7)])
+        e_eta, e_mu = family.e_geodesic(eta_starts, eta_ends, num=60)
+        m_eta, m_mu = family.m_geodesic(eta_starts, eta_ends, num=60)
+        e_geodesics = VGroup(
+            polyline_set(coords_to_points(left_axes, e_eta), color=YELLOW, stroke_width=3),
+            polyline_set(coords_to_points(right_axes, e_mu), color=YELLOW, stroke_width=3),
         )
-        
-        # Transform to expectation parameters
-        def expectation_geodesic(t):
-            eta1, eta2 = natural_geodesic(t)
-            mu1, mu2 = exponential_family_manifold(eta1, eta2)
-            return np.array([mu1, mu2])
-        
-        expectation_path = ParametricFunction(
-            lambda t: right_axes.c2p(*expectation_geodesic(t), 0),
-            t_range=[0, 2*np.pi],
-            color=YELLOW,
-            stroke_width=4
+        m_geodesics = VGroup(
+            polyline_set(coords_to_points(left_axes, m_eta), color=PURPLE, stroke_width=3),
+            polyline_set(coords_to_points(right_axes, m_mu), color=PURPLE, stroke_width=3),
         )
         
+        # One e-geodesic, followed in both coordinate systems below
+        natural_path = polyline(left_axes, e_eta[1], color=YELLOW, stroke_width=4)
+        expectation_path = polyline(right_axes, e_mu[1], color=YELLOW, stroke_width=4)
+        
         # Show geodesics
-        self.play(Create(natural_path), Create(expectation_path))
+        self.play(Create(e_geodesics))
+        self.play(Create(m_geodesics))
         self.wait(1)
         
+        # Pythagorean theorem: the m-geodesic p → q meets the e-geodesic q → r at a right angle
+        eta_q = np.array([0, -1.0])
+        eta_r = eta_q + [0.6, -0.4]
+        eta_p = family.natural(family.expectation(eta_q) + [0.2, 0.3])
+        kl_pr, kl_pq, kl_qr = family.kl_divergence(np.array([eta_p, eta_p, eta_q]), np.array([eta_r, eta_q, eta_r]))
+        pythagoras_text = MathTex(
+            f"KL(p \\| r) = KL(p \\| q) + KL(q \\| r): \\quad {kl_pr:.4f} = {kl_pq:.4f} + {kl_qr:.4f}",
+            font_size=24,
+            color=YELLOW
+        ).to_edge(DOWN)
+        right_angle = VGroup(
+            polyline(left_axes, family.m_geodesic(eta_p, eta_q)[0], color=PURPLE),
+            polyline(left_axes, family.e_geodesic(eta_q, eta_r)[0], color=YELLOW),
+        )
+        self.play(FadeOut(e_geodesics), FadeOut(m_geodesics), Create(right_angle))
+        self.play(Write(pythagoras_text))
+        self.wait(2)
+        self.play(FadeOut(right_angle), FadeOut(pythagoras_text), Create(natural_path), Create(expectation_path))
+        
         # Create Fisher information metric at different points
         fisher_metrics = VGroup()
-        positions = [(-2, -2), (0, 0), (2, 2), (-2, 2), (2, -2)]
-        
-        for pos in positions:
-            eta1, eta2 = pos
-            # Fisher metric for exponential family
-            # g_ij = ∂²ψ/∂ηᵢ∂ηⱼ where ψ is the log partition function
-            # For Gaussian: ψ = (η₁² + η₂²)/4
-            g_11 = 0.5  # ∂²ψ/∂η₁²
-            g_22 = 0.5  # ∂²ψ/∂η₂²
-            g_12 = 0    # ∂²ψ/∂η₁∂η₂
-            
+        positions = np.array([(-1, -2.5), (0, -1.75), (1, -2.5), (-1, -1), (1, -1)])
+        # Fisher metric for exponential family
+        # g_ij = ∂²ψ/∂ηᵢ∂ηⱼ where ψ is the log partition function
+        metrics = family.fisher_metric(positions)
+        
+        for pos, ((g_11, g_12), (_, g_22)) in zip(coords_to_points(left_axes, positions), metrics):
             metric_text = MathTex(
-                f"g = \\begin{{pmatrix}} {g_11:.1f} & {g_12:.1f} \\\\ {g_12:.1f} & {g_22:.1f} \\end{{pmatrix}}",
+                f"g = \\begin{{pmatrix}} {g_11:.2f} & {g_12:.2f} \\\\ {g_12:.2f} & {g_22:.2f} \\end{{pmatrix}}",
                 font_size=10,
                 color=ORANGE
             )
-            metric_text.move_to(left_axes.c2p(eta1, eta2, 0) + UP * 0.3)
+            metric_text.move_to(pos + UP * 0.3)
             fisher_metrics.add(metric_text)
         
         # Show Fisher metrics
@@ -162,13 +149,11 @@ class StatisticalManifolds(Scene):
         # Show moving points along geodesics
         moving_point_natural = Dot(color=YELLOW, radius=0.08)
         # Position at the start of the natural geodesic path
-        start_natural = natural_geodesic(0)
-        moving_point_natural.move_to(left_axes.c2p(*start_natural, 0))
+        moving_point_natural.move_to(natural_path.get_start())
         
         moving_point_expectation = Dot(color=YELLOW, radius=0.08)
         # Position at the start of the expectation geodesic path
-        start_expectation = expectation_geodesic(0)
-        moving_point_expectation.move_to(right_axes.c2p(*start_expectation, 0))
+        moving_point_expectation.move_to(expectation_path.get_start())
         
         self.play(FadeIn(moving_point_natural), FadeIn(moving_point_expectation))
         
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist, squareform
+
+from mathvisualizations.convergence import (
+    cauchy_modulus,
+    convergence_profile,
+    euclidean_distance,
+    fisher_rao_distance,
+    tail_diameter_bounds,
+)
+from mathvisualizations.divergences import normal_fisher_rao
+from mathvisualizations.sequences import wobbling_circle_sets
+
+
+def tail_diameters(distances):
+    # diam{x_m : m ≥ n} from the full distance matrix, for every n
+    n = len(distances)
+    return np.array([distances[start:, start:].max() for start in range(n)])
+
+
+def random_walk(n, d, seed=0):
+    rng = np.random.default_rng(seed)
+    steps = rng.standard_normal((n, d)) / np.arange(1, n + 1)[:, None]**1.2
+    return np.cumsum(steps, axis=0)
+
+
+@pytest.mark.parametrize("d", [1, 2, 3])
+def test_euclidean_bounds_bracket_the_tail_diameters(d):
+    terms = random_walk(400, d)
+    lower, upper = tail_diameter_bounds(terms[:, 0] if d == 1 else terms)
+    true = tail_diameters(squareform(pdist(terms)))
+    assert np.all(lower <= true + 1e-12) and np.all(true <= upper + 1e-12)
+    if d == 1:
+        assert np.allclose(lower, true) and np.allclose(upper, true)
+
+
+def test_fisher_rao_bounds_bracket_the_tail_diameters():
+    rng = np.random.default_rng(1)
+    n = np.arange(300)
+    terms = np.column_stack([np.sin(n) / (n + 1), 1 + rng.uniform(0, 1, 300) / (n + 1)])
+    lower, upper = tail_diameter_bounds(terms, fisher_rao_distance)
+    true = tail_diameters(normal_fisher_rao(terms[:, None], terms[None]))
+    assert np.all(lower <= true + 1e-12) and np.all(true <= upper + 1e-12)
+    assert np.all(np.diff(lower) <= 0) and np.all(np.diff(upper) <= 0)
+
+
+def test_moduli_bracket_the_true_modulus():
+    terms = random_walk(500, 2, seed=2)
+    eps = np.logspace(0, -3, 13)
+    modulus = convergence_profile(terms, len(terms), eps)["modulus"]
+    true = cauchy_modulus(tail_diameters(squareform(pdist(terms))), eps)
+    assert np.all(modulus[:, 0] <= true) and np.all(true <= modulus[:, 1])
+
+
+def test_hausdorff_moduli_of_set_sequences():
+    sets = wobbling_circle_sets(np.arange(30), 48)
+    eps = [0.3, 0.1, 0.01]
+    modulus = convergence_profile(sets, len(sets), eps, "hausdorff")["modulus"]
+    d = np.array([[euclidean_distance(a[:, None], b[None]) for b in sets] for a in sets])
+    hausdorff = np.maximum(d.min(axis=-1).max(axis=-1), d.min(axis=-2).max(axis=-1))
+    true = cauchy_modulus(tail_diameters(hausdorff), eps)
+    assert np.all(modulus[:, 0] <= true) and np.all(true <= modulus[:, 1])
+
+
+def test_generators_are_read_up_to_num():
+    # Tail diameters 1/(n + 1) - 1/1000 are below 0.1 from n = 9 on
+    profile = convergence_profile((1 / (k + 1) for k in range(10**9)), 1000, [0.1])
+    assert len(profile["lower"]) == 1000
+    assert profile["modulus"].tolist() == [[9, 9]]
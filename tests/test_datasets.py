@@ -0,0 +1,25 @@
+import pytest
+
+from mathvisualizations.datasets import export_dataset, list_versions, main, open_dataset
+
+
+def test_versions_skip_leftover_directories(tmp_path):
+    (tmp_path / "grid" / "v001").mkdir(parents=True)
+    path = export_dataset("grid", {"x": [1.0, 2.0]}, root=tmp_path)
+    assert path.name == "v002"
+    assert list_versions("grid", tmp_path) == [2]
+    arrays, manifest = open_dataset("grid", root=tmp_path)
+    assert manifest["version"] == 2 and arrays["x"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("override", ["R=3", "R", "=3", "metric_tensor_3d.R=3", "affine_connection_3d.R=3"])
+def test_bad_overrides_export_nothing(tmp_path, override):
+    with pytest.raises(SystemExit):
+        main(["torus_manifold", "affine_connection_3d", "--set", override, "--root", str(tmp_path)])
+    assert not any(tmp_path.iterdir())
+
+
+def test_scoped_override(tmp_path):
+    main(["torus_manifold", "--set", "torus_manifold.R=3", "--set", "resolution=8", "--root", str(tmp_path)])
+    arrays, manifest = open_dataset("torus_manifold", root=tmp_path)
+    assert manifest["params"]["R"] == 3 and manifest["params"]["resolution"] == 8
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from mathvisualizations.densities import LOG_PDFS
+from mathvisualizations.divergences import divergence_matrix
+
+# Quadrature grids covering the parameters below
+GRIDS = {
+    "normal": np.linspace(-12, 12, 6001),
+    "gamma": np.linspace(0, 60, 12001),
+    "beta": np.linspace(0, 1, 20001)[1:-1],
+}
+PARAMS = {
+    "normal": np.array([(0.0, 1.0), (1.5, 0.7), (-1.0, 2.0)]),
+    "gamma": np.array([(2.0, 1.0), (3.5, 0.8), (5.0, 2.0)]),
+    "beta": np.array([(2.0, 3.0), (4.0, 2.5), (3.0, 3.0)]),
+}
+
+
+def density(family):
+    log_pdf = LOG_PDFS[family]
+    return lambda x, params: np.exp(log_pdf(x, params[..., 0], params[..., 1]))
+
+
+@pytest.mark.parametrize("family", sorted(GRIDS))
+@pytest.mark.parametrize("kind", ["kl", "symmetric_kl", "hellinger", "bhattacharyya"])
+def test_closed_forms_match_quadrature(family, kind):
+    params = PARAMS[family]
+    closed = divergence_matrix(kind, family, params)
+    quadrature = divergence_matrix(kind, density(family), params, x=GRIDS[family])
+    if kind == "hellinger":
+        # The square root magnifies quadrature errors next to zero
+        closed, quadrature = closed**2, quadrature**2
+    assert np.allclose(quadrature, closed, rtol=1e-3, atol=1e-4)
+
+
+def test_blocks_do_not_change_the_matrix():
+    rng = np.random.default_rng(0)
+    params = np.column_stack([rng.uniform(-1, 1, 50), rng.uniform(0.5, 2, 50)])
+    other = params[:20] + 0.1
+    x = GRIDS["normal"]
+    for kind in ("kl", "symmetric_kl", "hellinger"):
+        whole = divergence_matrix(kind, density("normal"), params, other, x=x)
+        blocked = divergence_matrix(kind, density("normal"), params, other, x=x, block_elements=7 * len(x))
+        assert np.allclose(blocked, whole)
+
+
+def test_fisher_rao_needs_a_closed_form():
+    with pytest.raises(ValueError):
+        divergence_matrix("fisher_rao", density("normal"), PARAMS["normal"], x=GRIDS["normal"])
+    with pytest.raises(ValueError):
+        divergence_matrix("fisher_rao", "gamma", PARAMS["gamma"])
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from mathvisualizations.exponential_families import (
+    bernoulli_family,
+    normal_family,
+    normal_from_natural,
+    normal_natural,
+    poisson_family,
+)
+
+
+def test_normal_natural_round_trips():
+    rng = np.random.default_rng(0)
+    eta = normal_natural(rng.uniform(-3, 3, 10_000), rng.uniform(0.05, 4, 10_000))
+    solved = normal_family.natural(normal_family.expectation(eta))
+    assert np.allclose(solved, eta, rtol=1e-9, atol=1e-9)
+    assert np.allclose(normal_from_natural(solved)[1], normal_from_natural(eta)[1])
+
+
+@pytest.mark.parametrize("family, eta", [
+    (poisson_family, np.linspace(-15, 10, 101)[:, None]),
+    (bernoulli_family, np.linspace(-20, 20, 101)[:, None]),
+])
+def test_one_parameter_natural_round_trips(family, eta):
+    assert np.allclose(family.natural(family.expectation(eta)), eta, rtol=1e-8, atol=1e-8)
+
+
+def test_round_trip_from_a_warm_start():
+    eta = normal_natural(np.linspace(-1, 1, 50), np.linspace(0.5, 2, 50))
+    solved = normal_family.natural(normal_family.expectation(eta), eta=eta + 0.01)
+    assert np.allclose(solved, eta)
+
+
+@pytest.mark.parametrize("family, mu", [
+    (bernoulli_family, [[1.0], [0.0], [1.5], [-0.1]]),
+    (poisson_family, [[0.0], [-1.0]]),
+    (normal_family, [[0.0, 0.0], [1.0, 1.0], [1.0, 0.5]]),
+])
+def test_moments_outside_or_on_the_boundary_are_nan(family, mu):
+    assert np.isnan(family.natural(mu)).all()
+
+
+def test_iterations_running_out_are_nan():
+    eta = bernoulli_family.natural([[1 - 1e-9]], max_iter=3)
+    assert np.isnan(eta).all()
+    assert np.isfinite(bernoulli_family.natural([[1 - 1e-9]])).all()
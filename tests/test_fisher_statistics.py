@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from mathvisualizations.divergences import normal_fisher_rao
+from mathvisualizations.fisher_statistics import (
+    fisher_distance_matrix,
+    fisher_exp,
+    fisher_log,
+    geodesic_kmeans,
+    karcher_mean,
+)
+
+
+def random_normals(num, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(-3, 3, num), rng.uniform(0.1, 3, num)])
+
+
+def fisher_length(base, vectors):
+    # Fisher norm of (dμ, dσ) at (μ, σ): sqrt((dμ² + 2 dσ²) / σ²)
+    return np.sqrt((vectors[..., 0]**2 + 2 * vectors[..., 1]**2) / base[..., 1]**2)
+
+
+def test_distance_matrix_matches_closed_form():
+    params, centers = random_normals(20), random_normals(4, seed=1)
+    expected = normal_fisher_rao(params[:, None], centers[None])
+    assert np.allclose(fisher_distance_matrix(params, centers), expected)
+
+
+def test_exp_inverts_log():
+    base, points = random_normals(50), random_normals(50, seed=1)
+    assert np.allclose(fisher_exp(base, fisher_log(base, points)), points)
+
+
+def test_log_has_the_length_of_the_distance():
+    base, points = random_normals(50), random_normals(50, seed=1)
+    lengths = fisher_length(base, fisher_log(base, points))
+    assert np.allclose(lengths, normal_fisher_rao(base, points))
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_karcher_mean_has_zero_mean_log_map(weighted):
+    params = random_normals(200)
+    weights = np.random.default_rng(2).random(200) if weighted else np.ones(200)
+    mean = karcher_mean(params, weights if weighted else None)
+    logs = fisher_log(np.broadcast_to(mean, params.shape), params)
+    assert np.allclose(np.sum(weights[:, None] * logs, axis=0) / weights.sum(), 0, atol=1e-9)
+
+
+def test_empty_clusters_have_nan_means():
+    params = random_normals(60)
+    labels = np.repeat([0, 2], 30)
+    means = karcher_mean(params, labels=labels, k=4)
+    assert np.all(np.isnan(means[[1, 3]]))
+    assert np.allclose(means[0], karcher_mean(params[:30]))
+    assert np.allclose(means[2], karcher_mean(params[30:]))
+
+
+def test_kmeans_recovers_separated_clusters():
+    rng = np.random.default_rng(3)
+    centers = np.array([(-3.0, 0.5), (0.0, 2.0), (3.0, 0.5), (0.0, 0.2)])
+    members = rng.integers(4, size=4000)
+    params = fisher_exp(centers[members], 0.05 * centers[members, 1:] * rng.standard_normal((4000, 2)))
+    found, labels, history, _ = geodesic_kmeans(params, 4)
+    distances = fisher_distance_matrix(centers, found)
+    # Every true center has its own found center nearby, and its members are one cluster
+    match = np.argmin(distances, axis=-1)
+    assert sorted(match) == [0, 1, 2, 3]
+    assert np.all(distances[np.arange(4), match] < 0.01)
+    assert np.array_equal(labels, match[members])
+    assert np.allclose(history[-1], found)
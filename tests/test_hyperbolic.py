@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from mathvisualizations.hyperbolic import apply_mobius, distance, tessellation, tile_generators
+
+
+def tile_centers(tiles):
+    return apply_mobius(tiles, 0)
+
+
+@pytest.mark.parametrize("p, q", [(7, 3), (4, 5), (5, 4)])
+def test_tessellation_has_no_duplicate_tiles(p, q):
+    tiles = tessellation(p, q, layers=4)
+    centers = tile_centers(tiles)
+    d = distance(centers[:, None], centers[None])
+    np.fill_diagonal(d, np.inf)
+    # Neighboring centers are the closest, two inradii apart
+    neighbor = distance(0, tile_centers(tile_generators(p, q))[0])
+    assert d.min() == pytest.approx(neighbor)
+
+
+@pytest.mark.parametrize("p, q", [(7, 3), (4, 5)])
+def test_tessellation_is_complete_inside_its_layers(p, q):
+    tiles = tessellation(p, q, layers=4)
+    inner = tessellation(p, q, layers=3)
+    centers = tile_centers(tiles)
+    # Every neighbor of a tile within three steps is among the tiles within four
+    neighbors = tile_centers(inner[:, None] @ tile_generators(p, q)).ravel()
+    assert np.min(np.abs(neighbors[:, None] - centers[None]), axis=1).max() < 1e-9
+
+
+def test_min_size_and_max_tiles_bound_the_tiling():
+    tiles = tessellation(7, 3, min_size=1e-2)
+    small = tessellation(7, 3, min_size=1e-2, max_tiles=100)
+    assert len(small) == 100
+    assert np.allclose(small, tiles[:100])
@@ -0,0 +1,43 @@
+"""The mathematical modules import without Manim, within a time budget.
+
+Batch jobs import them in short-lived workers, so the whole set, NumPy and
+SciPy included, must load in well under the seconds a Manim import takes.
+"""
+
+import pkgutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import mathvisualizations
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Wall-clock seconds for a fresh interpreter to import every math module
+BUDGET = 1.5
+# Modules that wrap Manim, imported only by scenes and render tools
+MANIM_MODULES = {"mobjects", "render"}
+
+
+def math_modules():
+    return sorted(
+        f"mathvisualizations.{module.name}" for module in pkgutil.iter_modules(mathvisualizations.__path__)
+        if module.name not in MANIM_MODULES
+    )
+
+
+def run_imports():
+    code = f"import sys, {', '.join(math_modules())}; assert 'manim' not in sys.modules, 'manim was imported'"
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def test_math_modules_are_found():
+    assert {"mathvisualizations.fisher", "mathvisualizations.surfaces"} <= set(math_modules())
+
+
+def test_import_budget():
+    # The fastest of three runs, so a cold disk cache on the first does not count
+    elapsed = min(run_imports() for _ in range(3))
+    assert elapsed < BUDGET, f"importing the math modules took {elapsed:.2f} s, over the {BUDGET} s budget"
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from mathvisualizations.mixtures import (
+    fit_mixtures,
+    mixture_log_pdf,
+    mixture_scores,
+    project_to_normal,
+    sample_mixtures,
+)
+
+WEIGHTS = np.array([0.2, 0.5, 0.3])
+MEANS = np.array([-2.0, 0.5, 3.0])
+SIGMAS = np.array([0.7, 1.2, 0.5])
+
+
+def split(theta, components):
+    # θ = (w_1, ..., w_{K-1}, μ, σ), with w_K taking up the difference
+    weights = np.append(theta[:components - 1], 1 - np.sum(theta[:components - 1]))
+    return weights, theta[components - 1:2 * components - 1], theta[2 * components - 1:]
+
+
+def test_scores_are_gradients_of_the_log_density():
+    x = np.random.default_rng(0).normal(0, 2.5, 50)
+    theta = np.concatenate([WEIGHTS[:-1], MEANS, SIGMAS])
+    h = 1e-6
+    numeric = np.array([
+        (mixture_log_pdf(x, *split(theta + h * e, 3)) - mixture_log_pdf(x, *split(theta - h * e, 3))) / (2 * h)
+        for e in np.eye(len(theta))
+    ])
+    assert np.allclose(mixture_scores(x, WEIGHTS, MEANS, SIGMAS), numeric, rtol=1e-6, atol=1e-7)
+
+
+def test_scores_vanish_at_nan_samples():
+    x = np.array([0.3, np.nan, -1.0])
+    scores = mixture_scores(x, WEIGHTS, MEANS, SIGMAS)
+    assert np.all(scores[:, 1] == 0) and np.all(scores[:, [0, 2]] != 0)
+
+
+def test_padded_datasets_fit_like_their_samples():
+    samples = sample_mixtures(WEIGHTS[:2] / WEIGHTS[:2].sum(), MEANS[:2], SIGMAS[:2], 400, seed=1)
+    data = np.full((2, 400), np.nan)
+    data[0] = samples
+    data[1, :250] = samples[:250]
+    params, log_likelihood, converged = fit_mixtures(data)
+    for row, count in enumerate([400, 250]):
+        alone, alone_likelihood, alone_converged = fit_mixtures(samples[None, :count])
+        for batched, single in zip(params, alone):
+            assert np.allclose(batched[row], single[0], rtol=1e-10, atol=1e-12)
+        assert log_likelihood[row] == pytest.approx(alone_likelihood[0], rel=1e-12)
+        assert converged[row] == alone_converged[0]
+
+
+def test_one_component_is_the_sample_mean_and_deviation():
+    data = np.random.default_rng(2).normal(1.5, 0.8, (3, 200))
+    (weights, means, sigmas), _, converged = fit_mixtures(data, components=1)
+    assert np.all(converged)
+    assert np.allclose(weights, 1)
+    assert np.allclose(means[:, 0], data.mean(axis=-1))
+    assert np.allclose(sigmas[:, 0], data.std(axis=-1))
+
+
+def test_projection_matches_the_moments():
+    x = np.linspace(-15, 15, 200001)
+    density = np.exp(mixture_log_pdf(x, WEIGHTS, MEANS, SIGMAS))
+    mean = np.trapezoid(x * density, x)
+    sigma = np.sqrt(np.trapezoid((x - mean)**2 * density, x))
+    assert np.allclose(project_to_normal(WEIGHTS, MEANS, SIGMAS), [mean, sigma], rtol=1e-8)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from mathvisualizations.sequences import wobbling_circle_sets
+from mathvisualizations.set_distances import (
+    PointSet,
+    chamfer_distance,
+    directed_hausdorff,
+    hausdorff_distance,
+    point_sets,
+    set_distances,
+)
+
+
+def brute_force(a, b):
+    d = cdist(a, b)
+    return max(d.min(axis=1).max(), d.min(axis=0).max()), d.min(axis=1).mean() + d.min(axis=0).mean()
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_random_sets_match_brute_force(dim):
+    rng = np.random.default_rng(dim)
+    for _ in range(20):
+        a = rng.random((rng.integers(1, 600), dim)) * rng.random()
+        b = rng.random((rng.integers(1, 600), dim)) + 0.3 * rng.random(dim)
+        hausdorff, chamfer = brute_force(a, b)
+        assert hausdorff_distance(a, b) == pytest.approx(hausdorff)
+        assert chamfer_distance(a, b) == pytest.approx(chamfer)
+        assert directed_hausdorff(a, b) == pytest.approx(cdist(a, b).min(axis=1).max())
+
+
+def test_dense_curves_match_brute_force():
+    # Close curves, where most points are candidates, and distant ones, where few are
+    curves = wobbling_circle_sets(np.array([0, 3, 30]), 4000)
+    limit = wobbling_circle_sets(np.zeros(1), 3000, amplitude=0)[0]
+    expected = np.array([brute_force(curve, limit) for curve in curves])
+    assert np.allclose(set_distances(curves, limit), expected[:, 0])
+    assert np.allclose(set_distances(curves, limit, "chamfer"), expected[:, 1])
+
+
+def test_consecutive_sets_and_reused_trees():
+    curves = wobbling_circle_sets(np.arange(5), 500)
+    sets = point_sets(curves)
+    consecutive = set_distances(sets)
+    assert consecutive.shape == (4,)
+    assert np.allclose(consecutive, [brute_force(a, b)[0] for a, b in zip(curves[:-1], curves[1:])])
+    assert point_sets(sets)[0] is sets[0]
+
+
+def test_stride_does_not_change_the_result():
+    rng = np.random.default_rng(0)
+    a, b = rng.random((2000, 2)), rng.random((1500, 2)) + 0.5
+    expected = hausdorff_distance(PointSet(a, stride=1), PointSet(b, stride=1))
+    for stride in (4, 16, 5000):
+        assert hausdorff_distance(PointSet(a, stride=stride), PointSet(b, stride=stride)) == pytest.approx(expected)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from mathvisualizations.spd import distance, exp_map, frechet_mean, geodesic, log_map, random_spd
+
+
+def pair(d=3, seed=0):
+    P, Q = random_spd(2, d, spread=0.7, seed=seed)
+    return P, Q
+
+
+def mean_log_map(mean, matrices, weights):
+    # Σ wᵢ log_M(Pᵢ) / Σ wᵢ, zero at the Fréchet mean
+    logs = log_map(mean[..., None, :, :], matrices)
+    return np.sum(weights[..., None, None] * logs, axis=-3) / np.sum(weights, axis=-1)[..., None, None]
+
+
+@pytest.mark.parametrize("d", [2, 3, 5])
+def test_exp_inverts_log(d):
+    P, Q = pair(d)
+    assert np.allclose(exp_map(P, log_map(P, Q)), Q)
+
+
+def test_geodesic_endpoints_and_midpoint():
+    P, Q = pair()
+    points = geodesic(P, Q, num=3)
+    assert points.shape == (3, 3, 3)
+    assert np.allclose(points[0], P) and np.allclose(points[-1], Q)
+    assert distance(P, points[1]) == pytest.approx(distance(P, Q) / 2)
+    assert distance(points[1], Q) == pytest.approx(distance(P, Q) / 2)
+
+
+def test_distance_is_affine_invariant():
+    P, Q = pair()
+    X = np.random.default_rng(1).standard_normal((3, 3))
+    assert distance(X @ P @ X.T, X @ Q @ X.T) == pytest.approx(distance(P, Q))
+
+
+def test_frechet_mean_has_zero_mean_log_map():
+    matrices = random_spd(8, 3, spread=0.6)
+    weights = np.ones(8)
+    assert np.allclose(mean_log_map(frechet_mean(matrices), matrices, weights), 0, atol=1e-9)
+
+
+def test_grouped_weighted_frechet_means():
+    matrices = random_spd(4 * 6, 2, spread=0.8, seed=3).reshape(4, 6, 2, 2)
+    weights = np.random.default_rng(4).random((4, 6))
+    means = frechet_mean(matrices, weights)
+    assert means.shape == (4, 2, 2)
+    assert np.allclose(mean_log_map(means, matrices, weights), 0, atol=1e-9)
+    for group in range(4):
+        assert np.allclose(means[group], frechet_mean(matrices[group], weights[group]))
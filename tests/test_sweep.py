@@ -0,0 +1,62 @@
+"""Parallel sweep variants render into their own partial movie directories.
+
+The renderer is a stub that writes one file per segment and the segment
+list that Manim's ``combine_to_movie`` reads, so no video is encoded.
+"""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("manim")
+
+from mathvisualizations.render import sweep  # noqa: E402
+
+
+class Scene:
+    shift = 0
+
+
+def stub_renderer(root):
+    def render(scene_class, quality, output_file, max_files_cached, partial_movie_dir=None):
+        directory = Path(partial_movie_dir or root / "partial_movie_files" / scene_class.__name__)
+        directory.mkdir(parents=True, exist_ok=True)
+        cached = {path.stem for path in directory.glob("*.mp4")}
+        # A title shared by every variant, then a segment of its own
+        hashes = ["title", f"shift_{scene_class.shift}"]
+        segments = []
+        for index, hash_ in enumerate(hashes):
+            status = "reused" if hash_ in cached else "rendered"
+            if status == "rendered":
+                time.sleep(0.05)
+                (directory / f"{hash_}.mp4").write_text(output_file)
+            segments.append({"index": index, "hash": hash_, "status": status})
+        (directory / "partial_movie_file_list.txt").write_text(
+            "".join(f"file '{directory / hash_}.mp4'\n" for hash_ in hashes)
+        )
+        file_writer = SimpleNamespace(movie_file_path=root / f"{output_file}.mp4", partial_movie_directory=directory)
+        return SimpleNamespace(renderer=SimpleNamespace(file_writer=file_writer)), segments
+
+    return render
+
+
+def test_parallel_variants_have_their_own_segment_lists(tmp_path, monkeypatch):
+    # Pool workers are forked, so they see the stubs too
+    monkeypatch.setattr(sweep, "load_scene", lambda file_name, scene_name: Scene)
+    monkeypatch.setattr(sweep, "render_incremental", stub_renderer(tmp_path))
+    manifest = sweep.render_sweep("scene.py", "Scene", {"shift": [0, 1, 2]}, workers=2, output_dir=tmp_path / "sweeps")
+
+    records = manifest["variants"]
+    assert not any("error" in record for record in records)
+    directories = [Path(record["partial_movie_dir"]) for record in records]
+    assert len(set(directories)) == 3
+    for record, directory in zip(records, directories):
+        listed = (directory / "partial_movie_file_list.txt").read_text().splitlines()
+        shift = record["params"]["shift"]
+        assert listed == [f"file '{directory / 'title'}.mp4'", f"file '{directory / f'shift_{shift}'}.mp4'"]
+    # The title was rendered once and linked into the other variants' directories
+    assert [record["reused"] for record in records] == [0, 1, 1]
+    cache = directories[0]
+    assert {path.stem for path in cache.glob("*.mp4")} == {"title", "shift_0", "shift_1", "shift_2"}
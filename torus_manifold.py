@@ -1,23 +1,23 @@
 from manim import *
 import numpy as np
 
+from mathvisualizations.surfaces import torus_surface
+
 class TorusManifold(ThreeDScene):
+    # Major and minor radius of the torus
+    R = 2
+    r = 0.8
+
     def construct(self):
         # Set up 3D camera
         self.set_camera_orientation(phi=75 * DEGREES, theta=45 * DEGREES)
         
-        # Create a torus manifold
-        def torus_surface(u, v):
-            R = 2  # Major radius
-            r = 0.8  # Minor radius
-            x = (R + r * np.cos(v)) * np.cos(u)
-            y = (R + r * np.cos(v)) * np.sin(u)
-            z = r * np.sin(v)
-            return np.array([x, y, z])
+        def torus_point(u, v):
+            return torus_surface(u, v, self.R, self.r)
         
         # Create the torus surface
         torus = Surface(
-            lambda u, v: torus_surface(u, v),
+            lambda u, v: torus_point(u, v),
             u_range=[0, 2*np.pi],
             v_range=[0, 2*np.pi],
             resolution=(30, 30)
@@ -35,7 +35,7 @@ class TorusManifold(ThreeDScene):
         # Longitudinal lines (around the major circle)
         for u_val in np.linspace(0, 2*np.pi, 8, endpoint=False):
             line = ParametricFunction(
-                lambda t: torus_surface(u_val, t),
+                lambda t: torus_point(u_val, t),
                 t_range=[0, 2*np.pi],
                 color=RED,
                 stroke_width=2
@@ -45,7 +45,7 @@ class TorusManifold(ThreeDScene):
         # Latitudinal lines (around the minor circle)
         for v_val in np.linspace(0, 2*np.pi, 8, endpoint=False):
             line = ParametricFunction(
-                lambda t: torus_surface(t, v_val),
+                lambda t: torus_point(t, v_val),
                 t_range=[0, 2*np.pi],
                 color=GREEN,
                 stroke_width=2
@@ -57,7 +57,7 @@ class TorusManifold(ThreeDScene):
             # A geodesic that wraps around the torus
             u = 2 * t
             v = 3 * t
-            return torus_surface(u, v)
+            return torus_point(u, v)
         
         geodesic = ParametricFunction(
             lambda t: geodesic_curve(t),
@@ -70,7 +70,7 @@ class TorusManifold(ThreeDScene):
         def meridian_geodesic(t):
             u = t
             v = 0
-            return torus_surface(u, v)
+            return torus_point(u, v)
         
         meridian = ParametricFunction(
             lambda t: meridian_geodesic(t),
@@ -84,7 +84,7 @@ class TorusManifold(ThreeDScene):
             # A curve for parallel transport
             u = t
             v = np.pi/2 + 0.3 * np.sin(2*t)
-            return torus_surface(u, v)
+            return torus_point(u, v)
         
         parallel_curve = ParametricFunction(
             lambda t: parallel_transport_curve(t),